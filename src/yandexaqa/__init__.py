@@ -0,0 +1,24 @@
+from yandexaqa.client import ENDPOINTS, DiskClient
+from yandexaqa.models import Link, Operation, Resource, ResourceList
+from yandexaqa.operations import (
+    OperationError,
+    OperationTimeoutError,
+    wait_for_operation,
+    wait_until,
+)
+from yandexaqa.session import DEFAULT_BASE_URL, DiskSession
+
+__all__ = [
+    "DEFAULT_BASE_URL",
+    "ENDPOINTS",
+    "DiskClient",
+    "DiskSession",
+    "Link",
+    "Operation",
+    "OperationError",
+    "OperationTimeoutError",
+    "Resource",
+    "ResourceList",
+    "wait_for_operation",
+    "wait_until",
+]
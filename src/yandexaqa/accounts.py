@@ -0,0 +1,76 @@
+"""Пул аккаунтов (OAuth-токенов) для распределения тестов.
+
+Лимиты API и общее состояние аккаунта (корзина) ограничивают
+пропускную способность одного токена. При нескольких токенах
+(``YANDEX_DISK_OAUTH_TOKENS=token1,token2,...``) воркеры pytest-xdist
+распределяются по аккаунтам по кругу, а последний токен отдаётся
+тестам, меняющим состояние всего аккаунта (очистка корзины), чтобы
+они не мешали остальным.
+"""
+
+import os
+import re
+
+TOKENS_ENV = "YANDEX_DISK_OAUTH_TOKENS"
+TOKEN_ENV = "YANDEX_DISK_OAUTH_TOKEN"
+
+
+def parse_tokens(value):
+    """Токены из строки через запятую или пробелы, без повторов и пустых."""
+    tokens = []
+    for token in re.split(r"[\s,]+", value or ""):
+        if token and token not in tokens:
+            tokens.append(token)
+    return tokens
+
+
+def tokens_from_env(environ=os.environ):
+    """Токены из YANDEX_DISK_OAUTH_TOKENS или единственный YANDEX_DISK_OAUTH_TOKEN."""
+    return parse_tokens(environ.get(TOKENS_ENV)) or parse_tokens(environ.get(TOKEN_ENV))
+
+
+def worker_slot(config):
+    """Номер воркера xdist и число воркеров; без xdist — (0, 1)."""
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None:
+        return 0, 1
+    index = int(workerinput["workerid"].lstrip("gw") or 0)
+    return index, int(workerinput.get("workercount", index + 1))
+
+
+class AccountPool:
+    """
+    Распределение токенов между воркерами.
+
+    Пример:
+        pool = AccountPool(["a", "b", "c"])
+        pool.for_worker(0)  # "a"
+        pool.for_worker(1)  # "b"
+        pool.for_worker(2)  # "a"
+        pool.exclusive      # "c"
+    """
+
+    __slots__ = ("shared", "exclusive")
+
+    def __init__(self, tokens):
+        tokens = list(tokens)
+        if len(tokens) > 1:
+            self.shared, self.exclusive = tokens[:-1], tokens[-1]
+        else:
+            self.shared = tokens
+            self.exclusive = tokens[0] if tokens else None
+
+    def __len__(self):
+        return len(set(self.shared) | {self.exclusive} - {None})
+
+    def for_worker(self, index):
+        """Токен воркера с номером index (None, если токенов нет)."""
+        if not self.shared:
+            return None
+        return self.shared[index % len(self.shared)]
+
+    def workers_per_token(self, worker_count):
+        """Сколько воркеров делят один аккаунт (для деления лимита частоты)."""
+        if not self.shared:
+            return worker_count
+        return -(-worker_count // len(self.shared))
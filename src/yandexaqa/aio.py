@@ -0,0 +1,335 @@
+"""Асинхронный клиент REST API Яндекс.Диска.
+
+AsyncDiskClient повторяет методы DiskClient, но они — корутины, поэтому
+независимые запросы выполняются одновременно::
+
+    async with AsyncDiskClient(token) as client:
+        published, *metas = await asyncio.gather(
+            client.publish(path),
+            *(client.get_meta(p) for p in paths),
+        )
+
+Все запросы идут через один пул keep-alive соединений httpx (HTTP/2,
+если установлен пакет h2). Как и DiskSession, клиент ограничивает
+частоту запросов с токеном и повторяет ответы 429/423/503 (см.
+yandexaqa.ratelimit). Методы возвращают ``httpx.Response`` без проверки
+статуса; у него те же ``status_code``, ``json()``, ``text`` и
+``headers``, что у ``requests.Response``.
+
+httpx — необязательная зависимость: ``pip install yandexaqa[async]``.
+"""
+
+import asyncio
+import time
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - зависит от окружения
+    httpx = None
+
+try:
+    import h2  # noqa: F401
+except ImportError:
+    HTTP2_AVAILABLE = False
+else:
+    HTTP2_AVAILABLE = True
+
+from yandexaqa.client import ENDPOINTS, _params
+from yandexaqa.jsoncodec import get_loads, install
+from yandexaqa.models import Link
+from yandexaqa.operations import (
+    BACKOFF_FACTOR,
+    DEFAULT_TIMEOUT,
+    FAILED,
+    INITIAL_DELAY,
+    MAX_DELAY,
+    SUCCESS,
+    WAIT_OBSERVERS,
+    OperationError,
+    OperationTimeoutError,
+    _backoff,
+    operation_href,
+)
+from yandexaqa.ratelimit import MAX_RETRIES, RateLimiter
+from yandexaqa.session import DEFAULT_BASE_URL, POOL_MAXSIZE
+from yandexaqa.streams import CHUNK_SIZE, as_body
+
+REQUEST_TIMEOUT = 30.0
+
+
+async def _sleep(delay):
+    await asyncio.sleep(delay)
+    for observer in WAIT_OBSERVERS:
+        observer(delay)
+
+
+async def _aiter(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def _content(data, chunk_size):
+    """
+    Тело запроса для httpx: bytes и str как есть, файлы и буферы —
+    асинхронным итератором фрагментов по chunk_size байт.
+    """
+    if hasattr(data, "__aiter__"):
+        return data
+    body = as_body(data, chunk_size)
+    if body is None or isinstance(body, (bytes, str)):
+        return body
+    return _aiter(body)
+
+
+async def wait_until(
+    condition,
+    timeout=DEFAULT_TIMEOUT,
+    initial_delay=INITIAL_DELAY,
+    max_delay=MAX_DELAY,
+    factor=BACKOFF_FACTOR,
+    message="Условие не выполнилось",
+):
+    """
+    Асинхронный вариант operations.wait_until: ``await condition()``
+    до истинного результата с экспоненциальной задержкой между проверками.
+    """
+    deadline = time.monotonic() + timeout
+    delays = _backoff(initial_delay, max_delay, factor)
+
+    while True:
+        result = await condition()
+        if result:
+            return result
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise OperationTimeoutError(f"{message} за {timeout} с")
+        await _sleep(min(next(delays), remaining))
+
+
+class AsyncDiskClient:
+    """
+    Асинхронный клиент API Диска поверх одного пула соединений httpx.
+
+    Аргументы:
+        token (str): OAuth-токен; без него — анонимный клиент.
+        base_url (str): Базовый URL API.
+        max_connections (int): Размер пула соединений.
+        http2 (bool): Использовать HTTP/2; по умолчанию — если установлен h2.
+        rate_limit (float): Запросов в секунду с токеном; None — без ограничения.
+        retries (int): Максимум повторов ответов 429/423/503.
+        json_backend (str): Декодер json() ответов (см. yandexaqa.jsoncodec).
+    """
+
+    def __init__(
+        self,
+        token=None,
+        base_url=DEFAULT_BASE_URL,
+        max_connections=POOL_MAXSIZE,
+        http2=None,
+        rate_limit=None,
+        retries=MAX_RETRIES,
+        json_backend=None,
+    ):
+        if httpx is None:
+            raise ImportError(
+                "Для AsyncDiskClient нужен httpx: pip install 'yandexaqa[async]'"
+            )
+        self.base_url = base_url.rstrip("/")
+        self.urls = {
+            name: f"{self.base_url}{template}" for name, template in ENDPOINTS.items()
+        }
+        self.limiter = RateLimiter(token, rate=rate_limit, retries=retries)
+        loads = get_loads(json_backend)
+
+        async def decode(response):
+            install(response, loads)
+
+        headers = {"Content-Type": "application/json"}
+        if token:
+            headers["Authorization"] = f"OAuth {token}"
+        # Один пул на API и хосты загрузки; заголовок авторизации
+        # передается только в запросы к API
+        self.http = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            http2=HTTP2_AVAILABLE if http2 is None else http2,
+            timeout=REQUEST_TIMEOUT,
+            event_hooks={"response": [decode]},
+        )
+        self.headers = headers
+
+    async def close(self):
+        await self.http.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def send(self, method, url, **kwargs):
+        """
+        Выполняет запрос с ограничением частоты и повтором ответов
+        429/423/503 (пауза из Retry-After или экспоненциальная).
+        """
+        deadline = time.monotonic() + self.limiter.timeout
+        delays = _backoff(INITIAL_DELAY, MAX_DELAY, BACKOFF_FACTOR)
+        attempt = 0
+
+        while True:
+            delay = self.limiter.bucket.reserve()
+            if delay > 0:
+                await _sleep(delay)
+            response = await self.http.request(method, url, **kwargs)
+            delay = self.limiter.retry_delay(response, attempt, deadline, delays)
+            if delay is None:
+                return response
+            attempt += 1
+            await _sleep(delay)
+
+    async def request(self, method, endpoint, params=None, **kwargs):
+        """Выполняет запрос к эндпоинту из ENDPOINTS по его имени."""
+        return await self.send(
+            method,
+            self.urls[endpoint],
+            params=_params(params or {}),
+            headers=self.headers,
+            **kwargs,
+        )
+
+    # Ресурсы
+
+    async def get_meta(self, path, **params):
+        """GET /resources — метаинформация о файле или папке."""
+        return await self.request("GET", "resources", {"path": path, **params})
+
+    async def create_folder(self, path, **params):
+        """PUT /resources — создание папки."""
+        return await self.request("PUT", "resources", {"path": path, **params})
+
+    async def remove(self, path, **params):
+        """DELETE /resources — удаление файла или папки."""
+        return await self.request("DELETE", "resources", {"path": path, **params})
+
+    async def copy(self, from_path, path, **params):
+        """POST /resources/copy — копирование ресурса."""
+        return await self.request(
+            "POST", "copy", {"from": from_path, "path": path, **params}
+        )
+
+    async def move(self, from_path, path, **params):
+        """POST /resources/move — перемещение ресурса."""
+        return await self.request(
+            "POST", "move", {"from": from_path, "path": path, **params}
+        )
+
+    # Загрузка и скачивание
+
+    async def get_upload_link(self, path, **params):
+        """GET /resources/upload — ссылка для загрузки файла."""
+        return await self.request("GET", "upload", {"path": path, **params})
+
+    async def upload(self, path, data=None, overwrite=True, chunk_size=CHUNK_SIZE):
+        """
+        Загружает данные на Диск: получает ссылку и выполняет PUT.
+
+        data — bytes, str, файловый объект, буфер, итерируемое или
+        асинхронное итерируемое фрагментов (см. DiskClient.upload).
+        Файлы читаются в цикле событий, поэтому большие файлы лучше
+        передавать асинхронным итератором. PUT идет на хост загрузки мимо
+        ограничителя частоты API и без повторов: тело-итератор после
+        первой попытки уже прочитано.
+        """
+        response = await self.get_upload_link(path, overwrite=overwrite)
+        if response.status_code != 200:
+            return response
+        link = Link.from_response(response)
+        return await self.http.request(
+            "PUT", link.href, content=_content(data, chunk_size)
+        )
+
+    async def get_download_link(self, path, **params):
+        """GET /resources/download — ссылка для скачивания."""
+        return await self.request("GET", "download", {"path": path, **params})
+
+    async def download(self, path):
+        """
+        Скачивает файл целиком (GET на хост скачивания мимо ограничителя
+        частоты API); возвращает ответ со ссылкой при ошибке.
+        """
+        response = await self.get_download_link(path)
+        if response.status_code != 200:
+            return response
+        link = Link.from_response(response)
+        return await self.http.request("GET", link.href, follow_redirects=True)
+
+    # Публикация
+
+    async def publish(self, path, public_settings=None, **params):
+        """PUT /resources/publish — публикация ресурса."""
+        body = {"public_settings": public_settings or {}}
+        return await self.request("PUT", "publish", {"path": path, **params}, json=body)
+
+    async def unpublish(self, path, **params):
+        """PUT /resources/unpublish — отмена публикации ресурса."""
+        return await self.request("PUT", "unpublish", {"path": path, **params})
+
+    async def get_public_meta(self, public_key, **params):
+        """GET /public/resources — метаинформация о публичном ресурсе."""
+        return await self.request("GET", "public", {"public_key": public_key, **params})
+
+    async def get_public_download_link(self, public_key, **params):
+        """GET /public/resources/download — ссылка на скачивание публичного ресурса."""
+        return await self.request(
+            "GET", "public_download", {"public_key": public_key, **params}
+        )
+
+    # Корзина
+
+    async def get_trash(self, path="/", **params):
+        """GET /trash/resources — содержимое корзины."""
+        return await self.request("GET", "trash", {"path": path, **params})
+
+    async def clear_trash(self, path=None, **params):
+        """DELETE /trash/resources — очистка корзины или удаление ресурса из неё."""
+        return await self.request("DELETE", "trash", {"path": path, **params})
+
+    async def restore(self, path, **params):
+        """PUT /trash/resources/restore — восстановление ресурса из корзины."""
+        return await self.request("PUT", "restore", {"path": path, **params})
+
+    # Операции
+
+    async def get_operation(self, operation):
+        """GET /operations/{id} — статус операции по id или ссылке из ответа 202."""
+        if "/operations/" in operation:
+            url = operation
+        else:
+            url = self.urls["operation"].format(operation_id=operation)
+        return await self.send("GET", url, headers=self.headers)
+
+    async def wait_for_operation(self, link, timeout=DEFAULT_TIMEOUT):
+        """
+        Дожидается завершения операции из ответа 202, не блокируя цикл
+        событий. Возвращает ``success``; при ``failed`` выбрасывает
+        OperationError.
+        """
+        href = operation_href(link)
+        if href is None:
+            return SUCCESS
+
+        async def finished():
+            response = await self.get_operation(href)
+            response.raise_for_status()
+            status = response.json()["status"]
+            return status if status in (SUCCESS, FAILED) else None
+
+        status = await wait_until(
+            finished, timeout=timeout, message=f"Операция {href} не завершилась"
+        )
+        if status == FAILED:
+            raise OperationError(f"Операция {href} завершилась с ошибкой")
+        return status
@@ -0,0 +1,130 @@
+"""Нагрузочные замеры эндпоинтов API.
+
+run_benchmark выполняет операцию заданное число раз с заданной
+конкурентностью (после прогрева) и возвращает задержки каждого вызова,
+число ошибок и общее время. Результаты сравниваются с сохранённым
+базовым уровнем (baseline): рост p95 или падение пропускной способности
+больше допуска считается регрессией.
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from yandexaqa.metrics import summarize
+
+DEFAULT_TOLERANCE = 0.2
+
+
+class BenchmarkResult:
+    """Результат одного замера."""
+
+    __slots__ = ("name", "concurrency", "latencies", "errors", "elapsed")
+
+    def __init__(self, name, concurrency, latencies, errors, elapsed):
+        self.name = name
+        self.concurrency = concurrency
+        self.latencies = latencies
+        self.errors = errors
+        self.elapsed = elapsed
+
+    @property
+    def key(self):
+        return baseline_key(self.name, self.concurrency)
+
+    @property
+    def throughput(self):
+        """Успешных вызовов в секунду."""
+        return len(self.latencies) / self.elapsed if self.elapsed else 0.0
+
+    def summary(self):
+        return {
+            **summarize(self.latencies),
+            "errors": self.errors,
+            "throughput": self.throughput,
+        }
+
+
+def baseline_key(name, concurrency):
+    return f"{name}@{concurrency}"
+
+
+def _is_ok(result):
+    status = getattr(result, "status_code", None)
+    return result is not False and (status is None or status < 400)
+
+
+def run_benchmark(name, operation, iterations, concurrency=1, warmup=0):
+    """
+    Замеряет operation(i) для i в range(iterations).
+
+    Аргументы:
+        name (str): Имя замера (ключ в baseline).
+        operation: Функция от номера итерации; ответ со статусом >= 400,
+            False или исключение считаются ошибкой.
+        iterations (int): Число замеряемых вызовов.
+        concurrency (int): Число одновременных вызовов.
+        warmup (int): Число вызовов до начала замера (не учитываются).
+    """
+
+    def timed(i):
+        start = time.perf_counter()
+        try:
+            ok = _is_ok(operation(i))
+        except Exception:
+            ok = False
+        return time.perf_counter() - start, ok
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(timed, range(iterations, iterations + warmup)))
+
+        start = time.perf_counter()
+        results = list(executor.map(timed, range(iterations)))
+        elapsed = time.perf_counter() - start
+
+    latencies = [latency for latency, ok in results if ok]
+    return BenchmarkResult(
+        name, concurrency, latencies, len(results) - len(latencies), elapsed
+    )
+
+
+def load_baseline(path):
+    """Загружает baseline; если файла нет, возвращает пустой словарь."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_baseline(path, results):
+    """Дописывает p50/p95/p99 и пропускную способность замеров в baseline."""
+    baseline = load_baseline(path)
+    for result in results:
+        summary = result.summary()
+        baseline[result.key] = {
+            key: summary[key] for key in ("p50", "p95", "p99", "throughput")
+        }
+    Path(path).write_text(
+        json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+
+
+def regressions(result, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Список описаний регрессий замера относительно baseline."""
+    expected = baseline.get(result.key)
+    if not expected or not result.latencies:
+        return []
+    summary = result.summary()
+    problems = []
+    if summary["p95"] > expected["p95"] * (1 + tolerance):
+        problems.append(
+            f"{result.key}: p95 {summary['p95'] * 1000:.1f} мс, "
+            f"baseline {expected['p95'] * 1000:.1f} мс"
+        )
+    if summary["throughput"] < expected["throughput"] * (1 - tolerance):
+        problems.append(
+            f"{result.key}: {summary['throughput']:.1f} запросов/с, "
+            f"baseline {expected['throughput']:.1f} запросов/с"
+        )
+    return problems
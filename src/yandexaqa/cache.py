@@ -0,0 +1,111 @@
+"""Кэш ответов GET /resources на стороне клиента.
+
+Тесты многократно запрашивают метаинформацию одного и того же ресурса
+(например, ``fields=public_url``, чтобы получить публичный ключ).
+MetaCache хранит успешные ответы по ключу «путь + параметры запроса»
+(поля, лимит, сортировка...) не дольше ttl секунд, вытесняя самые
+давние записи сверх maxsize.
+
+Ожидание изменений, которые сервер применяет не сразу (публикация,
+асинхронные операции), должно опрашивать сервер мимо кэша:
+``client.get_meta(path, cache=False)``. Свежий ответ, отличающийся от
+сохранённого, сбрасывает записи пути и заменяет собой устаревшую.
+
+Изменяющие запросы клиента (загрузка, копирование, перемещение,
+удаление, публикация) сбрасывают записи затронутого пути, его
+родительских папок (их размер и список содержимого меняются) и
+вложенных ресурсов (при перемещении и удалении папки).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_MAXSIZE = 512
+DEFAULT_TTL = 30.0
+
+
+def normalize_path(path):
+    """Приводит путь к виду ``/a/b`` (без ``disk:`` и завершающего слеша)."""
+    if path.startswith("disk:"):
+        path = path[len("disk:") :]
+    if not path.startswith("/"):
+        path = "/" + path
+    return path.rstrip("/") or "/"
+
+
+def related(cached, changed):
+    """Запись пути cached устаревает при изменении changed."""
+    if cached == changed or cached == "/" or changed == "/":
+        return True
+    return changed.startswith(cached + "/") or cached.startswith(changed + "/")
+
+
+class MetaCache:
+    """
+    LRU-кэш ответов с ограничением времени жизни.
+
+    Аргументы:
+        maxsize (int): Максимальное число записей.
+        ttl (float): Время жизни записи в секундах.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, ttl=DEFAULT_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(path, params):
+        return normalize_path(path), tuple(sorted(params.items()))
+
+    def get(self, path, params):
+        """Сохранённый ответ или None, если записи нет или она устарела."""
+        key = self.key(path, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def peek(self, path, params):
+        """Сохранённый ответ без учёта в hits/misses и без продления LRU."""
+        with self._lock:
+            entry = self._entries.get(self.key(path, params))
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            return entry[1]
+
+    def put(self, path, params, response):
+        with self._lock:
+            key = self.key(path, params)
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *paths):
+        """Удаляет записи путей paths, их родительских папок и вложенных ресурсов."""
+        changed = [normalize_path(path) for path in paths if path]
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if any(related(key[0], path) for path in changed)
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
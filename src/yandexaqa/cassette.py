@@ -0,0 +1,300 @@
+"""Запись и воспроизведение HTTP-взаимодействий (кассеты).
+
+В режиме ``record`` запросы уходят в сеть, а ответы сохраняются в
+кассету; в режиме ``replay`` ответы отдаются из кассеты без сети.
+Перехват выполняется транспортным адаптером requests, поэтому клиент
+и тесты не меняются.
+
+Каждая кассета — сжатый gzip JSON-файл (обычно один на тест) со
+словарём ``ключ запроса -> список ответов``. Ключ — хеш метода, URL без
+хоста, признака авторизации и тела запроса после нормализации:
+случайные идентификаторы (uuid-суффиксы путей, id операций, токены
+ссылок загрузки) заменяются заглушками. Повторные запросы с одним ключом
+(например, опрос статуса операции) получают ответы в порядке записи;
+когда записи кончаются, повторяется последний ответ.
+
+При воспроизведении идентификаторы из записанных ответов заменяются
+идентификаторами текущего прогона: соответствие выводится из URL
+запросов, совпавших по ключу. Кассеты читаются с диска при первом
+запросе к ним.
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+import re
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from yandexaqa.session import PooledAdapter
+
+MODES = ("none", "record", "replay")
+SESSION_CASSETTE = "_session"
+CASSETTE_SUFFIX = ".json.gz"
+FORMAT_VERSION = 1
+
+# Заголовки ответа, которые сохраняются в кассете
+KEPT_HEADERS = ("Content-Type", "Location", "Retry-After")
+
+# id операций, шестнадцатеричные идентификаторы от 8 символов и
+# uuid-суффиксы имён тестовых ресурсов (``test_folder_1a2b``), а также
+# id воркера в имени папки воркера (``aqa_1a2b3c4d_gw0``)
+IDENTIFIER_RE = re.compile(
+    r"(?<=/operations/)[^/?&]+"
+    r"|(?<![0-9A-Za-z])[0-9a-f]{8,}(?![0-9A-Za-z])"
+    r"|(?<=_)[0-9a-f]{4,}(?![0-9A-Za-z])"
+    r"|(?<=_)(?:main|gw\d+)(?![0-9A-Za-z])"
+)
+
+
+class CassetteError(requests.ConnectionError):
+    """В кассете нет записи для запроса."""
+
+
+def normalize(text):
+    """Заменяет случайные идентификаторы в строке заглушками."""
+    return IDENTIFIER_RE.sub("<id>", text)
+
+
+def _url_part(url):
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return unquote(f"{parts.path}?{query}" if query else parts.path)
+
+
+def _body_part(body):
+    if isinstance(body, str):
+        body = body.encode()
+    if not isinstance(body, bytes):
+        # Потоковые тела (генераторы, файлы) не читаются ради ключа
+        return ""
+    return hashlib.sha1(normalize(body.decode("utf-8", "replace")).encode()).hexdigest()
+
+
+def request_key(request):
+    """Ключ запроса: хеш метода, нормализованного URL, авторизации и тела."""
+    auth = "auth" if request.headers.get("Authorization") else "anon"
+    raw = "\n".join(
+        [
+            request.method,
+            normalize(_url_part(request.url)),
+            auth,
+            _body_part(request.body),
+        ]
+    )
+    return hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+
+class Cassette:
+    """Записи одной кассеты; файл читается при первом обращении."""
+
+    def __init__(self, path):
+        self.path = path
+        self.dirty = False
+        self._interactions = None
+        self._positions = {}
+
+    @property
+    def interactions(self):
+        if self._interactions is None:
+            self._interactions = {}
+            if self.path.exists():
+                with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                    self._interactions = json.load(f)["interactions"]
+        return self._interactions
+
+    def record(self, key, entry):
+        self.interactions.setdefault(key, []).append(entry)
+        self.dirty = True
+
+    def play(self, key):
+        entries = self.interactions.get(key)
+        if not entries:
+            return None
+        position = self._positions.get(key, 0)
+        self._positions[key] = position + 1
+        return entries[min(position, len(entries) - 1)]
+
+    def reset(self):
+        """Начинает кассету заново (режим record перезаписывает файл)."""
+        self._interactions = {}
+        self._positions = {}
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.dirty = False
+        if not self.interactions:
+            # Тест без запросов к API: кассета не нужна
+            self.path.unlink(missing_ok=True)
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": FORMAT_VERSION, "interactions": self.interactions}
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+
+MAX_NAME_LENGTH = 80
+
+
+def _safe_name(part):
+    name = re.sub(r"[^\w\[\].=-]+", "_", part, flags=re.ASCII)
+    if len(name) > MAX_NAME_LENGTH:
+        digest = hashlib.sha1(part.encode()).hexdigest()[:8]
+        name = f"{name[:MAX_NAME_LENGTH - 9]}_{digest}"
+    return name
+
+
+def cassette_name(nodeid):
+    """Имя кассеты для теста: ``tests/a/test_b.py::C::t[x]`` -> ``a/test_b/C/t[x]``."""
+    # pytest-xdist дописывает к id теста группу: ``...::test@serial``
+    nodeid = re.sub(r"@[\w-]+$", "", nodeid)
+    module, _, rest = nodeid.partition("::")
+    parts = module.removesuffix(".py").split("/")[1:] + rest.split("::")
+    return "/".join(_safe_name(part) for part in parts if part)
+
+
+class Recorder:
+    """
+    Общее состояние записи/воспроизведения для всех адаптеров прогона.
+
+    Пример:
+        recorder = Recorder("replay", "tests/cassettes")
+        install(client, recorder)
+        with recorder.use("test_resources/test_copy/test_copy_file"):
+            client.get_meta("/file.txt")
+    """
+
+    def __init__(self, mode, directory):
+        if mode not in MODES:
+            raise ValueError(f"Неизвестный режим кассет: {mode}")
+        self.mode = mode
+        self.directory = Path(directory)
+        self.aliases = {}
+        self._cassettes = {}
+        self._lock = threading.Lock()
+        self.current = self.cassette(SESSION_CASSETTE)
+
+    def cassette(self, name):
+        cassette = self._cassettes.get(name)
+        if cassette is None:
+            cassette = Cassette(self.directory / f"{name}{CASSETTE_SUFFIX}")
+            if self.mode == "record":
+                cassette.reset()
+            self._cassettes[name] = cassette
+        return cassette
+
+    @contextmanager
+    def use(self, name):
+        """Делает кассету name текущей на время блока и сохраняет ее после."""
+        with self._lock:
+            previous, self.current = self.current, self.cassette(name)
+        try:
+            yield self.current
+        finally:
+            with self._lock:
+                cassette, self.current = self.current, previous
+            if self.mode == "record":
+                cassette.save()
+
+    def save(self):
+        if self.mode == "record":
+            for cassette in self._cassettes.values():
+                cassette.save()
+
+    def record(self, request, response):
+        body = response.content
+        try:
+            encoded, encoding = body.decode("utf-8"), "text"
+        except UnicodeDecodeError:
+            encoded, encoding = base64.b64encode(body).decode(), "base64"
+        entry = {
+            "request": _url_part(request.url),
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                name: response.headers[name]
+                for name in KEPT_HEADERS
+                if name in response.headers
+            },
+            "body": encoded,
+            "encoding": encoding,
+        }
+        with self._lock:
+            self.current.record(request_key(request), entry)
+
+    def play(self, request):
+        key = request_key(request)
+        with self._lock:
+            entry = self.current.play(key)
+            if entry is None:
+                entry = self.cassette(SESSION_CASSETTE).play(key)
+            if entry is None:
+                raise CassetteError(
+                    f"Нет записи в кассете {self.current.path} для "
+                    f"{request.method} {_url_part(request.url)}"
+                )
+            recorded = IDENTIFIER_RE.findall(entry["request"])
+            current = IDENTIFIER_RE.findall(_url_part(request.url))
+            self.aliases.update(zip(recorded, current))
+            aliases = dict(self.aliases)
+        return self._build(request, entry, aliases)
+
+    def _build(self, request, entry, aliases):
+        if entry["encoding"] == "base64":
+            content = base64.b64decode(entry["body"])
+        else:
+            text = IDENTIFIER_RE.sub(
+                lambda match: aliases.get(match.group(0), match.group(0)),
+                entry["body"],
+            )
+            content = text.encode("utf-8")
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = entry["reason"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = content
+        response._content_consumed = True
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+
+class CassetteAdapter(PooledAdapter):
+    """Транспортный адаптер, который записывает или воспроизводит ответы."""
+
+    def __init__(self, recorder, **kwargs):
+        super().__init__(**kwargs)
+        self.recorder = recorder
+
+    def send(self, request, **kwargs):
+        if self.recorder.mode == "replay":
+            return self.recorder.play(request)
+        response = super().send(request, **kwargs)
+        if self.recorder.mode == "record":
+            self.recorder.record(request, response)
+        return response
+
+
+def install(client, recorder):
+    """Подключает адаптер кассет ко всем сессиям клиента."""
+    for session in (client.session, client.transfer_session):
+        # Размеры пула — как у адаптера, который заменяется
+        current = session.get_adapter("https://")
+        adapter = CassetteAdapter(
+            recorder,
+            pool_connections=current._pool_connections,
+            pool_maxsize=current._pool_maxsize,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+    return client
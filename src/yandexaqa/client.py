@@ -0,0 +1,315 @@
+"""Клиент REST API Яндекс.Диска.
+
+Методы клиента возвращают ``requests.Response`` без проверки статуса:
+тесты проверяют в том числе коды ошибок. Для разбора успешных ответов
+предназначены модели из ``yandexaqa.models``.
+"""
+
+import requests
+
+from yandexaqa.cache import normalize_path, related
+from yandexaqa.jsoncodec import copy_response
+from yandexaqa.models import Link, Resource
+from yandexaqa.operations import DEFAULT_TIMEOUT, operation_href, wait_for_operation
+from yandexaqa.session import (
+    DEFAULT_BASE_URL,
+    TRANSFER_POOL_HOSTS,
+    TRANSFER_POOL_MAXSIZE,
+    DiskSession,
+    mount_pool,
+)
+from yandexaqa.streams import CHUNK_SIZE, as_body
+
+ENDPOINTS = {
+    "resources": "/resources",
+    "upload": "/resources/upload",
+    "download": "/resources/download",
+    "copy": "/resources/copy",
+    "move": "/resources/move",
+    "publish": "/resources/publish",
+    "unpublish": "/resources/unpublish",
+    "trash": "/trash/resources",
+    "restore": "/trash/resources/restore",
+    "public": "/public/resources",
+    "public_download": "/public/resources/download",
+    "operation": "/operations/{operation_id}",
+}
+
+
+def _params(params):
+    """Отбрасывает None и приводит bool к строкам, которые ожидает API."""
+    result = {}
+    for key, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+        result[key] = value
+    return result
+
+
+class DiskClient:
+    """
+    Клиент API Диска поверх одной сессии с пулом соединений.
+
+    URL всех эндпоинтов вычисляются один раз при создании клиента.
+    Загрузка и скачивание идут через отдельную сессию без заголовка
+    авторизации: ссылки ведут на сторонние хосты. Для каждого такого
+    хоста (до transfer_pool_hosts) держится пул до transfer_pool_maxsize
+    keep-alive соединений, поэтому файлы фикстур не открывают новое
+    TLS-соединение на каждую загрузку.
+
+    С cache (yandexaqa.cache.MetaCache) ответы get_meta кэшируются, а
+    изменяющие методы клиента сбрасывают записи затронутых путей; для
+    асинхронных операций — ещё раз после wait_for_operation.
+
+    resolve_public запоминает public_key и public_url опубликованных
+    ресурсов; изменяющие методы клиента забывают их для затронутых путей.
+
+    С fields_tracker (yandexaqa.fields.FieldTracker) GET-запросы к
+    ресурсам учитывают, какие поля ответа прочитаны, и при выученной
+    проекции получают её в параметре fields.
+    """
+
+    def __init__(
+        self,
+        token=None,
+        base_url=DEFAULT_BASE_URL,
+        session=None,
+        rate_limit=None,
+        transfer_pool_hosts=TRANSFER_POOL_HOSTS,
+        transfer_pool_maxsize=TRANSFER_POOL_MAXSIZE,
+        cache=None,
+        json_backend=None,
+    ):
+        self.session = session or DiskSession(
+            token=token,
+            base_url=base_url,
+            rate_limit=rate_limit,
+            json_backend=json_backend,
+        )
+        self.base_url = self.session.base_url
+        self.transfer_session = mount_pool(
+            requests.Session(), transfer_pool_hosts, transfer_pool_maxsize
+        )
+        self.urls = {
+            name: f"{self.base_url}{template}" for name, template in ENDPOINTS.items()
+        }
+        self.cache = cache
+        self.fields_tracker = None
+        # Путь -> Resource с public_key и public_url
+        self._public = {}
+        # Ссылка на операцию -> пути, которые она меняет
+        self._pending = {}
+
+    def close(self):
+        self.session.close()
+        self.transfer_session.close()
+
+    def request(self, method, endpoint, params=None, **kwargs):
+        """Выполняет запрос к эндпоинту из ENDPOINTS по его имени."""
+        params = _params(params or {})
+        site = None
+        if method == "GET":
+            site, params = self._project(endpoint, params)
+        return self._send(method, endpoint, params, site, **kwargs)
+
+    def _project(self, endpoint, params):
+        """Место вызова для учёта полей и параметры с выученной проекцией."""
+        if self.fields_tracker is None:
+            return None, params
+        return self.fields_tracker.prepare(endpoint, params)
+
+    def _send(self, method, endpoint, params, site=None, **kwargs):
+        response = self.session.request(
+            method, self.urls[endpoint], params=params, **kwargs
+        )
+        if site is not None:
+            self.fields_tracker.observe(site, response)
+        return response
+
+    def _changed(self, response, *paths):
+        """Сбрасывает кэш изменённых путей и запоминает их до конца операции."""
+        self._forget_public(*paths)
+        if self.cache is not None:
+            self.cache.invalidate(*paths)
+            href = operation_href(response)
+            if href:
+                self._pending[href] = paths
+        return response
+
+    # Ресурсы
+
+    def get_meta(self, path, cache=True, **params):
+        """
+        GET /resources — метаинформация о файле или папке.
+
+        cache=False запрашивает сервер мимо кэша (для опроса изменений,
+        которые сервер применяет не сразу); свежий ответ обновляет кэш.
+        """
+        if self.cache is None:
+            return self.request("GET", "resources", {"path": path, **params})
+        # Проекция входит в ключ кэша: места вызова с разными fields
+        # не должны получать урезанные ответы друг друга
+        site, params = self._project("resources", {"path": path, **_params(params)})
+        key = {name: value for name, value in params.items() if name != "path"}
+        if not cache:
+            stale = self.cache.peek(path, key)
+            response = self._send("GET", "resources", params, site)
+            if stale is not None and (
+                stale.status_code != response.status_code
+                or stale.content != response.content
+            ):
+                self.cache.invalidate(path)
+        else:
+            response = self.cache.get(path, key)
+            if response is not None:
+                # Копия: изменения json() одним вызывающим не видны другим
+                response = copy_response(response)
+                if site is not None:
+                    self.fields_tracker.observe(site, response)
+                return response
+            response = self._send("GET", "resources", params, site)
+        if response.status_code == 200:
+            self.cache.put(path, key, response)
+        return response
+
+    def create_folder(self, path, **params):
+        """PUT /resources — создание папки."""
+        response = self.request("PUT", "resources", {"path": path, **params})
+        return self._changed(response, path)
+
+    def remove(self, path, **params):
+        """DELETE /resources — удаление файла или папки."""
+        response = self.request("DELETE", "resources", {"path": path, **params})
+        return self._changed(response, path)
+
+    def copy(self, from_path, path, **params):
+        """POST /resources/copy — копирование ресурса."""
+        response = self.request(
+            "POST", "copy", {"from": from_path, "path": path, **params}
+        )
+        return self._changed(response, path)
+
+    def move(self, from_path, path, **params):
+        """POST /resources/move — перемещение ресурса."""
+        response = self.request(
+            "POST", "move", {"from": from_path, "path": path, **params}
+        )
+        return self._changed(response, from_path, path)
+
+    # Загрузка и скачивание
+
+    def get_upload_link(self, path, **params):
+        """GET /resources/upload — ссылка для загрузки файла."""
+        return self.request("GET", "upload", {"path": path, **params})
+
+    def upload(self, path, data=None, overwrite=True, chunk_size=CHUNK_SIZE):
+        """
+        Загружает данные на Диск: получает ссылку и выполняет PUT.
+
+        data передается «сырым» телом запроса без multipart: bytes, str,
+        файловый объект, буфер (mmap, memoryview) или итерируемое
+        фрагментов (см. yandexaqa.streams). Файлы и буферы читаются
+        фрагментами по chunk_size байт.
+        Возвращает ответ на PUT либо ответ с ошибкой при получении ссылки.
+        """
+        response = self.get_upload_link(path, overwrite=overwrite)
+        if response.status_code != 200:
+            return response
+        link = Link.from_response(response)
+        response = self.transfer_session.put(link.href, data=as_body(data, chunk_size))
+        if self.cache is not None:
+            self.cache.invalidate(path)
+        return response
+
+    def get_download_link(self, path, **params):
+        """GET /resources/download — ссылка для скачивания."""
+        return self.request("GET", "download", {"path": path, **params})
+
+    # Публикация
+
+    def publish(self, path, public_settings=None, **params):
+        """PUT /resources/publish — публикация ресурса."""
+        body = {"public_settings": public_settings or {}}
+        response = self.request("PUT", "publish", {"path": path, **params}, json=body)
+        return self._changed(response, path)
+
+    def unpublish(self, path, **params):
+        """PUT /resources/unpublish — отмена публикации ресурса."""
+        response = self.request("PUT", "unpublish", {"path": path, **params})
+        return self._changed(response, path)
+
+    def resolve_public(self, path, refresh=False):
+        """
+        Публичные данные ресурса: Resource с path, public_key и public_url
+        или None, если ресурс не опубликован. Результат запоминается до
+        изменения ресурса методами клиента (публикация, отмена публикации,
+        перемещение, удаление); refresh=True запрашивает сервер мимо кэшей
+        и обновляет их (для ожидания публикации).
+        """
+        key = normalize_path(path)
+        if not refresh and key in self._public:
+            return self._public[key]
+        response = self.get_meta(
+            path, fields="path,public_key,public_url", cache=not refresh
+        )
+        public = None
+        if response.status_code == 200:
+            public = Resource.from_response(response)
+        if public is None or not public.public_key:
+            self._public.pop(key, None)
+            return None
+        self._public[key] = public
+        return public
+
+    def _forget_public(self, *paths):
+        changed = [normalize_path(path) for path in paths if path]
+        for key in list(self._public):
+            if any(related(key, path) for path in changed):
+                self._public.pop(key, None)
+
+    def get_public_meta(self, public_key, **params):
+        """GET /public/resources — метаинформация о публичном ресурсе."""
+        return self.request("GET", "public", {"public_key": public_key, **params})
+
+    def get_public_download_link(self, public_key, **params):
+        """GET /public/resources/download — ссылка на скачивание публичного ресурса."""
+        return self.request(
+            "GET", "public_download", {"public_key": public_key, **params}
+        )
+
+    # Корзина
+
+    def get_trash(self, path="/", **params):
+        """GET /trash/resources — содержимое корзины."""
+        return self.request("GET", "trash", {"path": path, **params})
+
+    def clear_trash(self, path=None, **params):
+        """DELETE /trash/resources — очистка корзины или удаление ресурса из неё."""
+        return self.request("DELETE", "trash", {"path": path, **params})
+
+    def restore(self, path, **params):
+        """PUT /trash/resources/restore — восстановление ресурса из корзины."""
+        response = self.request("PUT", "restore", {"path": path, **params})
+        # Путь восстановленного ресурса на Диске заранее неизвестен
+        return self._changed(response, "/")
+
+    # Операции
+
+    def get_operation(self, operation):
+        """GET /operations/{id} — статус операции по id или ссылке из ответа 202."""
+        if "/operations/" in operation:
+            return self.session.get(operation)
+        url = self.urls["operation"].format(operation_id=operation)
+        return self.session.get(url)
+
+    def wait_for_operation(self, link, timeout=DEFAULT_TIMEOUT):
+        """Дожидается завершения операции из ответа 202 (см. operations)."""
+        href = operation_href(link)
+        try:
+            return wait_for_operation(self.session, href, timeout=timeout)
+        finally:
+            paths = self._pending.pop(href, None)
+            if paths and self.cache is not None:
+                self.cache.invalidate(*paths)
@@ -0,0 +1,122 @@
+"""Потоковое скачивание файлов с проверкой контрольных сумм.
+
+Файл читается по ссылке из ``/resources/download`` фрагментами
+фиксированного размера, md5 и sha256 считаются по мере чтения. Целиком
+содержимое в памяти не хранится, поэтому так можно проверять файлы
+любого размера.
+"""
+
+import hashlib
+
+from yandexaqa.models import Link, Resource
+from yandexaqa.streams import CHUNK_SIZE
+
+DIGEST_FIELDS = ("size", "md5", "sha256")
+HASH_FIELDS = ("md5", "sha256")
+
+
+class DownloadError(Exception):
+    """Файл не удалось скачать или его содержимое не совпало с метаданными."""
+
+
+class DownloadResult:
+    """Размер и контрольные суммы скачанного содержимого."""
+
+    __slots__ = ("path", "size", "md5", "sha256")
+
+    def __init__(self, path, size, md5, sha256):
+        self.path = path
+        self.size = size
+        self.md5 = md5
+        self.sha256 = sha256
+
+    def mismatches(self, expected):
+        """
+        Возвращает список полей (size, md5, sha256), которые не совпали
+        с ресурсом expected. Поля, отсутствующие в expected, не сравниваются.
+        """
+        return [
+            name
+            for name in DIGEST_FIELDS
+            if getattr(expected, name) is not None
+            and getattr(expected, name) != getattr(self, name)
+        ]
+
+    def __repr__(self):
+        return (
+            f"DownloadResult(path={self.path!r}, size={self.size}, "
+            f"md5={self.md5!r}, sha256={self.sha256!r})"
+        )
+
+
+def stream_digests(response, chunk_size=CHUNK_SIZE):
+    """Читает тело ответа фрагментами, возвращает (size, md5, sha256)."""
+    size = 0
+    md5 = hashlib.md5()
+    sha256 = hashlib.sha256()
+    for chunk in response.iter_content(chunk_size):
+        size += len(chunk)
+        md5.update(chunk)
+        sha256.update(chunk)
+    return size, md5.hexdigest(), sha256.hexdigest()
+
+
+def download(client, path, chunk_size=CHUNK_SIZE):
+    """
+    Скачивает файл по ссылке из API и возвращает DownloadResult.
+    Если ссылку получить или скачать файл не удалось, выбрасывает DownloadError.
+    """
+    response = client.get_download_link(path)
+    if response.status_code != 200:
+        raise DownloadError(
+            f"Не удалось получить ссылку на {path}: "
+            f"{response.status_code} {response.text}"
+        )
+    link = Link.from_response(response)
+
+    with client.transfer_session.get(link.href, stream=True) as body:
+        if body.status_code != 200:
+            raise DownloadError(f"Не удалось скачать {path}: {body.status_code}")
+        size, md5, sha256 = stream_digests(body, chunk_size)
+    return DownloadResult(path, size, md5, sha256)
+
+
+def verify_download(client, path, expected=None, chunk_size=CHUNK_SIZE):
+    """
+    Скачивает файл и сверяет размер, md5 и sha256 с метаданными.
+
+    Аргументы:
+        client (DiskClient): Клиент API.
+        path (str): Путь к файлу на Диске.
+        expected (Resource): Ожидаемые метаданные; по умолчанию
+            запрашиваются через GET /resources.
+        chunk_size (int): Размер фрагмента при чтении.
+
+    При расхождении, а также если в метаданных нет ни md5, ни sha256
+    (проверка только по размеру не подтверждает содержимое), выбрасывает
+    DownloadError, иначе возвращает DownloadResult.
+    """
+    if expected is None:
+        response = client.get_meta(path, fields=",".join(DIGEST_FIELDS))
+        if response.status_code != 200:
+            raise DownloadError(
+                f"Не удалось получить метаданные {path}: "
+                f"{response.status_code} {response.text}"
+            )
+        expected = Resource.from_response(response)
+    if all(getattr(expected, name) is None for name in HASH_FIELDS):
+        raise DownloadError(
+            f"В метаданных {path} нет контрольных сумм (md5, sha256): "
+            "содержимое нечем проверить"
+        )
+
+    result = download(client, path, chunk_size)
+    mismatches = result.mismatches(expected)
+    if mismatches:
+        details = ", ".join(
+            f"{name}: ожидалось {getattr(expected, name)!r}, "
+            f"получено {getattr(result, name)!r}"
+            for name in mismatches
+        )
+        raise DownloadError(f"Содержимое {path} не совпало с метаданными: {details}")
+    return result
@@ -0,0 +1,5 @@
+"""Фейковый Яндекс.Диск для прогона тестов без сети."""
+
+from yandexaqa.fake.server import FakeDisk, FakeDiskServer
+
+__all__ = ["FakeDisk", "FakeDiskServer"]
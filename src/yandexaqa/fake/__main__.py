@@ -0,0 +1,16 @@
+"""Запуск фейкового Диска отдельным процессом: python -m yandexaqa.fake [порт]."""
+
+import sys
+import time
+
+from yandexaqa.fake import FakeDiskServer
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8080
+    server = FakeDiskServer(port=port).start()
+    print(f"Фейковый Диск запущен: {server.base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,593 @@
+"""HTTP-сервер фейкового Яндекс.Диска.
+
+Сервер запускается в фоновом потоке текущего процесса и отвечает на
+эндпоинты ``/v1/disk`` так же, как настоящий API: с теми же кодами,
+ошибками, параметрами ``fields``/``limit``/``offset`` и асинхронными
+операциями (202 + ``/operations/{id}``). Ссылки на загрузку и скачивание
+ведут на этот же сервер.
+"""
+
+import base64
+import io
+import json
+import secrets
+import threading
+import time
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from yandexaqa.fake.storage import (
+    Disk,
+    DiskError,
+    Node,
+    Operation,
+    bad_path,
+    normalize,
+    not_found,
+    split,
+)
+
+API_PREFIX = "/v1/disk"
+DEFAULT_LIMIT = 20
+OPERATION_DELAY = 0.1
+FINISHED_OPERATIONS = 1024
+# Выданные, но не использованные ссылки на загрузку и скачивание
+PENDING_LINKS = 1024
+JSON_CONTENT_TYPE = "application/json; charset=utf-8"
+
+UNAUTHORIZED = DiskError(401, "UnauthorizedError", "Не авторизован.")
+LOCKED = DiskError(423, "DiskResourceLockedError", "Ресурс заблокирован.")
+
+
+def remember(links, token, value):
+    """
+    Запоминает одноразовую ссылку; ссылка удаляется, когда по ней
+    загрузили или скачали файл, а невостребованные вытесняются после
+    PENDING_LINKS более новых.
+    """
+    links[token] = value
+    while len(links) > PENDING_LINKS:
+        del links[next(iter(links))]
+
+
+def project(data, fields):
+    """Оставляет в ответе только поля из ``fields`` (через запятую, с точками)."""
+    if not fields:
+        return data
+
+    spec = {}
+    for field in fields.split(","):
+        node = spec
+        for part in field.strip().split("."):
+            if part:
+                node = node.setdefault(part, {})
+
+    def apply(value, spec):
+        if not spec:
+            return value
+        if isinstance(value, list):
+            return [apply(item, spec) for item in value]
+        if isinstance(value, dict):
+            return {
+                key: apply(value[key], sub) for key, sub in spec.items() if key in value
+            }
+        return value
+
+    # Как и настоящий API, неизвестные поля игнорируются
+    projected = apply(data, spec)
+    return projected if projected else data
+
+
+def is_true(value):
+    return value == "true"
+
+
+class FakeDisk:
+    """
+    Логика API поверх in-memory хранилища.
+
+    Для каждого OAuth-токена создаётся отдельный аккаунт. Эффект
+    асинхронных операций применяется, когда операция завершается: через
+    ``operation_delay`` секунд после запроса.
+    """
+
+    def __init__(self, operation_delay=OPERATION_DELAY):
+        self.operation_delay = operation_delay
+        self.root_url = ""
+        self.disks = {}
+        self.public = {}
+        self.uploads = {}
+        self.downloads = {}
+        self.throttled = {}
+        self.lock = threading.RLock()
+
+    def disk_for(self, token):
+        if token not in self.disks:
+            self.disks[token] = Disk()
+        return self.disks[token]
+
+    def throttle(self, token, count, retry_after=0):
+        """
+        Следующие count запросов с токеном token получат ответ 429
+        с заголовком ``Retry-After: retry_after``.
+        """
+        with self.lock:
+            self.throttled[token] = [count, retry_after]
+
+    def check_throttle(self, token):
+        state = self.throttled.get(token)
+        if not state or state[0] <= 0:
+            return
+        state[0] -= 1
+        raise DiskError(
+            429,
+            "TooManyRequestsError",
+            "Слишком много запросов.",
+            headers={"Retry-After": str(state[1])},
+        )
+
+    # Служебное
+
+    def link(self, path, method="GET"):
+        return {
+            "href": f"{self.root_url}{API_PREFIX}/resources?path=disk:{path}",
+            "method": method,
+            "templated": False,
+        }
+
+    def start_operation(self, disk, action, kind=None, force_async=True):
+        """Выполняет action сразу (False) или заводит операцию и отвечает 202."""
+        if not force_async:
+            action()
+            return None
+        operation = Operation(action, self.operation_delay, kind)
+        disk.operations[operation.id] = operation
+        return {
+            "href": f"{self.root_url}{API_PREFIX}/operations/{operation.id}",
+            "method": "GET",
+            "templated": False,
+        }
+
+    def complete_operations(self):
+        """
+        Выполняет операции, время которых подошло. Просматриваются только
+        незавершённые операции; завершённые переносятся в disk.finished,
+        где хранятся последние FINISHED_OPERATIONS для чтения статуса.
+        """
+        now = time.monotonic()
+        for disk in self.disks.values():
+            ready = [
+                operation
+                for operation in disk.operations.values()
+                if operation.ready_at <= now
+            ]
+            for operation in ready:
+                try:
+                    operation.action()
+                    operation.status = "success"
+                except DiskError:
+                    operation.status = "failed"
+                del disk.operations[operation.id]
+                disk.finished[operation.id] = operation
+            while len(disk.finished) > FINISHED_OPERATIONS:
+                del disk.finished[next(iter(disk.finished))]
+
+    def pending(self, disk, kind):
+        return any(operation.kind == kind for operation in disk.operations.values())
+
+    def listing(self, node, path, params, prefix="disk:", item=None):
+        """Формирует ответ о ресурсе; для папок добавляет страницу _embedded."""
+        data = item(node, path) if item else node.to_json(path, prefix)
+        if node.type == "dir":
+            limit = int(params.get("limit") or DEFAULT_LIMIT)
+            offset = int(params.get("offset") or 0)
+            names = sorted(node.children)
+            base = path.rstrip("/")
+            data["_embedded"] = {
+                "items": [
+                    (
+                        item(node.children[name], f"{base}/{name}")
+                        if item
+                        else node.children[name].to_json(f"{base}/{name}", prefix)
+                    )
+                    for name in names[offset : offset + limit]
+                ],
+                "limit": limit,
+                "offset": offset,
+                "total": len(names),
+                "path": f"{prefix}{path}",
+                "sort": params.get("sort", "name"),
+            }
+        return data
+
+    # Ресурсы
+
+    def get_resource(self, disk, params):
+        path = normalize(params.get("path"))
+        return 200, self.listing(disk.get(path), path, params)
+
+    def create_folder(self, disk, params):
+        path = normalize(params.get("path"))
+        disk.attach(path, Node(None, "dir"))
+        return 201, self.link(path)
+
+    def delete_resource(self, disk, params):
+        path = normalize(params.get("path"))
+        node = disk.get(path)
+        if path == "/":
+            raise DiskError(403, "DiskForbiddenError", "Нельзя удалить корень Диска.")
+
+        def action():
+            removed = disk.detach(path)
+            self.unpublish_tree(removed)
+            if not is_true(params.get("permanently")):
+                disk.to_trash(path, removed)
+
+        force_async = is_true(params.get("force_async")) or bool(node.children)
+        link = self.start_operation(disk, action, force_async=force_async)
+        return (202, link) if link else (204, None)
+
+    def copy_or_move(self, disk, params, move):
+        source = normalize(params.get("from"))
+        target = normalize(params.get("path"))
+        node = disk.get(source)
+        overwrite = is_true(params.get("overwrite"))
+
+        # Конфликты проверяются сразу, до постановки асинхронной операции
+        disk.check_target(target, overwrite)
+
+        def action():
+            copy = disk.detach(source) if move else node.clone()
+            disk.attach(target, copy, overwrite=overwrite)
+
+        force_async = is_true(params.get("force_async")) or node.type == "dir"
+        link = self.start_operation(disk, action, force_async=force_async)
+        return (202, link) if link else (201, self.link(target))
+
+    # Загрузка и скачивание
+
+    def upload_link(self, disk, params):
+        path = normalize(params.get("path"))
+        disk.check_target(path, is_true(params.get("overwrite")))
+        token = secrets.token_hex(16)
+        remember(self.uploads, token, (disk, path))
+        return 200, {
+            "operation_id": token,
+            "href": f"{self.root_url}/upload-target/{token}",
+            "method": "PUT",
+            "templated": False,
+        }
+
+    def upload(self, token, body):
+        if token not in self.uploads:
+            raise not_found()
+        disk, path = self.uploads.pop(token)
+        disk.attach(path, Node(None, "file", body), overwrite=True)
+        return 201, None
+
+    def download_link(self, disk, params):
+        path = normalize(params.get("path"))
+        return 200, self.download_href(disk.get(path))
+
+    def download_href(self, node):
+        token = secrets.token_hex(16)
+        remember(self.downloads, token, node)
+        suffix = "?zip=true" if node.type == "dir" else ""
+        return {
+            "href": f"{self.root_url}/download-target/{token}{suffix}",
+            "method": "GET",
+            "templated": False,
+        }
+
+    def download(self, token):
+        node = self.downloads.pop(token, None)
+        if node is None:
+            raise not_found()
+        if node.type == "file":
+            return node.data
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            for path, child in node.walk(node.name):
+                if child.type == "file":
+                    archive.writestr(path, child.data)
+        return buffer.getvalue()
+
+    # Публикация
+
+    def publish(self, disk, params):
+        path = normalize(params.get("path"))
+        node = disk.get(path)
+        if not node.public_key:
+            node.public_key = base64.b64encode(secrets.token_bytes(33)).decode()
+            short_id = secrets.token_urlsafe(10)
+            node.public_url = f"{self.root_url}/d/{short_id}"
+            for key in (node.public_key, node.public_url, short_id):
+                self.public[key] = node
+        return 200, self.link(path)
+
+    def unpublish(self, disk, params):
+        path = normalize(params.get("path"))
+        self.unpublish_tree(disk.get(path), recursive=False)
+        return 200, self.link(path)
+
+    def unpublish_tree(self, node, recursive=True):
+        nodes = (child for _, child in node.walk("/")) if recursive else [node]
+        for child in nodes:
+            if child.public_key:
+                self.public = {
+                    key: value
+                    for key, value in self.public.items()
+                    if value is not child
+                }
+                child.public_key = child.public_url = None
+
+    def public_node(self, params):
+        public_key = params.get("public_key")
+        if not public_key:
+            raise DiskError(
+                400,
+                "FieldValidationError",
+                'Ошибка проверки поля "public_key": Это поле является обязательным.',
+            )
+        root = self.public.get(public_key)
+        if root is None:
+            raise not_found()
+        path = normalize(params.get("path") or "/")
+        node = root
+        for part in split(path):
+            if node.children is None or part not in node.children:
+                raise not_found()
+            node = node.children[part]
+        return root, node, path
+
+    def get_public(self, params):
+        root, node, path = self.public_node(params)
+
+        def item(child, child_path):
+            data = child.to_json(child_path, prefix="")
+            data.update(public_key=root.public_key)
+            if child is root:
+                data.update(public_url=root.public_url)
+            return data
+
+        return 200, self.listing(node, path, params, item=item)
+
+    def public_download_link(self, params):
+        _, node, _ = self.public_node(params)
+        return 200, self.download_href(node)
+
+    # Корзина
+
+    def get_trash(self, disk, params):
+        path = normalize(params.get("path") or "/", prefix="trash:")
+        entry, node, path = disk.find_in_trash(path)
+        if entry is None:
+            names = sorted(disk.trash)
+            limit = int(params.get("limit") or DEFAULT_LIMIT)
+            offset = int(params.get("offset") or 0)
+            return 200, {
+                "name": "trash",
+                "path": "trash:/",
+                "type": "dir",
+                "origin_path": None,
+                "_embedded": {
+                    "items": [
+                        disk.trash[name].to_json()
+                        for name in names[offset : offset + limit]
+                    ],
+                    "limit": limit,
+                    "offset": offset,
+                    "total": len(names),
+                    "path": "trash:/",
+                    "sort": params.get("sort", "deleted"),
+                },
+            }
+        data = self.listing(node, path, params, prefix="trash:")
+        if node is entry.node:
+            data.update(entry.to_json(path))
+        return 200, data
+
+    def clear_trash(self, disk, params):
+        path = params.get("path")
+        force_async = is_true(params.get("force_async"))
+        if self.pending(disk, "trash"):
+            raise LOCKED
+
+        if path is None or normalize(path, prefix="trash:") == "/":
+            action = disk.trash.clear
+            force_async = force_async or bool(disk.trash)
+        else:
+            entry, node, path = disk.find_in_trash(normalize(path, prefix="trash:"))
+
+            def action():
+                disk.trash.pop(entry.name, None)
+
+            force_async = force_async or bool(node.children)
+
+        link = self.start_operation(disk, action, kind="trash", force_async=force_async)
+        return (202, link) if link else (204, None)
+
+    def restore(self, disk, params):
+        entry, node, path = disk.find_in_trash(
+            normalize(params.get("path"), prefix="trash:")
+        )
+        if entry is None:
+            raise bad_path()
+        target = entry.origin_path
+        if params.get("name"):
+            target = f"{target.rsplit('/', 1)[0]}/{params['name']}"
+        overwrite = is_true(params.get("overwrite"))
+        disk.check_target(target, overwrite)
+
+        def action():
+            disk.attach(target, node, overwrite=overwrite)
+            disk.trash.pop(entry.name, None)
+
+        force_async = is_true(params.get("force_async")) or bool(node.children)
+        link = self.start_operation(disk, action, force_async=force_async)
+        return (202, link) if link else (201, self.link(target))
+
+    # Операции
+
+    def get_operation(self, disk, operation_id):
+        operation = disk.operations.get(operation_id) or disk.finished.get(operation_id)
+        if operation is None:
+            raise not_found()
+        return 200, {"status": operation.status}
+
+    ROUTES = {
+        ("GET", "/resources"): get_resource,
+        ("PUT", "/resources"): create_folder,
+        ("DELETE", "/resources"): delete_resource,
+        ("POST", "/resources/copy"): lambda self, disk, params: self.copy_or_move(
+            disk, params, move=False
+        ),
+        ("POST", "/resources/move"): lambda self, disk, params: self.copy_or_move(
+            disk, params, move=True
+        ),
+        ("GET", "/resources/upload"): upload_link,
+        ("GET", "/resources/download"): download_link,
+        ("PUT", "/resources/publish"): publish,
+        ("PUT", "/resources/unpublish"): unpublish,
+        ("GET", "/trash/resources"): get_trash,
+        ("DELETE", "/trash/resources"): clear_trash,
+        ("PUT", "/trash/resources/restore"): restore,
+    }
+
+    PUBLIC_ROUTES = {
+        ("GET", "/public/resources"): get_public,
+        ("GET", "/public/resources/download"): public_download_link,
+    }
+
+    def handle(self, method, url, headers, body):
+        """
+        Обрабатывает запрос и возвращает (код, тело ответа в байтах,
+        content-type, дополнительные заголовки).
+        """
+        parts = urlsplit(url)
+        params = {
+            key: values[0]
+            for key, values in parse_qs(parts.query, keep_blank_values=True).items()
+        }
+
+        extra_headers = {}
+        try:
+            with self.lock:
+                self.complete_operations()
+                status, data = self.dispatch(method, parts.path, params, headers, body)
+        except DiskError as error:
+            status, data = error.status, error.to_json()
+            extra_headers = error.headers
+
+        if isinstance(data, bytes):
+            return status, data, "application/octet-stream", extra_headers
+        if data is None:
+            return status, b"", JSON_CONTENT_TYPE, extra_headers
+        if status < 400:
+            data = project(data, params.get("fields"))
+        payload = json.dumps(data, ensure_ascii=False).encode()
+        return status, payload, JSON_CONTENT_TYPE, extra_headers
+
+    def dispatch(self, method, path, params, headers, body):
+        if path.startswith("/upload-target/") and method == "PUT":
+            return self.upload(path.rsplit("/", 1)[-1], body)
+        if path.startswith("/download-target/") and method == "GET":
+            return 200, self.download(path.rsplit("/", 1)[-1])
+        if not path.startswith(API_PREFIX):
+            raise not_found()
+
+        route = path[len(API_PREFIX) :].rstrip("/")
+        if (method, route) in self.PUBLIC_ROUTES:
+            return self.PUBLIC_ROUTES[(method, route)](self, params)
+
+        authorization = headers.get("Authorization") or ""
+        if not authorization.startswith("OAuth ") or not authorization[6:].strip():
+            raise UNAUTHORIZED
+        token = authorization[6:].strip()
+        self.check_throttle(token)
+        disk = self.disk_for(token)
+
+        if method == "GET" and route.startswith("/operations/"):
+            return self.get_operation(disk, route.rsplit("/", 1)[-1])
+        handler = self.ROUTES.get((method, route))
+        if handler is None:
+            raise DiskError(405, "MethodNotAllowedError", "Метод не поддерживается.")
+        return handler(self, disk, params)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def read_body(self):
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0].strip() or b"0", 16)
+                if size == 0:
+                    # Пропускаем трейлеры до пустой строки
+                    while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                        pass
+                    return b"".join(chunks)
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def respond(self):
+        body = self.read_body()
+        status, payload, content_type, headers = self.server.disk.handle(
+            self.command, self.path, self.headers, body
+        )
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(payload)
+
+    do_GET = do_PUT = do_POST = do_DELETE = do_HEAD = respond
+
+
+class FakeDiskServer:
+    """
+    Локальный HTTP-сервер с фейковым Диском в фоновом потоке.
+
+    Пример:
+        with FakeDiskServer() as server:
+            client = DiskClient(token="token", base_url=server.base_url)
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, operation_delay=OPERATION_DELAY):
+        self.disk = FakeDisk(operation_delay=operation_delay)
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.disk = self.disk
+        host, port = self.httpd.server_address[:2]
+        self.disk.root_url = f"http://{host}:{port}"
+        self.thread = None
+
+    @property
+    def base_url(self):
+        return f"{self.disk.root_url}{API_PREFIX}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
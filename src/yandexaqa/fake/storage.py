@@ -0,0 +1,263 @@
+"""In-memory дерево ресурсов, корзина и операции фейкового Диска."""
+
+import hashlib
+import itertools
+import mimetypes
+import time
+import uuid
+from datetime import datetime, timezone
+
+
+class DiskError(Exception):
+    """Ошибка API: код ответа, имя ошибки и сообщение как у настоящего Диска."""
+
+    def __init__(self, status, error, message, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.error = error
+        self.message = message
+        self.headers = headers or {}
+
+    def to_json(self):
+        return {
+            "message": self.message,
+            "description": self.message,
+            "error": self.error,
+        }
+
+
+def not_found():
+    return DiskError(404, "DiskNotFoundError", "Не удалось найти запрошенный ресурс.")
+
+
+def bad_path():
+    return DiskError(
+        400,
+        "FieldValidationError",
+        'Ошибка проверки поля "path": Это поле является обязательным.',
+    )
+
+
+def _now():
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
+
+def normalize(path, prefix="disk:"):
+    """
+    Приводит путь к виду ``/a/b``: отрезает префикс ``disk:``/``trash:``,
+    добавляет ведущий слеш и убирает завершающий. Пустой путь — ошибка 400.
+    """
+    if path is None or path == "":
+        raise bad_path()
+    if path.startswith(prefix):
+        path = path[len(prefix) :]
+    if not path.startswith("/"):
+        path = "/" + path
+    if len(path) > 1:
+        path = path.rstrip("/") or "/"
+    return path
+
+
+def split(path):
+    return [part for part in path.split("/") if part]
+
+
+def parent_of(path):
+    parts = split(path)
+    return "/" + "/".join(parts[:-1])
+
+
+class Node:
+    """Файл или папка в дереве."""
+
+    __slots__ = (
+        "name",
+        "type",
+        "data",
+        "children",
+        "created",
+        "modified",
+        "resource_id",
+        "public_key",
+        "public_url",
+        "md5",
+        "sha256",
+    )
+
+    def __init__(self, name, type, data=None):
+        self.name = name
+        self.type = type
+        self.data = data
+        self.children = {} if type == "dir" else None
+        self.created = self.modified = _now()
+        self.resource_id = uuid.uuid4().hex
+        self.public_key = None
+        self.public_url = None
+        self.md5 = self.sha256 = None
+        if data is not None:
+            self.md5 = hashlib.md5(data).hexdigest()
+            self.sha256 = hashlib.sha256(data).hexdigest()
+
+    @property
+    def size(self):
+        return len(self.data) if self.data is not None else 0
+
+    def clone(self):
+        """Глубокая копия без публикации: так ведёт себя копирование на Диске."""
+        node = Node(self.name, self.type, self.data)
+        if self.children is not None:
+            node.children = {
+                name: child.clone() for name, child in self.children.items()
+            }
+        return node
+
+    def walk(self, path):
+        yield path, self
+        for name, child in (self.children or {}).items():
+            yield from child.walk(f"{path.rstrip('/')}/{name}")
+
+    def to_json(self, path, prefix="disk:"):
+        data = {
+            "name": self.name,
+            "path": f"{prefix}{path}",
+            "type": self.type,
+            "created": self.created,
+            "modified": self.modified,
+            "resource_id": self.resource_id,
+        }
+        if self.type == "file":
+            mime_type = mimetypes.guess_type(self.name)[0] or "application/octet-stream"
+            data.update(
+                size=self.size,
+                md5=self.md5,
+                sha256=self.sha256,
+                mime_type=mime_type,
+                media_type="image" if mime_type.startswith("image/") else "document",
+            )
+        if self.public_key:
+            data.update(public_key=self.public_key, public_url=self.public_url)
+        return data
+
+
+class TrashEntry:
+    __slots__ = ("name", "node", "origin_path", "deleted")
+
+    def __init__(self, name, node, origin_path):
+        self.name = name
+        self.node = node
+        self.origin_path = origin_path
+        self.deleted = _now()
+
+    def to_json(self, path=None):
+        data = self.node.to_json(path or f"/{self.name}", prefix="trash:")
+        data.update(
+            name=self.node.name,
+            origin_path=f"disk:{self.origin_path}",
+            deleted=self.deleted,
+        )
+        return data
+
+
+class Operation:
+    __slots__ = ("id", "status", "ready_at", "action", "kind")
+
+    def __init__(self, action, delay, kind=None):
+        self.id = uuid.uuid4().hex
+        self.status = "in-progress"
+        self.ready_at = time.monotonic() + delay
+        self.action = action
+        self.kind = kind
+
+
+class Disk:
+    """Состояние одного аккаунта: дерево ресурсов, корзина и операции."""
+
+    def __init__(self):
+        self.root = Node("disk", "dir")
+        self.trash = {}
+        # Незавершённые операции; завершённые — в finished, до
+        # FINISHED_OPERATIONS последних (см. FakeDisk.complete_operations)
+        self.operations = {}
+        self.finished = {}
+        self._trash_ids = itertools.count(1)
+
+    # Дерево
+
+    def find(self, path):
+        node = self.root
+        for part in split(path):
+            if node.children is None or part not in node.children:
+                return None
+            node = node.children[part]
+        return node
+
+    def get(self, path):
+        node = self.find(path)
+        if node is None:
+            raise not_found()
+        return node
+
+    def parent_for(self, path):
+        """Возвращает папку, в которой должен появиться ресурс path."""
+        parent_path = parent_of(path)
+        parent = self.find(parent_path)
+        if parent is None or parent.type != "dir":
+            raise DiskError(
+                409,
+                "DiskPathDoesntExistsError",
+                f'Указанного пути "{parent_path}" не существует.',
+            )
+        return parent
+
+    def check_target(self, path, overwrite=False):
+        """Проверяет, что по пути path можно создать ресурс; возвращает папку-родителя."""
+        if path == "/":
+            raise DiskError(
+                409,
+                "DiskPathPointsToExistentDirectoryError",
+                "Указанный путь указывает на существующую папку.",
+            )
+        parent = self.parent_for(path)
+        if split(path)[-1] in parent.children and not overwrite:
+            raise DiskError(
+                409,
+                "DiskResourceAlreadyExistsError",
+                f'Ресурс "{path}" уже существует.',
+            )
+        return parent
+
+    def attach(self, path, node, overwrite=False):
+        parent = self.check_target(path, overwrite)
+        node.name = split(path)[-1]
+        parent.children[node.name] = node
+        parent.modified = _now()
+        return node
+
+    def detach(self, path):
+        parent = self.find(parent_of(path))
+        node = parent.children.pop(split(path)[-1])
+        parent.modified = _now()
+        return node
+
+    # Корзина
+
+    def to_trash(self, path, node):
+        name = node.name
+        if name in self.trash:
+            name = f"{name}_{hashlib.sha1(str(next(self._trash_ids)).encode()).hexdigest()}"
+        self.trash[name] = TrashEntry(name, node, path)
+
+    def find_in_trash(self, path):
+        """Возвращает (запись корзины, узел, путь внутри корзины) или ошибку 404."""
+        parts = split(path)
+        if not parts:
+            return None, None, "/"
+        entry = self.trash.get(parts[0])
+        if entry is None:
+            raise not_found()
+        node = entry.node
+        for part in parts[1:]:
+            if node.children is None or part not in node.children:
+                raise not_found()
+            node = node.children[part]
+        return entry, node, path
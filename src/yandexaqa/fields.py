@@ -0,0 +1,338 @@
+"""Учёт прочитанных полей ответа и автоматический параметр ``fields``.
+
+Без ``fields`` API возвращает ресурс целиком, а для папок — ещё и список
+``_embedded.items`` с превью и хэшами, даже если тест проверяет только
+``type``. FieldTracker подменяет ``response.json()`` ответов GET
+``/resources``, ``/trash/resources`` и ``/public/resources``: разобранный
+JSON оборачивается в TrackedDict/TrackedList, которые запоминают, какие
+ключи прочитаны. Для каждого места вызова (функция теста или фикстуры,
+из которой вызван клиент) копится минимальная проекция в синтаксисе
+``fields``: ``name,type,_embedded.items.path``.
+
+Выученные проекции сохраняются в JSON (``FieldTracker.dump_learned``) и
+в режиме применения подставляются в запросы этих мест вызова, если
+``fields`` не передан явно.
+
+Операции над объектом целиком (сравнение, перебор ключей, ``len``,
+``repr``) помечают весь объект как нужный. Проекция — это то, что
+прочитано в учебном прогоне: ветки кода, которые в нём не выполнялись,
+могут прочитать отсечённое поле.
+"""
+
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+TRACKED_ENDPOINTS = frozenset({"resources", "trash", "public"})
+# Суффикс пути объекта, использованного целиком; "*" — весь ответ
+WHOLE = "*"
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_COMPREHENSIONS = frozenset({"<listcomp>", "<setcomp>", "<dictcomp>", "<genexpr>"})
+
+
+def _join(prefix, key):
+    return f"{prefix}.{key}" if prefix else str(key)
+
+
+def track(value, used, prefix=""):
+    """Оборачивает dict и list для учёта чтения; остальное возвращает как есть."""
+    if isinstance(value, dict):
+        return TrackedDict(value, used, prefix)
+    if isinstance(value, list):
+        return TrackedList(value, used, prefix)
+    return value
+
+
+class TrackedDict(dict):
+    """
+    dict, который записывает в used пути прочитанных ключей. Вложенные
+    объекты оборачиваются при первом чтении и запоминаются, поэтому
+    каждый контейнер ответа копируется не больше одного раза.
+    """
+
+    __slots__ = ("_used", "_prefix", "_views")
+
+    def __init__(self, data, used, prefix):
+        super().__init__(data)
+        self._used = used
+        self._prefix = prefix
+        self._views = {}
+
+    def _whole(self):
+        self._used.add(_join(self._prefix, WHOLE))
+
+    def _read(self, key, value):
+        view = self._views.get(key)
+        if view is None:
+            view = track(value, self._used, _join(self._prefix, key))
+            if view is not value:
+                self._views[key] = view
+        return view
+
+    def __getitem__(self, key):
+        self._used.add(_join(self._prefix, key))
+        return self._read(key, super().__getitem__(key))
+
+    def get(self, key, default=None):
+        self._used.add(_join(self._prefix, key))
+        if not super().__contains__(key):
+            return default
+        return self._read(key, super().__getitem__(key))
+
+    def __contains__(self, key):
+        self._used.add(_join(self._prefix, key))
+        return super().__contains__(key)
+
+    def __iter__(self):
+        self._whole()
+        return super().__iter__()
+
+    def __len__(self):
+        self._whole()
+        return super().__len__()
+
+    def __eq__(self, other):
+        self._whole()
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        self._whole()
+        return super().__ne__(other)
+
+    def __repr__(self):
+        self._whole()
+        return super().__repr__()
+
+    def keys(self):
+        self._whole()
+        return super().keys()
+
+    def values(self):
+        self._whole()
+        return super().values()
+
+    def items(self):
+        self._whole()
+        return super().items()
+
+    def copy(self):
+        self._whole()
+        return dict(super().items())
+
+
+class TrackedList(list):
+    """
+    list, элементы которого учитываются под тем же путём: в синтаксисе
+    ``fields`` поле элементов списка — ``_embedded.items.name``.
+    """
+
+    __slots__ = ("_used", "_prefix", "_views")
+
+    def __init__(self, data, used, prefix):
+        super().__init__(data)
+        self._used = used
+        self._prefix = prefix
+        self._views = {}
+
+    def _read(self, index):
+        view = self._views.get(index)
+        if view is None:
+            value = super().__getitem__(index)
+            view = track(value, self._used, self._prefix)
+            if view is not value:
+                self._views[index] = view
+        return view
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return TrackedList(super().__getitem__(index), self._used, self._prefix)
+        return self._read(range(super().__len__())[index])
+
+    def __iter__(self):
+        for index in range(super().__len__()):
+            yield self._read(index)
+
+    def __eq__(self, other):
+        self._used.add(_join(self._prefix, WHOLE))
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        self._used.add(_join(self._prefix, WHOLE))
+        return super().__ne__(other)
+
+    def __repr__(self):
+        self._used.add(_join(self._prefix, WHOLE))
+        return super().__repr__()
+
+
+def minimal_fields(paths):
+    """
+    Проекция для набора прочитанных путей. Ключи, через которые только
+    прошло чтение (``_embedded`` в ``_embedded.items.name``), отбрасываются,
+    объекты, использованные целиком (``_embedded.*``), поглощают вложенные
+    пути. None, если нужен весь ответ или ничего не прочитано.
+    """
+    if not paths or WHOLE in paths:
+        return None
+    whole = {path[: -len(WHOLE) - 1] for path in paths if path.endswith("." + WHOLE)}
+    reads = {path for path in paths if not path.endswith("." + WHOLE)}
+    leaves = whole | {
+        path
+        for path in reads
+        if not any(other.startswith(path + ".") for other in reads | whole)
+    }
+    kept = [
+        path
+        for path in sorted(leaves)
+        if not any(path.startswith(parent + ".") for parent in whole)
+    ]
+    return ",".join(kept)
+
+
+def call_site(root=None):
+    """
+    Место вызова клиента: ``файл::функция`` первого кадра стека вне
+    пакета yandexaqa, принадлежащего файлу проекта (тест, фикстура или
+    хелпер). Кадры генераторных выражений и списковых включений
+    относятся к объемлющей функции. None, если такого кадра нет
+    (запрос из потока пула внутри пакета).
+    """
+    root = os.path.abspath(root or os.getcwd())
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        name = frame.f_code.co_name
+        if (
+            filename.startswith(root + os.sep)
+            and not filename.startswith(_PACKAGE_DIR)
+            and name not in _COMPREHENSIONS
+        ):
+            return f"{Path(os.path.relpath(filename, root)).as_posix()}::{name}"
+        frame = frame.f_back
+    return None
+
+
+class SiteStats:
+    """Учёт одного места вызова: число запросов, байты ответов, прочитанные пути."""
+
+    __slots__ = ("calls", "bytes", "used")
+
+    def __init__(self):
+        self.calls = 0
+        self.bytes = 0
+        self.used = set()
+
+
+class FieldTracker:
+    """
+    Сборщик прочитанных полей по местам вызова.
+
+    Аргументы:
+        learned (dict): Выученные проекции ``{место вызова: fields}``;
+            если заданы, подставляются в запросы без явного ``fields``.
+        root (str): Каталог, относительно которого записываются файлы
+            мест вызова.
+
+    Пример:
+        tracker = FieldTracker()
+        tracker.attach(client)
+        ...
+        tracker.report()
+    """
+
+    def __init__(self, learned=None, root=None):
+        self.learned = dict(learned or {})
+        self.root = root
+        self.sites = {}
+        self._lock = threading.Lock()
+
+    def attach(self, client):
+        client.fields_tracker = self
+        return client
+
+    def prepare(self, endpoint, params):
+        """
+        Возвращает (место вызова, параметры запроса). Место вызова None,
+        если эндпоинт не отслеживается или fields передан явно.
+        """
+        if endpoint not in TRACKED_ENDPOINTS or "fields" in params:
+            return None, params
+        caller = call_site(self.root)
+        if caller is None:
+            return None, params
+        site = f"{endpoint} {caller}"
+        fields = self.learned.get(site)
+        if fields:
+            params = {**params, "fields": fields}
+        return site, params
+
+    def observe(self, site, response):
+        """
+        Учитывает ответ и подменяет его json() на отслеживающий.
+        Отслеживающее представление строится один раз на ответ; ответы
+        из кэша клиента приходят сюда копиями (см. DiskClient.get_meta)
+        и учитываются для того места вызова, которому отданы.
+        """
+        with self._lock:
+            stats = self.sites.setdefault(site, SiteStats())
+            stats.calls += 1
+            stats.bytes += len(response.content or b"")
+        parse = response.json
+        view = []
+
+        def tracked_json(**kwargs):
+            if kwargs:
+                return track(parse(**kwargs), stats.used)
+            if not view:
+                view.append(track(parse(), stats.used))
+            return view[0]
+
+        response.json = tracked_json
+        return response
+
+    def report(self):
+        """Сводка по местам вызова: запросы, средний размер ответа, проекция."""
+        return {
+            site: {
+                "calls": stats.calls,
+                "mean_bytes": stats.bytes / stats.calls if stats.calls else 0,
+                "fields": minimal_fields(stats.used),
+                "applied": self.learned.get(site),
+            }
+            for site, stats in sorted(self.sites.items())
+        }
+
+    def dump_learned(self, path):
+        """Сохраняет проекции мест вызова, для которых она известна."""
+        learned = {
+            site: fields
+            for site, stats in self.sites.items()
+            if (fields := minimal_fields(stats.used))
+        }
+        Path(path).write_text(
+            json.dumps(learned, ensure_ascii=False, indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+
+    def dump(self):
+        """Сериализуемое состояние (для передачи с воркеров xdist)."""
+        return {
+            site: [stats.calls, stats.bytes, sorted(stats.used)]
+            for site, stats in self.sites.items()
+        }
+
+    def load(self, data):
+        """Добавляет состояние, полученное через dump()."""
+        for site, (calls, size, used) in data.items():
+            stats = self.sites.setdefault(site, SiteStats())
+            stats.calls += calls
+            stats.bytes += size
+            stats.used.update(used)
+
+
+def load_learned(path):
+    """Загружает проекции, сохранённые dump_learned."""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
@@ -0,0 +1,390 @@
+"""Генератор нагрузки с открытой моделью поступления запросов.
+
+Сценарии повторяют тестовые потоки (создание папки, загрузка,
+публикация, чтение публичной информации, отмена публикации, удаление)
+и запускаются с заданной частотой независимо от того, завершились ли
+предыдущие (open loop). Расписание ведёт цикл asyncio, а сами HTTP-вызовы
+выполняются синхронным клиентом в пуле потоков.
+
+Координированное упущение (coordinated omission) учитывается так: время
+ответа сценария отсчитывается от запланированного момента запуска, а не
+от фактического. Если сервис или пул потоков не успевают, ожидание в
+очереди попадает в задержку. Отдельно сохраняется время обслуживания —
+от фактического начала до конца сценария.
+
+Запуск:
+    python -m yandexaqa.load --rate 20 --duration 60 \\
+        --mix publish_flow=1,read_meta=4
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from yandexaqa.client import DiskClient
+from yandexaqa.registry import ResourceRegistry
+from yandexaqa.sandbox import SANDBOX_PREFIX
+from yandexaqa.session import DEFAULT_BASE_URL, DiskSession
+
+MAX_WORKERS = 64
+REPORT_INTERVAL = 1.0
+# Точность гистограммы: 16 корзин на каждое удвоение значения (~4.4%)
+SUB_BUCKETS = 16
+PAYLOAD = b"load test payload\n" * 64
+
+
+class Histogram:
+    """
+    Гистограмма задержек с логарифмическими корзинами.
+
+    Память не зависит от числа значений; относительная погрешность
+    перцентилей — около 1/SUB_BUCKETS от значения.
+    """
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @staticmethod
+    def _bucket(value):
+        return math.floor(math.log2(max(value, 1e-6)) * SUB_BUCKETS)
+
+    def record(self, value):
+        bucket = self._bucket(value)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, q):
+        """Верхняя граница корзины, в которую попадает перцентиль q (0-100)."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(2 ** ((bucket + 1) / SUB_BUCKETS), self.max)
+        return self.max
+
+    def summary(self):
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": self.total / self.count,
+            "max": self.max,
+            **{f"p{q}": self.percentile(q) for q in (50, 90, 99, 99.9)},
+        }
+
+
+class ScenarioError(Exception):
+    """Шаг сценария вернул ошибку."""
+
+
+class Stats:
+    """Потокобезопасный набор гистограмм: общий за прогон и за интервал отчета."""
+
+    def __init__(self):
+        self.total = {}
+        self.interval = {}
+        self.errors = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, value):
+        with self._lock:
+            for histograms in (self.total, self.interval):
+                histograms.setdefault(name, Histogram()).record(value)
+
+    def error(self, name):
+        with self._lock:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    def take_interval(self):
+        with self._lock:
+            interval, self.interval = self.interval, {}
+        return interval
+
+
+class Context:
+    """Окружение сценария: клиент, рабочая папка и запись шагов."""
+
+    def __init__(self, client, workspace, stats):
+        self.client = client
+        self.workspace = workspace
+        self.stats = stats
+
+    def step(self, name, method, *args, **kwargs):
+        """Выполняет шаг и записывает его задержку; статус >= 400 — ошибка."""
+        start = time.perf_counter()
+        response = method(*args, **kwargs)
+        self.stats.record(f"step:{name}", time.perf_counter() - start)
+        if response.status_code >= 400:
+            self.stats.error(f"step:{name}")
+            raise ScenarioError(f"{name}: {response.status_code}")
+        return response
+
+    def unique_path(self, prefix):
+        return f"{self.workspace}/{prefix}_{uuid.uuid4().hex[:8]}"
+
+
+def publish_flow(ctx):
+    """Папка -> загрузка -> публикация -> публичная информация -> отмена -> удаление."""
+    client = ctx.client
+    path = ctx.unique_path("flow")
+    ctx.step("create_folder", client.create_folder, path)
+    ctx.step("upload", client.upload, f"{path}/file.txt", PAYLOAD)
+    ctx.step("publish", client.publish, path)
+    meta = ctx.step("get_meta", client.get_meta, path, fields="public_key")
+    public_key = meta.json().get("public_key")
+    if public_key:
+        ctx.step("public_meta", client.get_public_meta, public_key)
+    ctx.step("unpublish", client.unpublish, path)
+    ctx.step("delete", client.remove, path, permanently=True)
+
+
+def upload_flow(ctx):
+    """Загрузка небольшого файла и его удаление."""
+    path = f"{ctx.unique_path('file')}.txt"
+    ctx.step("upload", ctx.client.upload, path, PAYLOAD)
+    ctx.step("delete", ctx.client.remove, path, permanently=True)
+
+
+def read_meta(ctx):
+    """Чтение метаинформации рабочей папки."""
+    ctx.step("get_meta", ctx.client.get_meta, ctx.workspace, limit=10)
+
+
+SCENARIOS = {
+    "publish_flow": publish_flow,
+    "upload_flow": upload_flow,
+    "read_meta": read_meta,
+}
+
+
+def parse_mix(text):
+    """``"publish_flow=1,read_meta=4"`` -> ``{"publish_flow": 1.0, "read_meta": 4.0}``."""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise ValueError(f"Неизвестный сценарий: {name}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def schedule(rate, duration, arrival="uniform", seed=None):
+    """
+    Запланированные моменты запуска (секунды от начала).
+    uniform — равные интервалы 1/rate, poisson — экспоненциальные интервалы.
+    """
+    rng = random.Random(seed)
+    moment = 0.0
+    while moment < duration:
+        yield moment
+        moment += rng.expovariate(rate) if arrival == "poisson" else 1 / rate
+
+
+class LoadResult:
+    """Итоги прогона."""
+
+    def __init__(self, stats, started, elapsed, duration):
+        self.stats = stats
+        self.started = started
+        self.elapsed = elapsed
+        self.duration = duration
+
+    def summary(self):
+        return {
+            "started": self.started,
+            "elapsed": self.elapsed,
+            "achieved_rate": self.started / self.duration if self.duration else 0.0,
+            "errors": dict(self.stats.errors),
+            "histograms": {
+                name: histogram.summary()
+                for name, histogram in sorted(self.stats.total.items())
+            },
+        }
+
+
+def format_interval(elapsed, interval, in_flight, errors):
+    """Строка живого отчета за интервал."""
+    parts = [f"{elapsed:6.1f}s", f"в работе {in_flight:4d}", f"ошибок {errors:4d}"]
+    for name, histogram in sorted(interval.items()):
+        if name.startswith("response:"):
+            summary = histogram.summary()
+            parts.append(
+                f"{name[9:]} n={summary['count']} "
+                f"p50={summary['p50'] * 1000:.0f}мс p99={summary['p99'] * 1000:.0f}мс"
+            )
+    return " | ".join(parts)
+
+
+async def run_load(
+    client,
+    workspace,
+    mix,
+    rate,
+    duration,
+    arrival="uniform",
+    seed=None,
+    max_workers=MAX_WORKERS,
+    report_interval=REPORT_INTERVAL,
+    reporter=None,
+):
+    """
+    Запускает сценарии из mix с частотой rate в секунду в течение duration секунд.
+
+    Аргументы:
+        client (DiskClient): Клиент API (его пул соединений должен
+            вмещать max_workers одновременных запросов).
+        workspace (str): Папка, в которой сценарии создают ресурсы.
+        mix (dict): Сценарий -> вес при случайном выборе.
+        arrival (str): uniform или poisson.
+        max_workers (int): Число потоков для сценариев.
+        reporter: Функция для строк живого отчета (по умолчанию не выводится).
+
+    Возвращает LoadResult с гистограммами response:<сценарий> (от
+    запланированного запуска), service:<сценарий> и step:<шаг>.
+    """
+    loop = asyncio.get_running_loop()
+    stats = Stats()
+    ctx = Context(client, workspace, stats)
+    rng = random.Random(seed)
+    names, weights = list(mix), list(mix.values())
+    in_flight = 0
+    started = 0
+
+    def execute(name):
+        start = time.perf_counter()
+        try:
+            SCENARIOS[name](ctx)
+        except Exception:
+            # ScenarioError или сетевая ошибка: сценарий считается неуспешным
+            stats.error(f"scenario:{name}")
+        stats.record(f"service:{name}", time.perf_counter() - start)
+
+    async def launch(name, intended):
+        nonlocal in_flight
+        in_flight += 1
+        try:
+            await loop.run_in_executor(executor, execute, name)
+        finally:
+            in_flight -= 1
+        stats.record(f"response:{name}", loop.time() - intended)
+
+    async def report(origin):
+        while True:
+            await asyncio.sleep(report_interval)
+            errors = sum(stats.errors.values())
+            reporter(
+                format_interval(
+                    loop.time() - origin, stats.take_interval(), in_flight, errors
+                )
+            )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        origin = loop.time()
+        reporting = asyncio.create_task(report(origin)) if reporter else None
+        tasks = set()
+        for offset in schedule(rate, duration, arrival, seed):
+            intended = origin + offset
+            delay = intended - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            name = rng.choices(names, weights)[0]
+            task = asyncio.create_task(launch(name, intended))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            started += 1
+        if tasks:
+            await asyncio.gather(*tasks)
+        if reporting:
+            reporting.cancel()
+        elapsed = loop.time() - origin
+
+    return LoadResult(stats, started, elapsed, duration)
+
+
+def _print_summary(result, out):
+    summary = result.summary()
+    print(
+        f"Запущено {summary['started']} сценариев за {summary['elapsed']:.1f} с "
+        f"({summary['achieved_rate']:.1f}/с), ошибки: {summary['errors'] or 'нет'}",
+        file=out,
+    )
+    print(
+        f"{'гистограмма':<28} {'N':>6} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}",
+        file=out,
+    )
+    for name, stats in summary["histograms"].items():
+        print(
+            f"{name:<28} {stats['count']:>6} "
+            + " ".join(
+                f"{stats[key] * 1000:8.1f}" for key in ("p50", "p90", "p99", "max")
+            ),
+            file=out,
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Генератор нагрузки для API Диска")
+    parser.add_argument("--rate", type=float, required=True, help="Сценариев в секунду")
+    parser.add_argument("--duration", type=float, default=30, help="Длительность, с")
+    parser.add_argument("--mix", default="publish_flow=1", help="Сценарии и веса")
+    parser.add_argument("--arrival", choices=["uniform", "poisson"], default="uniform")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument(
+        "--token", default=os.getenv("YANDEX_DISK_OAUTH_TOKEN"), help="OAuth-токен"
+    )
+    args = parser.parse_args(argv)
+
+    session = DiskSession(args.token, args.base_url, pool_maxsize=args.workers)
+    client = DiskClient(session=session, transfer_pool_maxsize=args.workers)
+    registry = ResourceRegistry(client)
+    workspace = registry.register(f"/{SANDBOX_PREFIX}load_{uuid.uuid4().hex[:8]}")
+    client.create_folder(workspace)
+    try:
+        result = asyncio.run(
+            run_load(
+                client,
+                workspace,
+                parse_mix(args.mix),
+                args.rate,
+                args.duration,
+                arrival=args.arrival,
+                seed=args.seed,
+                max_workers=args.workers,
+                reporter=print,
+            )
+        )
+    finally:
+        registry.purge()
+        client.close()
+    _print_summary(result, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Замеры задержек запросов к API.
+
+LatencyRecorder подключается к сессиям клиента через response-хуки
+requests и на каждый ответ сохраняет короткую запись: тест, шаблон
+эндпоинта (например, ``/resources/publish``), метод, статус, объём
+данных и задержку до получения заголовков ответа (``response.elapsed``).
+Хук не читает тело ответа, поэтому накладные расходы — одна запись в
+список на запрос.
+"""
+
+import threading
+from urllib.parse import urlsplit
+
+from yandexaqa.client import ENDPOINTS
+from yandexaqa.operations import WAIT_OBSERVERS
+
+PERCENTILES = (50, 95, 99)
+# Шаблоны для запросов к хостам загрузки и скачивания (вне API)
+TRANSFER_TEMPLATES = {"PUT": "<upload>", "GET": "<download>"}
+
+
+class RequestRecord:
+    """Замер одного запроса."""
+
+    __slots__ = ("test", "endpoint", "method", "status", "sent", "received", "latency")
+
+    def __init__(self, test, endpoint, method, status, sent, received, latency):
+        self.test = test
+        self.endpoint = endpoint
+        self.method = method
+        self.status = status
+        self.sent = sent
+        self.received = received
+        self.latency = latency
+
+    def to_tuple(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+
+def percentile(values, q):
+    """Перцентиль q (0-100) отсортированного списка с линейной интерполяцией."""
+    if not values:
+        return None
+    position = (len(values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def summarize(latencies):
+    """Сводка по списку задержек: число, сумма, среднее, максимум и перцентили."""
+    values = sorted(latencies)
+    if not values:
+        return {"count": 0}
+    summary = {
+        "count": len(values),
+        "total": sum(values),
+        "mean": sum(values) / len(values),
+        "max": values[-1],
+    }
+    for q in PERCENTILES:
+        summary[f"p{q}"] = percentile(values, q)
+    return summary
+
+
+def _body_size(body):
+    # bytes, str и PayloadStream знают свой размер, генераторы — нет
+    try:
+        return len(body)
+    except TypeError:
+        return 0
+
+
+class LatencyRecorder:
+    """
+    Сборщик замеров запросов и времени ожидания (wait_until).
+
+    Пример:
+        recorder = LatencyRecorder()
+        recorder.attach(client)
+        recorder.current_test = "test_x"
+        ...
+        recorder.by_endpoint()
+    """
+
+    def __init__(self):
+        self.records = []
+        self.waits = {}
+        self.current_test = None
+        self._templates = {}
+        self._lock = threading.Lock()
+        WAIT_OBSERVERS.append(self.on_wait)
+
+    def close(self):
+        if self.on_wait in WAIT_OBSERVERS:
+            WAIT_OBSERVERS.remove(self.on_wait)
+
+    def attach(self, client):
+        """Подключает хуки к сессиям клиента и запоминает шаблоны его эндпоинтов."""
+        for name, url in client.urls.items():
+            if "{" not in url:
+                self._templates[urlsplit(url).path] = ENDPOINTS[name]
+        self._templates[urlsplit(client.base_url).path] = ""
+        for session in (client.session, client.transfer_session):
+            session.hooks["response"].append(self.on_response)
+        return client
+
+    def detach(self, client):
+        """Отключает хуки от сессий клиента."""
+        for session in (client.session, client.transfer_session):
+            if self.on_response in session.hooks["response"]:
+                session.hooks["response"].remove(self.on_response)
+
+    def endpoint(self, method, url):
+        """Шаблон эндпоинта по URL: ``/resources``, ``/operations/{operation_id}``..."""
+        path = urlsplit(url).path
+        template = self._templates.get(path)
+        if template is not None:
+            return template
+        if "/operations/" in path:
+            return ENDPOINTS["operation"]
+        return TRANSFER_TEMPLATES.get(method, "<other>")
+
+    def on_response(self, response, *args, **kwargs):
+        request = response.request
+        self.records.append(
+            RequestRecord(
+                self.current_test,
+                self.endpoint(request.method, request.url),
+                request.method,
+                response.status_code,
+                _body_size(request.body),
+                int(response.headers.get("Content-Length") or 0),
+                response.elapsed.total_seconds(),
+            )
+        )
+
+    def on_wait(self, seconds):
+        with self._lock:
+            self.waits[self.current_test] = (
+                self.waits.get(self.current_test, 0) + seconds
+            )
+
+    def by_endpoint(self):
+        """Сводка задержек по «METHOD шаблон»."""
+        groups = {}
+        for record in self.records:
+            groups.setdefault(f"{record.method} {record.endpoint}", []).append(
+                record.latency
+            )
+        return {key: summarize(values) for key, values in sorted(groups.items())}
+
+    def by_test(self):
+        """Сводка задержек и ожидания по тестам."""
+        groups = {}
+        for record in self.records:
+            groups.setdefault(record.test, []).append(record.latency)
+        return {
+            test: {**summarize(values), "wait": self.waits.get(test, 0.0)}
+            for test, values in groups.items()
+        }
+
+    def dump(self):
+        """Сериализуемое состояние (для передачи с воркеров xdist)."""
+        return {
+            "records": [record.to_tuple() for record in self.records],
+            "waits": self.waits,
+        }
+
+    def load(self, data):
+        """Добавляет состояние, полученное через dump()."""
+        self.records.extend(RequestRecord(*record) for record in data["records"])
+        for test, seconds in data["waits"].items():
+            self.waits[test] = self.waits.get(test, 0) + seconds
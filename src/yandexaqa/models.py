@@ -0,0 +1,131 @@
+"""Легковесные модели ответов API.
+
+Модели используют ``__slots__``: они создаются на каждый ответ, поэтому
+не держат ``__dict__`` и хранят только известные поля. Отсутствующие в
+ответе поля (например, отсечённые параметром ``fields``) равны None.
+
+Элементы ``_embedded.items`` превращаются в модели лениво (LazyList):
+страница на тысячу элементов, из которой читаются два, не создаёт
+тысячу объектов Resource.
+"""
+
+from collections.abc import Sequence
+
+
+class LazyList(Sequence):
+    """
+    Последовательность моделей поверх списка JSON-объектов: модель
+    создаётся factory при первом обращении к элементу и запоминается.
+    """
+
+    __slots__ = ("_data", "_factory", "_built")
+
+    def __init__(self, data, factory):
+        self._data = data
+        self._factory = factory
+        self._built = {}
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._data)))]
+        index = range(len(self._data))[index]
+        item = self._built.get(index)
+        if item is None:
+            item = self._built[index] = self._factory(self._data[index])
+        return item
+
+    def __eq__(self, other):
+        if isinstance(other, (LazyList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class _Model:
+    __slots__ = ()
+
+    @classmethod
+    def from_json(cls, data):
+        obj = cls.__new__(cls)
+        for name in cls.__slots__:
+            setattr(obj, name, data.get(name))
+        return obj
+
+    @classmethod
+    def from_response(cls, response):
+        return cls.from_json(response.json())
+
+    def __repr__(self):
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name in self.__slots__
+            if getattr(self, name) is not None
+        )
+        return f"{type(self).__name__}({fields})"
+
+
+class Link(_Model):
+    """Ссылка из ответа API: на загрузку, скачивание, ресурс или операцию."""
+
+    __slots__ = ("href", "method", "templated", "operation_id")
+
+    @property
+    def is_operation(self):
+        return bool(self.href) and "/operations/" in self.href
+
+
+class Operation(_Model):
+    """Статус асинхронной операции."""
+
+    __slots__ = ("status",)
+
+
+class ResourceList(_Model):
+    """Страница вложенных ресурсов (``_embedded``)."""
+
+    __slots__ = ("items", "limit", "offset", "total", "path", "sort")
+
+    @classmethod
+    def from_json(cls, data):
+        obj = super().from_json(data)
+        obj.items = LazyList(data.get("items") or [], Resource.from_json)
+        return obj
+
+
+class Resource(_Model):
+    """Файл или папка на Диске, в корзине или по публичной ссылке."""
+
+    __slots__ = (
+        "path",
+        "type",
+        "name",
+        "size",
+        "md5",
+        "sha256",
+        "mime_type",
+        "media_type",
+        "created",
+        "modified",
+        "preview",
+        "public_key",
+        "public_url",
+        "origin_path",
+        "deleted",
+        "embedded",
+    )
+
+    @classmethod
+    def from_json(cls, data):
+        obj = super().from_json(data)
+        embedded = data.get("_embedded")
+        obj.embedded = ResourceList.from_json(embedded) if embedded else None
+        return obj
+
+    @property
+    def is_dir(self):
+        return self.type == "dir"
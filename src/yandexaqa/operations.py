@@ -0,0 +1,145 @@
+"""Ожидание асинхронных операций Яндекс.Диска.
+
+Долгие запросы (копирование папок, удаление, очистка корзины) отвечают
+кодом 202 и ссылкой на ``/v1/disk/operations/{id}``. Вместо фиксированных
+``time.sleep`` статус операции опрашивается с экспоненциальной задержкой
+до получения ``success``/``failed`` или до истечения таймаута.
+"""
+
+import time
+
+DEFAULT_TIMEOUT = 30.0
+INITIAL_DELAY = 0.1
+MAX_DELAY = 2.0
+BACKOFF_FACTOR = 2.0
+
+SUCCESS = "success"
+FAILED = "failed"
+
+# Функции observer(seconds), которые вызываются после каждой паузы
+# wait_until (например, для учета времени ожидания в отчете о времени)
+WAIT_OBSERVERS = []
+
+
+class OperationError(Exception):
+    """Асинхронная операция завершилась со статусом ``failed``."""
+
+
+class OperationTimeoutError(TimeoutError):
+    """Не дождались результата до истечения таймаута."""
+
+
+def _backoff(initial_delay, max_delay, factor):
+    """Бесконечная последовательность задержек: initial, initial*factor, ... <= max."""
+    delay = initial_delay
+    while True:
+        yield delay
+        delay = min(delay * factor, max_delay)
+
+
+def operation_href(link):
+    """
+    Возвращает ссылку на операцию из ответа 202, словаря Link или строки.
+    Для синхронных ответов (200/201/204) возвращает None.
+    """
+    if link is None or isinstance(link, str):
+        return link
+
+    if hasattr(link, "status_code"):
+        if link.status_code != 202:
+            return None
+        link = link.json()
+
+    href = link.get("href")
+    if href and "/operations/" in href:
+        return href
+    return None
+
+
+def wait_until(
+    condition,
+    timeout=DEFAULT_TIMEOUT,
+    initial_delay=INITIAL_DELAY,
+    max_delay=MAX_DELAY,
+    factor=BACKOFF_FACTOR,
+    message="Условие не выполнилось",
+):
+    """
+    Опрашивает ``condition()`` до получения истинного значения и возвращает его.
+
+    Первая проверка выполняется сразу, далее с экспоненциально растущей
+    задержкой, не выходя за общий дедлайн.
+
+    Аргументы:
+        condition (callable): Функция без аргументов; ложный результат означает
+            «ещё не готово».
+        timeout (float): Максимальное время ожидания в секундах.
+        initial_delay (float): Первая пауза между проверками.
+        max_delay (float): Верхняя граница паузы.
+        factor (float): Множитель роста паузы.
+        message (str): Текст исключения при таймауте.
+    """
+    deadline = time.monotonic() + timeout
+    delays = _backoff(initial_delay, max_delay, factor)
+
+    while True:
+        result = condition()
+        if result:
+            return result
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise OperationTimeoutError(f"{message} за {timeout} с")
+
+        delay = min(next(delays), remaining)
+        time.sleep(delay)
+        for observer in WAIT_OBSERVERS:
+            observer(delay)
+
+
+def get_operation_status(session, href):
+    """Возвращает текущий статус операции (``success``, ``failed``, ``in-progress``)."""
+    response = session.get(href)
+    response.raise_for_status()
+    return response.json()["status"]
+
+
+def wait_for_operation(
+    session,
+    link,
+    timeout=DEFAULT_TIMEOUT,
+    initial_delay=INITIAL_DELAY,
+    max_delay=MAX_DELAY,
+    factor=BACKOFF_FACTOR,
+):
+    """
+    Дожидается завершения асинхронной операции.
+
+    Аргументы:
+        session (requests.Session): Сессия с заголовком авторизации.
+        link: Ответ на запрос, словарь Link или ссылка на операцию. Если
+            операция синхронная (ответ не 202), функция сразу возвращает ``success``.
+
+    Возвращает статус ``success``; при ``failed`` выбрасывает OperationError,
+    при истечении таймаута — OperationTimeoutError.
+    """
+    href = operation_href(link)
+    if href is None:
+        return SUCCESS
+
+    def finished():
+        status = get_operation_status(session, href)
+        return status if status in (SUCCESS, FAILED) else None
+
+    status = wait_until(
+        finished,
+        timeout=timeout,
+        initial_delay=initial_delay,
+        max_delay=max_delay,
+        factor=factor,
+        message=f"Операция {href} не завершилась",
+    )
+
+    if status == FAILED:
+        raise OperationError(f"Операция {href} завершилась с ошибкой")
+    return status
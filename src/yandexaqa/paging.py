@@ -0,0 +1,140 @@
+"""Ленивый постраничный обход списков ``_embedded.items``.
+
+Итераторы запрашивают страницы через ``limit``/``offset`` по мере
+потребления элементов и держат в памяти не больше двух страниц: текущую
+и следующую, которая загружается в фоне, пока вызывающий код
+обрабатывает текущую. Поэтому обход папки с десятками тысяч элементов
+занимает постоянный объём памяти, а ожидание сети перекрывается с
+обработкой.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from yandexaqa.models import Resource
+
+PAGE_SIZE = 100
+
+
+class PageError(Exception):
+    """Страницу списка не удалось получить."""
+
+    def __init__(self, response):
+        self.response = response
+        super().__init__(
+            f"Не удалось получить страницу: {response.status_code} {response.text}"
+        )
+
+
+def embedded_fields(fields):
+    """
+    Превращает поля элементов в проекцию для ``fields``:
+    ``"name,size"`` -> ``"_embedded.items.name,_embedded.items.size,_embedded.total"``.
+    """
+    if not fields:
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    projection = [f"_embedded.items.{field.strip()}" for field in fields]
+    return ",".join(projection + ["_embedded.total"])
+
+
+def read_page(fetch, offset=0, page_size=PAGE_SIZE, projection=None):
+    """
+    Читает одну страницу списка ``_embedded.items``.
+
+    Аргументы:
+        fetch: Функция fetch(limit=..., offset=..., fields=...) -> Response.
+        offset (int): Смещение страницы.
+        projection (str): Значение ``fields`` (см. embedded_fields).
+
+    Возвращает (элементы страницы в виде словарей, смещение следующей
+    страницы или None для последней). Ошибка — PageError.
+    """
+    response = fetch(limit=page_size, offset=offset, fields=projection)
+    if response.status_code != 200:
+        raise PageError(response)
+    page = response.json().get("_embedded") or {}
+    items = page.get("items") or []
+    following = offset + len(items)
+    total = page.get("total")
+    if len(items) == page_size and (total is None or following < total):
+        return items, following
+    return items, None
+
+
+def iter_items(fetch, page_size=PAGE_SIZE, fields=None, prefetch=True):
+    """
+    Генератор элементов ``_embedded.items`` в виде моделей Resource.
+
+    Аргументы:
+        fetch: Функция fetch(limit=..., offset=..., fields=...) -> Response.
+        page_size (int): Размер страницы (limit).
+        fields: Поля элементов (строка через запятую или список);
+            по умолчанию элементы возвращаются целиком.
+        prefetch (bool): Загружать следующую страницу в фоне.
+
+    Если страница вернулась с ошибкой, выбрасывает PageError.
+    """
+    projection = embedded_fields(fields)
+
+    def load(offset):
+        return read_page(fetch, offset, page_size, projection)
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        items, offset = load(0)
+        while True:
+            following = None
+            if offset is not None and executor is not None:
+                following = executor.submit(load, offset)
+
+            for item in items:
+                yield Resource.from_json(item)
+
+            if offset is None:
+                return
+            items, offset = (
+                following.result() if following is not None else load(offset)
+            )
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_resources(
+    client, path, page_size=PAGE_SIZE, fields=None, prefetch=True, **params
+):
+    """Элементы папки на Диске (GET /resources)."""
+
+    def fetch(**page):
+        return client.get_meta(path, **params, **page)
+
+    return iter_items(fetch, page_size, fields, prefetch)
+
+
+def iter_trash(
+    client, path="/", page_size=PAGE_SIZE, fields=None, prefetch=True, **params
+):
+    """Элементы корзины или папки в корзине (GET /trash/resources)."""
+
+    def fetch(**page):
+        return client.get_trash(path, **params, **page)
+
+    return iter_items(fetch, page_size, fields, prefetch)
+
+
+def iter_public(
+    client,
+    public_key,
+    path=None,
+    page_size=PAGE_SIZE,
+    fields=None,
+    prefetch=True,
+    **params,
+):
+    """Элементы публичной папки (GET /public/resources)."""
+
+    def fetch(**page):
+        return client.get_public_meta(public_key, path=path, **params, **page)
+
+    return iter_items(fetch, page_size, fields, prefetch)
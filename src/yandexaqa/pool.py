@@ -0,0 +1,128 @@
+"""Пул заранее загруженных ресурсов только для чтения.
+
+Ресурсы загружаются один раз за сессию (на воркер) и раздаются
+фикстурами. Тесты, которые меняют ресурс, получают приватную копию,
+сделанную на стороне сервера через ``/resources/copy``, без повторной
+загрузки содержимого.
+
+Ресурсы для тестов публичного доступа публикуются один раз
+(``ResourcePool.publish``): все сразу, с параллельным ожиданием
+появления ``public_url``, вместо публикации и ожидания в каждом тесте.
+Публичный ключ и ссылка запоминаются при публикации, поэтому тестам не
+нужно запрашивать их перед каждым обращением к ``/public/resources``.
+"""
+
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from yandexaqa.operations import OperationTimeoutError, wait_until
+from yandexaqa.upload import UploadError, upload_many
+
+PUBLISH_TIMEOUT = 10.0
+
+
+class PoolError(Exception):
+    """Не удалось подготовить ресурс пула."""
+
+
+class ResourcePool:
+    """
+    Набор именованных ресурсов в папке ``root``.
+
+    Пример:
+        pool = ResourcePool(client, "/aqa_run_gw0/pool").create()
+        pool.add_file("text", "file.txt", b"...")
+        client.get_meta(pool["text"])
+    """
+
+    def __init__(self, client, root):
+        self.client = client
+        self.root = root
+        self.paths = {}
+        # Имя ресурса -> Resource с public_key и public_url
+        self.public = {}
+
+    def __getitem__(self, name):
+        return self.paths[name]
+
+    def create(self):
+        response = self.client.create_folder(self.root)
+        if response.status_code not in [201, 409]:
+            raise PoolError(
+                f"Не удалось создать папку пула {self.root}: {response.text}"
+            )
+        return self
+
+    def add_file(self, name, file_name, data):
+        """Загружает файл в корень пула и регистрирует его под именем name."""
+        path = f"{self.root}/{file_name}"
+        response = self.client.upload(path, data)
+        if response.status_code not in [201, 202]:
+            raise PoolError(f"Не удалось загрузить {path}: {response.text}")
+        self.paths[name] = path
+        return path
+
+    def add_folder(self, name, folder_name, files):
+        """
+        Создает папку с файлами и регистрирует ее под именем name.
+
+        Файлы загружаются параллельно (см. upload_many).
+
+        Аргументы:
+            files (dict): Имя файла -> содержимое (bytes или str).
+        """
+        path = f"{self.root}/{folder_name}"
+        response = self.client.create_folder(path)
+        if response.status_code not in [201, 409]:
+            raise PoolError(f"Не удалось создать папку {path}: {response.text}")
+        try:
+            upload_many(
+                self.client,
+                ((f"{path}/{file_name}", data) for file_name, data in files.items()),
+            )
+        except UploadError as error:
+            raise PoolError(str(error)) from error
+        self.paths[name] = path
+        return path
+
+    def private_copy(self, name, target_dir, prefix=None):
+        """
+        Копирует ресурс пула в target_dir под уникальным именем и дожидается
+        окончания копирования. Возвращает путь к копии.
+        """
+        source = self.paths[name]
+        source_name = source.rsplit("/", 1)[-1]
+        stem, dot, ext = source_name.partition(".")
+        copy_name = f"{prefix or stem}_{uuid.uuid4().hex[:8]}{dot}{ext}"
+        target = f"{target_dir}/{copy_name}"
+
+        response = self.client.copy(source, target)
+        if response.status_code not in [201, 202]:
+            raise PoolError(f"Не удалось скопировать {source}: {response.text}")
+        self.client.wait_for_operation(response)
+        return target
+
+    def publish(self, *names, timeout=PUBLISH_TIMEOUT):
+        """
+        Публикует ресурсы пула параллельно и дожидается появления
+        public_url у каждого. Возвращает словарь имя -> Resource с path,
+        public_key и public_url (см. DiskClient.resolve_public).
+        """
+        with ThreadPoolExecutor(max_workers=max(len(names), 1)) as executor:
+            links = list(executor.map(lambda name: self._publish(name, timeout), names))
+        self.public.update(zip(names, links))
+        return dict(zip(names, links))
+
+    def _publish(self, name, timeout):
+        path = self.paths[name]
+        response = self.client.publish(path)
+        if response.status_code not in [200, 201, 202]:
+            raise PoolError(f"Не удалось опубликовать {path}: {response.text}")
+        try:
+            return wait_until(
+                lambda: self.client.resolve_public(path, refresh=True),
+                timeout=timeout,
+                message=f"{path} не опубликовался",
+            )
+        except OperationTimeoutError as error:
+            raise PoolError(str(error)) from error
@@ -0,0 +1,95 @@
+"""Плагин pytest: учёт прочитанных полей ответов и проекции ``fields``.
+
+``--fields-report`` выводит для каждого места вызова (тест, фикстура или
+хелпер, из которого запрошен ресурс) число запросов, средний размер
+ответа и минимальную проекцию ``fields``. ``--fields-learn=PATH``
+сохраняет проекции в JSON, ``--fields-apply=PATH`` подставляет их в
+запросы без явного ``fields``. При запуске через pytest-xdist учёт
+воркеров собирается на контроллере.
+"""
+
+import pytest
+
+from yandexaqa.fields import FieldTracker, load_learned
+
+WORKER_OUTPUT_KEY = "aqa_fields"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("fields", "Проекции fields для ответов API")
+    group.addoption(
+        "--fields-report",
+        action="store_true",
+        help="Вывести прочитанные тестами поля ответов и проекции fields",
+    )
+    group.addoption(
+        "--fields-learn",
+        metavar="PATH",
+        default=None,
+        help="Сохранить проекции fields по местам вызова в JSON",
+    )
+    group.addoption(
+        "--fields-apply",
+        metavar="PATH",
+        default=None,
+        help="Подставлять проекции fields из JSON в запросы без явного fields",
+    )
+
+
+def pytest_configure(config):
+    if (
+        config.getoption("--fields-report")
+        or config.getoption("--fields-learn")
+        or config.getoption("--fields-apply")
+    ):
+        config.pluginmanager.register(FieldsPlugin(config), "aqa-fields")
+
+
+@pytest.fixture(scope="session")
+def fields_tracker(pytestconfig):
+    """
+    Фикстура учёта полей или None, если плагин не включен.
+    Клиенты подключаются к нему через tracker.attach(client).
+    """
+    plugin = pytestconfig.pluginmanager.get_plugin("aqa-fields")
+    return plugin.tracker if plugin else None
+
+
+def _kb(size):
+    return f"{size / 1024:8.1f}"
+
+
+class FieldsPlugin:
+    def __init__(self, config):
+        self.config = config
+        path = config.getoption("--fields-apply")
+        self.tracker = FieldTracker(
+            learned=load_learned(path) if path else None, root=str(config.rootpath)
+        )
+        self.is_worker = hasattr(config, "workerinput")
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        data = getattr(node, "workeroutput", {}).get(WORKER_OUTPUT_KEY)
+        if data:
+            self.tracker.load(data)
+
+    def pytest_sessionfinish(self, session):
+        if self.is_worker:
+            self.config.workeroutput[WORKER_OUTPUT_KEY] = self.tracker.dump()
+            return
+        path = self.config.getoption("--fields-learn")
+        if path:
+            self.tracker.dump_learned(path)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.is_worker or not self.config.getoption("--fields-report"):
+            return
+        write = terminalreporter.write_line
+        terminalreporter.section("Прочитанные поля ответов")
+        write(f"{'N':>6} {'КБ/отв':>8}  место вызова -> fields")
+        for site, stats in self.tracker.report().items():
+            fields = stats["fields"] or "(весь ответ или ничего)"
+            applied = " [применено]" if stats["applied"] else ""
+            write(f"{stats['calls']:>6} {_kb(stats['mean_bytes'])}  {site}{applied}")
+            write(f"{'':>16}-> {fields}")
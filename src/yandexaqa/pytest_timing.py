@@ -0,0 +1,135 @@
+"""Плагин pytest: отчет о времени запросов к API и тестов.
+
+Включается опциями ``--latency-report`` (сводка в терминале) и
+``--latency-json=PATH`` (экспорт в JSON). Для каждого эндпоинта
+считаются p50/p95/p99 задержки, для каждого теста — время фаз
+setup/call/teardown, суммарное время запросов и ожидания в wait_until.
+При запуске через pytest-xdist замеры воркеров собираются на
+контроллере.
+"""
+
+import json
+
+import pytest
+
+from yandexaqa.metrics import LatencyRecorder, summarize
+
+WORKER_OUTPUT_KEY = "aqa_latency"
+SLOWEST_TESTS = 10
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("latency", "Замеры времени запросов к API")
+    group.addoption(
+        "--latency-report",
+        action="store_true",
+        help="Вывести перцентили задержек по эндпоинтам и самые долгие тесты",
+    )
+    group.addoption(
+        "--latency-json",
+        metavar="PATH",
+        default=None,
+        help="Сохранить замеры по эндпоинтам и тестам в JSON",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--latency-report") or config.getoption("--latency-json"):
+        config.pluginmanager.register(TimingPlugin(config), "aqa-timing")
+
+
+@pytest.fixture(scope="session")
+def latency_recorder(pytestconfig):
+    """
+    Фикстура сборщика замеров или None, если отчет о времени не включен.
+    Клиенты подключаются к нему через recorder.attach(client).
+    """
+    plugin = pytestconfig.pluginmanager.get_plugin("aqa-timing")
+    return plugin.recorder if plugin else None
+
+
+def _ms(seconds):
+    return f"{seconds * 1000:8.1f}" if seconds is not None else f"{'-':>8}"
+
+
+class TimingPlugin:
+    def __init__(self, config):
+        self.config = config
+        self.recorder = LatencyRecorder()
+        self.phases = {}
+        self.is_worker = hasattr(config, "workerinput")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        self.recorder.current_test = item.nodeid
+        yield
+        self.recorder.current_test = None
+
+    def pytest_runtest_logreport(self, report):
+        # На контроллере xdist сюда приходят и отчеты воркеров
+        if not self.is_worker:
+            self.phases.setdefault(report.nodeid, {})[report.when] = report.duration
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        data = getattr(node, "workeroutput", {}).get(WORKER_OUTPUT_KEY)
+        if data:
+            self.recorder.load(data)
+
+    def report(self):
+        """Сводка в виде словаря для JSON и терминала."""
+        requests = self.recorder.by_test()
+        tests = {}
+        for nodeid in self.phases.keys() | requests.keys():
+            phases = self.phases.get(nodeid, {})
+            stats = requests.get(nodeid, {"count": 0, "wait": 0.0})
+            tests[nodeid or "<session>"] = {
+                **phases,
+                "duration": sum(phases.values()),
+                "requests": stats["count"],
+                "network": stats.get("total", 0.0),
+                "wait": stats["wait"],
+                **{key: stats[key] for key in ("p50", "p95", "p99") if key in stats},
+            }
+        return {
+            "requests": summarize(record.latency for record in self.recorder.records),
+            "endpoints": self.recorder.by_endpoint(),
+            "tests": tests,
+        }
+
+    def pytest_sessionfinish(self, session):
+        if self.is_worker:
+            self.config.workeroutput[WORKER_OUTPUT_KEY] = self.recorder.dump()
+            return
+        path = self.config.getoption("--latency-json")
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.report(), f, ensure_ascii=False, indent=2)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.is_worker or not self.config.getoption("--latency-report"):
+            return
+        report = self.report()
+        write = terminalreporter.write_line
+
+        terminalreporter.section("Задержки запросов API, мс")
+        write(f"{'эндпоинт':<40} {'N':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+        for endpoint, stats in report["endpoints"].items():
+            write(
+                f"{endpoint:<40} {stats['count']:>6} {_ms(stats['p50'])} "
+                f"{_ms(stats['p95'])} {_ms(stats['p99'])} {_ms(stats['max'])}"
+            )
+
+        terminalreporter.section("Самые долгие тесты, мс")
+        write(f"{'всего':>8} {'сеть':>8} {'ожид.':>8} {'setup':>8}  тест")
+        slowest = sorted(
+            report["tests"].items(), key=lambda item: item[1]["duration"], reverse=True
+        )
+        for nodeid, stats in slowest[:SLOWEST_TESTS]:
+            write(
+                f"{_ms(stats['duration'])} {_ms(stats['network'])} "
+                f"{_ms(stats['wait'])} {_ms(stats.get('setup'))}  {nodeid}"
+            )
+
+    def pytest_unconfigure(self, config):
+        self.recorder.close()
@@ -0,0 +1,197 @@
+"""Ограничение частоты запросов и повтор при 429/423/503.
+
+Вместо пауз «чтобы не получить 423» перед запросами сессия пропускает
+каждый запрос через RateLimiter:
+
+* TokenBucket ограничивает частоту запросов с одним OAuth-токеном
+  (общий для всех сессий процесса с этим токеном, см. bucket_for);
+* ответы 429/423/503 повторяются с паузой из заголовка ``Retry-After``,
+  а без него — с экспоненциальной задержкой. Пауза после 429 и 503
+  действует на весь bucket: остальные потоки с тем же токеном тоже
+  ждут, а не получают свои 429. 503 может прийти и на запрос, который
+  сервер уже начал выполнять, поэтому он повторяется только для
+  идемпотентных методов (не для POST copy/move).
+
+Ожидание токена, как и паузы повторов, передаётся WAIT_OBSERVERS.
+
+Без заданной частоты bucket не ограничивает запросы, и они идут так
+быстро, как позволяет сервис: притормаживают только его ответы 429.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from yandexaqa.operations import WAIT_OBSERVERS, _backoff
+
+RETRY_STATUSES = frozenset({423, 429, 503})
+# Статусы, при которых притормаживает весь bucket, а не только один запрос:
+# 423 означает блокировку конкретного ресурса (например, корзины)
+THROTTLE_STATUSES = frozenset({429, 503})
+# Статусы, при которых запрос мог быть выполнен: повторяются только
+# идемпотентные методы
+UNSAFE_RETRY_STATUSES = frozenset({503})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+MAX_RETRIES = 8
+RETRY_TIMEOUT = 30.0
+INITIAL_DELAY = 0.1
+MAX_DELAY = 2.0
+BACKOFF_FACTOR = 2.0
+
+
+class TokenBucket:
+    """
+    Потокобезопасный token bucket: в среднем rate запросов в секунду,
+    до burst запросов подряд. При rate=None токены не ограничены, но
+    пауза (pause) действует. Часы clock и ожидание sleep подменяются в
+    тестах.
+    """
+
+    def __init__(self, rate=None, burst=None, clock=time.monotonic, sleep=time.sleep):
+        if rate is not None and rate <= 0:
+            raise ValueError("rate должен быть положительным")
+        self.rate = rate
+        self.burst = burst or max(1, rate or 1)
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = self.burst
+        self.updated = clock()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Забирает токен и возвращает, сколько секунд ждать до его выдачи."""
+        with self._lock:
+            now = self.clock()
+            if self.rate is None:
+                return self.blocked_until - now
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            # Токен берётся в долг: следующие запросы встают в очередь за ним
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(delay, self.blocked_until - now)
+
+    def acquire(self):
+        """Ждёт свой токен; возвращает время ожидания в секундах."""
+        delay = self.reserve()
+        if delay > 0:
+            self.sleep(delay)
+            for observer in WAIT_OBSERVERS:
+                observer(delay)
+        return delay
+
+    def pause(self, seconds):
+        """Не выдаёт токены ближайшие seconds секунд (после 429 и 503)."""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, self.clock() + seconds)
+
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def bucket_for(token, rate, burst=None):
+    """Общий для процесса bucket токена (None для запросов без токена)."""
+    with _buckets_lock:
+        key = (token, rate, burst)
+        if key not in _buckets:
+            _buckets[key] = TokenBucket(rate, burst)
+        return _buckets[key]
+
+
+def retry_after(response):
+    """
+    Пауза из заголовка ``Retry-After`` в секундах (число секунд или
+    HTTP-дата) или None, если заголовка нет или он не разобран.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (moment - datetime.now(timezone.utc)).total_seconds())
+
+
+def _idempotent(response):
+    """Идемпотентен ли метод запроса ответа (requests и httpx)."""
+    method = getattr(response.request, "method", None)
+    return method is None or method.upper() in IDEMPOTENT_METHODS
+
+
+class RateLimiter:
+    """
+    Ограничение частоты и повтор запросов для одного токена.
+
+    Аргументы:
+        token (str): OAuth-токен; ограничение частоты общее для токена.
+        rate (float): Запросов в секунду; None — без ограничения частоты.
+        burst (int): Число запросов подряд без ожидания (по умолчанию rate).
+        retries (int): Максимум повторов одного запроса.
+        timeout (float): Максимальное суммарное ожидание повторов одного запроса.
+    """
+
+    def __init__(
+        self,
+        token=None,
+        rate=None,
+        burst=None,
+        retries=MAX_RETRIES,
+        timeout=RETRY_TIMEOUT,
+    ):
+        self.bucket = bucket_for(token, rate, burst)
+        self.retries = retries
+        self.timeout = timeout
+
+    def retry_delay(self, response, attempt, deadline, delays):
+        """
+        Пауза перед повтором ответа или None, если повторять не нужно:
+        статус не из RETRY_STATUSES, 503 на неидемпотентный запрос,
+        исчерпаны повторы или пауза выходит за deadline. После 429 и 503
+        пауза действует на весь bucket.
+        """
+        if response.status_code not in RETRY_STATUSES or attempt >= self.retries:
+            return None
+        if response.status_code in UNSAFE_RETRY_STATUSES and not _idempotent(response):
+            return None
+        delay = retry_after(response)
+        if delay is None:
+            delay = next(delays)
+        if time.monotonic() + delay > deadline:
+            return None
+        if response.status_code in THROTTLE_STATUSES:
+            self.bucket.pause(delay)
+        return delay
+
+    def call(self, send):
+        """
+        Выполняет send() с ограничением частоты и повторяет его, пока ответ
+        в RETRY_STATUSES и не исчерпаны повторы или таймаут. Возвращает
+        последний ответ.
+        """
+        deadline = time.monotonic() + self.timeout
+        delays = _backoff(INITIAL_DELAY, MAX_DELAY, BACKOFF_FACTOR)
+        attempt = 0
+
+        while True:
+            self.bucket.acquire()
+            response = send()
+            delay = self.retry_delay(response, attempt, deadline, delays)
+            if delay is None:
+                return response
+
+            response.close()
+            attempt += 1
+            time.sleep(delay)
+            for observer in WAIT_OBSERVERS:
+                observer(delay)
@@ -0,0 +1,154 @@
+"""Учёт и гарантированное удаление тестовых ресурсов.
+
+Фикстуры регистрируют всё, что создают, в ResourceRegistry, а в конце
+сессии реестр удаляет ресурсы одним пакетом: параллельными DELETE с
+``permanently=true`` (без засорения корзины) и ожиданием асинхронных
+операций. Вложенные пути не удаляются отдельно, если зарегистрирована
+папка выше по дереву.
+
+sweep() находит в корне Диска ресурсы с тестовыми префиксами, оставшиеся
+от аварийно завершённых прогонов, и удаляет их тем же способом.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import requests
+
+from yandexaqa.operations import DEFAULT_TIMEOUT, OperationError
+from yandexaqa.paging import iter_resources
+from yandexaqa.sandbox import SANDBOX_PREFIX
+
+MAX_WORKERS = 8
+
+# Префиксы ресурсов, которые тесты создают в корне Диска: папки воркеров
+# и пути, которые создавали тесты до появления папок воркеров.
+SWEEP_PREFIXES = (
+    SANDBOX_PREFIX,
+    "test_folder_",
+    "test_file_",
+    "test_image_",
+    "copy_of_folder_",
+    "overwrite_test_file_",
+)
+
+
+def _normalize(path):
+    path = path.split(":", 1)[1] if path.startswith("disk:") else path
+    return "/" + path.strip("/")
+
+
+def _ancestors(path):
+    parts = path.strip("/").split("/")
+    return ["/" + "/".join(parts[:i]) for i in range(len(parts))]
+
+
+def collapse(paths):
+    """Оставляет только пути, ни одна из папок-предков которых не входит в paths."""
+    kept = set()
+    result = []
+    # Предки сортируются раньше потомков, поэтому к моменту проверки пути
+    # все его зарегистрированные предки уже просмотрены
+    for path in sorted(set(map(_normalize, paths))):
+        if path == "/" or not kept.intersection(_ancestors(path)):
+            kept.add(path)
+            result.append(path)
+    return result
+
+
+class ResourceRegistry:
+    """
+    Потокобезопасный реестр путей, удаляемых в конце сессии.
+
+    Пример:
+        registry = ResourceRegistry(client)
+        path = registry.register("/aqa_run_main/test_folder_1")
+        ...
+        failed = registry.purge()
+    """
+
+    def __init__(self, client, max_workers=MAX_WORKERS, timeout=DEFAULT_TIMEOUT):
+        self.client = client
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.paths = set()
+        self._lock = threading.Lock()
+
+    def register(self, path):
+        """Регистрирует путь и возвращает его."""
+        with self._lock:
+            self.paths.add(path)
+        return path
+
+    def discard(self, path):
+        """Снимает путь с учёта (например, если тест уже удалил его сам)."""
+        with self._lock:
+            self.paths.discard(path)
+
+    def _delete(self, path):
+        response = self.client.remove(path, permanently=True)
+        if response.status_code == 404:
+            return None
+        if response.status_code not in [202, 204]:
+            return f"{response.status_code} {response.text}"
+        try:
+            self.client.wait_for_operation(response, timeout=self.timeout)
+        except (OperationError, TimeoutError, requests.HTTPError) as error:
+            return str(error)
+        return None
+
+    def purge(self):
+        """
+        Удаляет все зарегистрированные ресурсы и очищает реестр.
+        Возвращает словарь путь -> описание ошибки для неудалённых путей.
+        """
+        with self._lock:
+            paths = collapse(self.paths)
+            self.paths.clear()
+        if not paths:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            errors = dict(zip(paths, executor.map(self._delete, paths)))
+        return {path: error for path, error in errors.items() if error}
+
+
+def _created_before(item, deadline):
+    if deadline is None or not item.created:
+        return True
+    return datetime.fromisoformat(item.created) < deadline
+
+
+def find_orphans(client, prefixes=SWEEP_PREFIXES, exclude=(), older_than=None):
+    """
+    Возвращает пути ресурсов в корне Диска, имена которых начинаются
+    с prefixes и не начинаются с exclude.
+
+    Аргументы:
+        older_than (float): Учитывать только ресурсы, созданные раньше
+            указанного числа секунд назад (чтобы не задеть идущие прогоны).
+    """
+    deadline = None
+    if older_than is not None:
+        deadline = datetime.now(timezone.utc) - timedelta(seconds=older_than)
+    return [
+        _normalize(item.path)
+        for item in iter_resources(client, "/", fields="name,path,created")
+        if item.name.startswith(tuple(prefixes))
+        and not item.name.startswith(tuple(exclude))
+        and _created_before(item, deadline)
+    ]
+
+
+def sweep(client, prefixes=SWEEP_PREFIXES, exclude=(), older_than=None):
+    """
+    Удаляет ресурсы, оставшиеся от прошлых прогонов (см. find_orphans).
+    Возвращает (удалённые пути, словарь ошибок).
+    """
+    registry = ResourceRegistry(client)
+    orphans = find_orphans(client, prefixes, exclude, older_than)
+    for path in orphans:
+        registry.register(path)
+    errors = registry.purge()
+    return [path for path in orphans if path not in errors], errors
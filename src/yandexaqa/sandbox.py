@@ -0,0 +1,34 @@
+"""Изолированные пространства имён для параллельного запуска тестов.
+
+Каждый воркер pytest-xdist работает в своей корневой папке
+``/aqa_<run>_<worker>``, поэтому тесты разных воркеров не пересекаются
+по путям. Без xdist используется воркер ``main``.
+"""
+
+import uuid
+
+SANDBOX_PREFIX = "aqa_"
+MAIN_WORKER = "main"
+
+
+def worker_id(config):
+    """Возвращает id воркера xdist (``gw0``, ``gw1``...) или ``main``."""
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None:
+        return MAIN_WORKER
+    return workerinput["workerid"]
+
+
+def run_id(config):
+    """Возвращает id прогона, общий для всех воркеров одного запуска."""
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None:
+        if not hasattr(config, "_aqa_run_id"):
+            config._aqa_run_id = uuid.uuid4().hex
+        return config._aqa_run_id[:8]
+    return workerinput["testrunuid"][:8]
+
+
+def sandbox_root(config):
+    """Корневая папка воркера, например ``/aqa_1a2b3c4d_gw0``."""
+    return f"/{SANDBOX_PREFIX}{run_id(config)}_{worker_id(config)}"
@@ -0,0 +1,123 @@
+"""HTTP-сессия для REST API Яндекс.Диска."""
+
+import socket
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+from yandexaqa.jsoncodec import response_hook
+from yandexaqa.ratelimit import MAX_RETRIES, RateLimiter
+from yandexaqa.tls import shared_context
+
+DEFAULT_BASE_URL = "https://cloud-api.yandex.net/v1/disk"
+
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+# Ссылки на загрузку и скачивание ведут на много разных хостов: пулы
+# держатся для каждого из них, а не вытесняются после четырёх
+TRANSFER_POOL_HOSTS = 64
+TRANSFER_POOL_MAXSIZE = 16
+
+# TCP keep-alive, чтобы простаивающие соединения пула не закрывались
+# промежуточными узлами между тестами
+SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+]
+
+
+class PooledAdapter(HTTPAdapter):
+    """
+    Адаптер с пулом соединений на каждый хост, TCP keep-alive и общим
+    TLS-контекстом (yandexaqa.tls): корневые сертификаты загружаются один
+    раз на процесс, а TLS-сессии хостов возобновляются.
+
+    Общий контекст используется для запросов с проверкой сертификата по
+    его CA-бандлу (verify=True или тот же путь, что подставляет requests
+    из REQUESTS_CA_BUNDLE); остальные идут по обычному пути requests.
+    """
+
+    def __init__(self, *args, ssl_context=None, **kwargs):
+        self.ssl_context = ssl_context or shared_context()
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        pool_kwargs.setdefault("socket_options", SOCKET_OPTIONS)
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(
+            request, verify, cert
+        )
+        if (
+            verify in (True, self.ssl_context.cafile)
+            and cert is None
+            and host_params["scheme"] == "https"
+        ):
+            pool_kwargs["ssl_context"] = self.ssl_context
+            pool_kwargs.pop("ca_certs", None)
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        if conn.conn_kw.get("ssl_context") is self.ssl_context:
+            # Сертификаты уже в общем контексте: не загружаем их на
+            # каждое новое соединение
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
+
+def mount_pool(session, pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE):
+    """
+    Подключает к сессии адаптер с пулом соединений нужного размера.
+    pool_connections — число хостов, для которых хранятся пулы,
+    pool_maxsize — число соединений с одним хостом.
+    """
+    adapter = PooledAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class DiskSession(requests.Session):
+    """
+    Сессия с заголовками авторизации и настроенным пулом соединений.
+
+    Относительные URL (начинающиеся с ``/``) дополняются ``base_url``,
+    абсолютные (например, ссылки на операции) передаются как есть.
+
+    Запросы проходят через RateLimiter: rate_limit ограничивает частоту
+    запросов с токеном (None — без ограничения), ответы 429/423/503
+    повторяются до retries раз (0 — без повторов).
+
+    json() ответов разбирается один раз декодером json_backend (см.
+    yandexaqa.jsoncodec; по умолчанию orjson, если он установлен).
+    """
+
+    def __init__(
+        self,
+        token=None,
+        base_url=DEFAULT_BASE_URL,
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        rate_limit=None,
+        retries=MAX_RETRIES,
+        json_backend=None,
+    ):
+        super().__init__()
+        self.base_url = base_url.rstrip("/")
+        self.headers["Content-Type"] = "application/json"
+        if token:
+            self.headers["Authorization"] = f"OAuth {token}"
+        mount_pool(self, pool_connections, pool_maxsize)
+        self.limiter = RateLimiter(token, rate=rate_limit, retries=retries)
+        self.hooks["response"].append(response_hook(json_backend))
+
+    def request(self, method, url, *args, **kwargs):
+        if url.startswith("/"):
+            url = f"{self.base_url}{url}"
+        return self.limiter.call(
+            lambda: super(DiskSession, self).request(method, url, *args, **kwargs)
+        )
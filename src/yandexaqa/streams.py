@@ -0,0 +1,115 @@
+"""Потоковые тела запросов для загрузки файлов.
+
+Загрузка отправляет содержимое «сырым» телом PUT без multipart-обёртки
+и без временных файлов. Источник читается фрагментами фиксированного
+размера, поэтому расход памяти не зависит от размера файла:
+
+- bytes/str отправляются как есть;
+- файловые объекты и буферы (``mmap``, ``memoryview``, ``bytearray``)
+  передаются фрагментами с заголовком Content-Length;
+- прочие итерируемые объекты (генераторы) — через chunked-кодирование.
+"""
+
+import hashlib
+import io
+import os
+import random
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class PayloadStream:
+    """
+    Итерируемое тело запроса известного размера.
+
+    requests определяет размер через ``len()`` и отправляет Content-Length,
+    а само тело передаётся по мере итерации.
+    """
+
+    __slots__ = ("chunks", "size")
+
+    def __init__(self, chunks, size):
+        self.chunks = chunks
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return iter(self.chunks)
+
+
+def iter_file(fileobj, chunk_size=CHUNK_SIZE):
+    """Читает файловый объект фрагментами до конца."""
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_buffer(buffer, chunk_size=CHUNK_SIZE):
+    """Нарезает буфер (mmap, bytearray) на memoryview без копирования данных."""
+    view = memoryview(buffer).cast("B")
+    for offset in range(0, len(view), chunk_size):
+        yield view[offset : offset + chunk_size]
+
+
+def _remaining(fileobj):
+    """Размер непрочитанной части файла или None, если его не определить."""
+    try:
+        position = fileobj.tell()
+        size = os.fstat(fileobj.fileno()).st_size
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+    return size - position
+
+
+def as_body(source, chunk_size=CHUNK_SIZE):
+    """Превращает источник данных в тело PUT-запроса для requests."""
+    if source is None or isinstance(source, (bytes, str)):
+        return source
+    if hasattr(source, "read"):
+        size = _remaining(source)
+        if size is None:
+            return iter_file(source, chunk_size)
+        return PayloadStream(iter_file(source, chunk_size), size)
+    if isinstance(source, PayloadStream):
+        return source
+    try:
+        view = memoryview(source)
+    except TypeError:
+        return source
+    return PayloadStream(iter_buffer(view, chunk_size), view.nbytes)
+
+
+def _block(seed, chunk_size):
+    return random.Random(seed).randbytes(chunk_size)
+
+
+def synthetic_chunks(size, chunk_size=CHUNK_SIZE, seed=0):
+    """Генерирует size байт псевдослучайных данных, повторяя один блок."""
+    block = memoryview(_block(seed, chunk_size))
+    full, rest = divmod(size, chunk_size)
+    for _ in range(full):
+        yield block
+    if rest:
+        yield block[:rest]
+
+
+def synthetic_payload(size, chunk_size=CHUNK_SIZE, seed=0):
+    """
+    Тело запроса из size байт, сгенерированных на лету.
+    В памяти хранится только один блок размером chunk_size.
+    """
+    return PayloadStream(synthetic_chunks(size, chunk_size, seed), size)
+
+
+def synthetic_digests(size, chunk_size=CHUNK_SIZE, seed=0):
+    """Возвращает (md5, sha256) содержимого synthetic_payload с теми же параметрами."""
+    md5 = hashlib.md5()
+    sha256 = hashlib.sha256()
+    for chunk in synthetic_chunks(size, chunk_size, seed):
+        md5.update(chunk)
+        sha256.update(chunk)
+    return md5.hexdigest(), sha256.hexdigest()
@@ -0,0 +1,108 @@
+"""Общий TLS-контекст с возобновлением сессий.
+
+urllib3 по умолчанию создаёт SSLContext и загружает в него корневые
+сертификаты на каждое новое соединение, а TLS-сессии не переиспользует:
+каждое соединение с хостом загрузки — полное рукопожатие. Общий
+ResumableSSLContext создаётся один раз и запоминает TLS-сессию каждого
+хоста, поэтому новые соединения с уже знакомым хостом возобновляют
+сессию (сокращённое рукопожатие без передачи и проверки цепочки
+сертификатов).
+"""
+
+import os
+import ssl
+import threading
+import weakref
+
+from requests.utils import DEFAULT_CA_BUNDLE_PATH
+
+
+class _SessionSocket(ssl.SSLSocket):
+    """SSLSocket, который перед закрытием отдаёт свою TLS-сессию контексту."""
+
+    def _real_close(self):
+        if isinstance(self.context, ResumableSSLContext):
+            self.context.remember(self.server_hostname, self.session)
+        super()._real_close()
+
+
+class ResumableSSLContext(ssl.SSLContext):
+    """
+    SSLContext, который передаёт в wrap_socket последнюю известную
+    TLS-сессию того же хоста.
+
+    В TLS 1.3 билет сессии приходит уже после рукопожатия, поэтому
+    сессия запоминается при закрытии соединения, а пока соединений с
+    хостом не закрывалось — берётся у открытого соединения.
+    """
+
+    sslsocket_class = _SessionSocket
+
+    def __new__(cls, protocol=ssl.PROTOCOL_TLS_CLIENT, *args, **kwargs):
+        context = super().__new__(cls, protocol, *args, **kwargs)
+        context._sessions = {}
+        context._sockets = {}
+        context._lock = threading.Lock()
+        context.handshakes = 0
+        context.resumed = 0
+        return context
+
+    def remember(self, host, session):
+        """Сохраняет сессию хоста, если по ней можно возобновить соединение."""
+        if host is not None and session is not None and session.has_ticket:
+            with self._lock:
+                self._sessions[host] = session
+
+    def session_for(self, host):
+        """Последняя сохранённая сессия хоста или сессия открытого соединения."""
+        with self._lock:
+            if host in self._sessions:
+                return self._sessions[host]
+            ref = self._sockets.get(host)
+        sock = ref() if ref is not None else None
+        if sock is not None:
+            self.remember(host, sock.session)
+        return self._sessions.get(host)
+
+    def wrap_socket(self, sock, *args, server_hostname=None, session=None, **kwargs):
+        if session is None and server_hostname is not None:
+            session = self.session_for(server_hostname)
+        ssl_sock = super().wrap_socket(
+            sock, *args, server_hostname=server_hostname, session=session, **kwargs
+        )
+        with self._lock:
+            self.handshakes += 1
+            self.resumed += ssl_sock.session_reused
+            if server_hostname is not None:
+                self._sockets[server_hostname] = weakref.ref(ssl_sock)
+        return ssl_sock
+
+
+def default_cafile():
+    """CA-бандл, который requests использует по умолчанию (с учётом окружения)."""
+    return (
+        os.environ.get("REQUESTS_CA_BUNDLE")
+        or os.environ.get("CURL_CA_BUNDLE")
+        or DEFAULT_CA_BUNDLE_PATH
+    )
+
+
+def create_context(cafile=None):
+    """Контекст с проверкой сертификатов по CA-бандлу cafile."""
+    context = ResumableSSLContext()
+    context.cafile = str(cafile or default_cafile())
+    context.load_verify_locations(context.cafile)
+    return context
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def shared_context():
+    """Общий для процесса контекст для всех пулов соединений."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = create_context()
+        return _shared
@@ -0,0 +1,174 @@
+"""Обход и сравнение поддеревьев Диска.
+
+Страницы папок запрашиваются параллельно в ограниченном пуле потоков:
+как только получена страница, следующая страница той же папки и её
+подпапки ставятся в очередь, а элементы сразу отдаются вызывающему
+коду. Время обхода определяется шириной дерева и числом потоков, а не
+глубиной; в памяти одновременно не больше max_workers страниц, сколько
+бы элементов ни было в папке.
+
+Для сравнения деревья индексируются словарями по относительному пути,
+поэтому сравнение занимает линейное время от числа ресурсов.
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from yandexaqa.models import Resource
+from yandexaqa.paging import PAGE_SIZE, embedded_fields, read_page
+
+MAX_WORKERS = 8
+WALK_FIELDS = ("path", "type")
+
+
+def walk_fields(fields):
+    """Добавляет к полям поля, без которых обход невозможен (path, type)."""
+    if not fields:
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    fields = [field.strip() for field in fields]
+    return fields + [field for field in WALK_FIELDS if field not in fields]
+
+
+def walk(
+    client,
+    path,
+    max_depth=None,
+    fields=None,
+    max_workers=MAX_WORKERS,
+    page_size=PAGE_SIZE,
+):
+    """
+    Генератор всех ресурсов внутри папки path (сама папка не возвращается).
+
+    Аргументы:
+        client (DiskClient): Клиент API.
+        path (str): Корень обхода.
+        max_depth (int): Глубина обхода: 1 — только содержимое path,
+            None — без ограничения.
+        fields: Поля элементов (строка через запятую или список);
+            path и type запрашиваются всегда.
+        max_workers (int): Число папок, запрашиваемых одновременно.
+        page_size (int): Размер страницы при чтении папки.
+
+    Элементы — модели Resource в порядке получения; порядок между
+    папками не гарантируется. Ошибка чтения папки (PageError)
+    прерывает обход.
+    """
+    projection = embedded_fields(walk_fields(fields))
+    # Страницы, ещё не отправленные в пул: (папка, смещение, глубина)
+    queue = deque([(path, 0, 1)])
+    pending = {}
+
+    def list_page(dir_path, offset):
+        def fetch(**page):
+            return client.get_meta(dir_path, **page)
+
+        return read_page(fetch, offset, page_size, projection)
+
+    def fill():
+        while queue and len(pending) < max_workers:
+            dir_path, offset, depth = queue.popleft()
+            future = executor.submit(list_page, dir_path, offset)
+            pending[future] = (dir_path, depth)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            fill()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    dir_path, depth = pending.pop(future)
+                    items, offset = future.result()
+                    if offset is not None:
+                        # Следующая страница папки — раньше ещё не начатых папок
+                        queue.appendleft((dir_path, offset, depth))
+                    fill()
+                    for data in items:
+                        item = Resource.from_json(data)
+                        if item.is_dir and (max_depth is None or depth < max_depth):
+                            queue.append((item.path, 0, depth + 1))
+                        yield item
+                fill()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+DIFF_FIELDS = ("type", "size", "md5", "sha256")
+
+
+class TreeDiff:
+    """
+    Результат сравнения двух поддеревьев.
+
+    missing — пути, которые есть только в исходном дереве,
+    extra — пути, которые есть только в целевом,
+    changed — путь -> список различающихся полей (type, size, md5, sha256).
+    Пути указываются относительно корней деревьев.
+    """
+
+    __slots__ = ("missing", "extra", "changed")
+
+    def __init__(self, missing, extra, changed):
+        self.missing = missing
+        self.extra = extra
+        self.changed = changed
+
+    def __bool__(self):
+        return bool(self.missing or self.extra or self.changed)
+
+    def __repr__(self):
+        return (
+            f"TreeDiff(missing={sorted(self.missing)!r}, "
+            f"extra={sorted(self.extra)!r}, changed={self.changed!r})"
+        )
+
+
+def _strip_prefix(path):
+    return path.split(":", 1)[1] if path.startswith("disk:") else path
+
+
+def index_tree(client, path, max_workers=MAX_WORKERS):
+    """
+    Загружает поддерево и возвращает словарь
+    относительный путь -> (type, size, md5, sha256).
+    """
+    root = _strip_prefix(path).rstrip("/")
+    return {
+        _strip_prefix(item.path)[len(root) :]: tuple(
+            getattr(item, name) for name in DIFF_FIELDS
+        )
+        for item in walk(client, path, fields=DIFF_FIELDS, max_workers=max_workers)
+    }
+
+
+def compare(source, target):
+    """Сравнивает два индекса index_tree за линейное время и возвращает TreeDiff."""
+    changed = {}
+    for path in source.keys() & target.keys():
+        if source[path] != target[path]:
+            changed[path] = [
+                name
+                for name, expected, actual in zip(
+                    DIFF_FIELDS, source[path], target[path]
+                )
+                if expected != actual
+            ]
+    return TreeDiff(
+        missing=source.keys() - target.keys(),
+        extra=target.keys() - source.keys(),
+        changed=changed,
+    )
+
+
+def diff_trees(client, source, target, max_workers=MAX_WORKERS):
+    """
+    Загружает поддеревья source и target одновременно и сравнивает их
+    по путям, типам, размерам и контрольным суммам.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        source_index = executor.submit(index_tree, client, source, max_workers)
+        target_index = executor.submit(index_tree, client, target, max_workers)
+        return compare(source_index.result(), target_index.result())
@@ -0,0 +1,52 @@
+"""Параллельная загрузка файлов для подготовки тестовых данных.
+
+Каждая загрузка — это два запроса: GET ссылки в API и PUT на хост
+загрузки. Загрузки выполняются в ограниченном пуле потоков, поэтому
+папка из N файлов заполняется примерно за время одной загрузки, а не 2N
+последовательных запросов. Соединения с API и хостами загрузки
+переиспользуются через пулы сессий клиента.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+MAX_WORKERS = 8
+
+
+class UploadError(Exception):
+    """Часть файлов не удалось загрузить."""
+
+    def __init__(self, failed):
+        self.failed = failed
+        paths = ", ".join(sorted(failed)[:5])
+        super().__init__(f"Не удалось загрузить {len(failed)} файл(ов): {paths}")
+
+
+def upload_many(client, files, overwrite=True, max_workers=MAX_WORKERS):
+    """
+    Загружает файлы параллельно и возвращает словарь путь -> ответ на PUT.
+
+    Аргументы:
+        client (DiskClient): Клиент API.
+        files: Словарь путь -> содержимое или итерируемое пар (путь, содержимое).
+        overwrite (bool): Перезаписывать существующие файлы.
+        max_workers (int): Число одновременных загрузок.
+
+    Если хотя бы один файл не загрузился, выбрасывает UploadError.
+    """
+    items = files.items() if isinstance(files, dict) else files
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            path: executor.submit(client.upload, path, data, overwrite)
+            for path, data in items
+        }
+        responses = {path: future.result() for path, future in futures.items()}
+
+    failed = {
+        path: response
+        for path, response in responses.items()
+        if response.status_code not in [201, 202]
+    }
+    if failed:
+        raise UploadError(failed)
+    return responses
@@ -1,192 +1,572 @@
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 import pytest
-import requests
+import warnings
 from dotenv import load_dotenv
 import uuid
-import time
+
+from yandexaqa.accounts import AccountPool, tokens_from_env, worker_slot
+from yandexaqa.cache import MetaCache
+from yandexaqa.cassette import MODES, Recorder, cassette_name, install
+from yandexaqa.client import DiskClient
+from yandexaqa.fake import FakeDiskServer
+from yandexaqa.operations import OperationTimeoutError, wait_until
+from yandexaqa.pool import PoolError, ResourcePool
+from yandexaqa.registry import ResourceRegistry, sweep
+from yandexaqa.sandbox import SANDBOX_PREFIX, run_id, sandbox_root
+from yandexaqa.session import DEFAULT_BASE_URL
 
 load_dotenv()
 
+pytest_plugins = ["yandexaqa.pytest_timing", "yandexaqa.pytest_fields"]
 
-@pytest.fixture(scope="session")
-def api_token():
-    """Фикстура для загрузки OAuth-токена."""
-    token = os.getenv("YANDEX_DISK_OAUTH_TOKEN")
-    return token
+TEST_FILE_CONTENT = "Тестовое содержимое файла для скачивания\n" * 10
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--disk-backend",
+        choices=["live", "fake"],
+        default=os.getenv("DISK_BACKEND", "live"),
+        help="live — настоящий API Яндекс.Диска, fake — локальный фейковый сервер",
+    )
+    parser.addoption(
+        "--large-folder-size",
+        type=int,
+        default=200,
+        help="Число файлов в большой папке для проверки пагинации _embedded",
+    )
+    parser.addoption(
+        "--upload-size",
+        type=int,
+        default=8 * 1024 * 1024,
+        help="Размер (в байтах) синтетического файла для проверки потоковой загрузки",
+    )
+    parser.addoption(
+        "--sweep",
+        action="store_true",
+        help="Перед запуском удалить ресурсы, оставшиеся от прошлых прогонов",
+    )
+    parser.addoption(
+        "--sweep-older-than",
+        type=float,
+        default=3600,
+        help="Удалять при --sweep только ресурсы старше указанного числа секунд",
+    )
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        help="Запустить замеры производительности из tests/test_benchmarks",
+    )
+    parser.addoption(
+        "--benchmark-iterations",
+        type=int,
+        default=50,
+        help="Число замеряемых вызовов в каждом замере",
+    )
+    parser.addoption(
+        "--benchmark-warmup",
+        type=int,
+        default=5,
+        help="Число вызовов для прогрева перед замером",
+    )
+    parser.addoption(
+        "--benchmark-concurrency",
+        default="1,4",
+        help="Уровни конкурентности через запятую",
+    )
+    parser.addoption(
+        "--benchmark-baseline",
+        default=os.path.join(
+            os.path.dirname(__file__), "test_benchmarks", "baseline.json"
+        ),
+        help="Файл с базовым уровнем замеров",
+    )
+    parser.addoption(
+        "--benchmark-save",
+        action="store_true",
+        help="Сохранить результаты замеров как новый базовый уровень",
+    )
+    parser.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=0.2,
+        help="Допустимое ухудшение p95 и пропускной способности (доля)",
+    )
+    parser.addoption(
+        "--rate-limit",
+        type=float,
+        default=float(os.getenv("YANDEX_DISK_RATE_LIMIT") or 0) or None,
+        help="Максимум запросов к API в секунду на аккаунт "
+        "(при -n делится между воркерами аккаунта); по умолчанию без ограничения",
+    )
+    parser.addoption(
+        "--meta-cache-ttl",
+        type=float,
+        default=0,
+        help="Кэшировать ответы GET /resources в api_client на указанное "
+        "число секунд (0 — без кэша)",
+    )
+    parser.addoption(
+        "--record-mode",
+        choices=MODES,
+        default=os.getenv("RECORD_MODE", "none"),
+        help="none — без кассет, record — записать ответы API в кассеты, "
+        "replay — воспроизвести ответы из кассет без сети",
+    )
+    parser.addoption(
+        "--cassette-dir",
+        default=os.path.join(os.path.dirname(__file__), "cassettes"),
+        help="Папка с кассетами для --record-mode",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--record-mode") == "record" and config.getoption(
+        "numprocesses", None
+    ):
+        raise pytest.UsageError("Запись кассет (--record-mode=record) без -n")
+    config.addinivalue_line(
+        "markers",
+        "serial: тест меняет общее состояние аккаунта (например, корзину) "
+        "и выполняется последовательно на одном воркере",
+    )
+    config.addinivalue_line(
+        "markers",
+        "benchmark: замер производительности, запускается только с --benchmark",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    # Группа учитывается pytest-xdist при запуске с --dist loadgroup
+    for item in items:
+        if "file_in_trash" in item.fixturenames:
+            item.add_marker(pytest.mark.serial)
+        if item.get_closest_marker("serial"):
+            item.add_marker(pytest.mark.xdist_group("serial"))
 
 
 @pytest.fixture(scope="session")
-def api_client(api_token):
-    """Фикстура для создания HTTP-клиента с общими заголовками."""
-    headers = {
-        "Authorization": f"OAuth {api_token}",
-        "Content-Type": "application/json",
-    }
-    session = requests.Session()
-    session.headers.update(headers)
-    session.base_url = "https://cloud-api.yandex.net/v1/disk"
-    return session
+def disk_backend(request):
+    """Фикстура, возвращающая выбранный бэкенд: live или fake."""
+    return request.config.getoption("--disk-backend")
 
 
-@pytest.fixture
-def random_path():
-    """Фикстура, возвращающая путь к уникальной тестовой папке."""
-    import uuid
+@pytest.fixture(scope="session")
+def base_url(disk_backend):
+    """
+    Фикстура, возвращающая базовый URL API.
+    Для бэкенда fake поднимает локальный сервер на время сессии.
+    """
+    if disk_backend == "live":
+        yield DEFAULT_BASE_URL
+        return
 
-    return f"/test_folder_{uuid.uuid4().hex[:8]}"
+    with FakeDiskServer() as server:
+        yield server.base_url
 
 
-@pytest.fixture
-def test_file_path(
-    api_client,
-):
+@pytest.fixture(scope="session")
+def cassette_recorder(request):
     """
-    Фикстура создает тестовый файл для проверки скачивания.
-    Возвращает путь к созданному файлу.
-    Удаляет файл после завершения теста.
+    Фикстура записи/воспроизведения ответов API (опция --record-mode).
+    Возвращает None, если кассеты не используются.
     """
-    import tempfile
-    import os
+    mode = request.config.getoption("--record-mode")
+    if mode == "none":
+        yield None
+        return
 
-    file_name = f"test_file_{uuid.uuid4().hex[:8]}.txt"
-    file_path = f"/{file_name}"
+    recorder = Recorder(mode, request.config.getoption("--cassette-dir"))
+    yield recorder
+    recorder.save()
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as tmp:
-        tmp.write("Тестовое содержимое файла для скачивания\n" * 10)
-        temp_file_path = tmp.name
 
-    try:
-        upload_response = api_client.get(
-            f"{api_client.base_url}/resources/upload",
-            params={"path": file_path, "overwrite": "true"},
-        )
+@pytest.fixture(autouse=True)
+def cassette(request, cassette_recorder):
+    """Фикстура переключает запись/воспроизведение на кассету текущего теста."""
+    if cassette_recorder is None:
+        yield None
+        return
 
-        if upload_response.status_code != 200:
-            pytest.skip(f"Не удалось получить URL для загрузки: {upload_response.text}")
+    with cassette_recorder.use(cassette_name(request.node.nodeid)) as current:
+        yield current
 
-        upload_url = upload_response.json()["href"]
 
-        with open(temp_file_path, "rb") as file_content:
-            put_response = requests.put(upload_url, files={"file": file_content})
+@pytest.fixture(scope="session")
+def account_pool(request, disk_backend):
+    """
+    Фикстура пула аккаунтов из YANDEX_DISK_OAUTH_TOKENS (или единственного
+    YANDEX_DISK_OAUTH_TOKEN). Для фейкового бэкенда и воспроизведения кассет
+    без токенов у каждого воркера свой фейковый аккаунт плюс отдельный
+    для тестов, меняющих состояние всего аккаунта.
+    """
+    tokens = tokens_from_env()
+    if disk_backend == "fake" or request.config.getoption("--record-mode") == "replay":
+        _, worker_count = worker_slot(request.config)
+        tokens = tokens or [f"fake-token-{i}" for i in range(worker_count + 1)]
+    return AccountPool(tokens)
 
-        if put_response.status_code not in [201, 202]:
-            pytest.skip(f"Не удалось загрузить тестовый файл: {put_response.text}")
 
-        yield file_path
+@pytest.fixture(scope="session")
+def api_token(request, account_pool):
+    """Фикстура OAuth-токена аккаунта, закрепленного за этим воркером."""
+    index, _ = worker_slot(request.config)
+    return account_pool.for_worker(index)
+
+
+@pytest.fixture(scope="session")
+def rate_limit(request, account_pool):
+    """
+    Фикстура, возвращающая ограничение частоты запросов для этого процесса:
+    при запуске через pytest-xdist лимит аккаунта делится между воркерами,
+    которые его используют.
+    """
+    limit = request.config.getoption("--rate-limit")
+    if not limit:
+        return None
+    _, worker_count = worker_slot(request.config)
+    return limit / account_pool.workers_per_token(worker_count)
+
+
+def _make_client(
+    token,
+    base_url,
+    rate_limit,
+    cassette_recorder,
+    latency_recorder,
+    cache=None,
+    fields_tracker=None,
+):
+    client = DiskClient(
+        token=token, base_url=base_url, rate_limit=rate_limit, cache=cache
+    )
+    if cassette_recorder is not None:
+        install(client, cassette_recorder)
+    if latency_recorder is not None:
+        latency_recorder.attach(client)
+    if fields_tracker is not None:
+        fields_tracker.attach(client)
+    return client
+
+
+@pytest.fixture(scope="session")
+def api_client(
+    request,
+    api_token,
+    base_url,
+    rate_limit,
+    cassette_recorder,
+    latency_recorder,
+    fields_tracker,
+):
+    """
+    Фикстура для создания клиента API с общей сессией на весь прогон.
+    С --meta-cache-ttl ответы get_meta кэшируются (см. yandexaqa.cache),
+    с --fields-report/--fields-learn/--fields-apply учитываются
+    прочитанные поля ответов (см. yandexaqa.fields).
+    """
+    ttl = request.config.getoption("--meta-cache-ttl")
+    client = _make_client(
+        api_token,
+        base_url,
+        rate_limit,
+        cassette_recorder,
+        latency_recorder,
+        cache=MetaCache(ttl=ttl) if ttl else None,
+        fields_tracker=fields_tracker,
+    )
+    yield client
+    client.close()
 
-    finally:
-        if os.path.exists(temp_file_path):
-            os.unlink(temp_file_path)
 
-        try:
-            api_client.delete(
-                f"{api_client.base_url}/resources", params={"path": file_path}
-            )
-        except:
-            pass
+@pytest.fixture(scope="session")
+def exclusive_client(
+    account_pool,
+    base_url,
+    rate_limit,
+    cassette_recorder,
+    latency_recorder,
+    fields_tracker,
+):
+    """
+    Фикстура клиента отдельного аккаунта для тестов, меняющих состояние
+    всего аккаунта (например, очистка корзины). Если токен один, это
+    тот же аккаунт, что и у api_client, и клиент делит с ним bucket.
+    """
+    client = _make_client(
+        account_pool.exclusive,
+        base_url,
+        rate_limit,
+        cassette_recorder,
+        latency_recorder,
+        fields_tracker=fields_tracker,
+    )
+    yield client
+    client.close()
 
 
 @pytest.fixture
-def random_file_path():
+def anonymous_client(api_client, rate_limit, cassette_recorder, latency_recorder):
+    """Фикстура клиента без OAuth-токена для проверки ошибок авторизации."""
+    client = _make_client(
+        None, api_client.base_url, rate_limit, cassette_recorder, latency_recorder
+    )
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def resource_registry(api_client):
     """
-    Фикстура возвращает случайный путь к файлу для тестирования.
-    Не создает файл физически.
+    Фикстура реестра ресурсов, созданных тестами.
+    В конце сессии удаляет все зарегистрированные пути безвозвратно
+    (параллельно, с ожиданием асинхронных операций).
+    """
+    registry = ResourceRegistry(api_client)
+
+    yield registry
+
+    errors = registry.purge()
+    if errors:
+        warnings.warn(f"Не удалось удалить тестовые ресурсы: {errors}")
+
+
+@pytest.fixture(scope="session")
+def sandbox(request, api_client, resource_registry):
     """
-    return f"/test_file_{uuid.uuid4().hex[:8]}.txt"
+    Фикстура создает корневую папку текущего воркера и регистрирует ее
+    для удаления в конце сессии. Все тестовые ресурсы создаются внутри нее,
+    поэтому параллельные воркеры не пересекаются по путям.
+
+    С опцией --sweep перед созданием папки удаляет ресурсы, оставшиеся
+    от прошлых прогонов (кроме папок текущего прогона).
+    """
+    if request.config.getoption("--sweep"):
+        sweep(
+            api_client,
+            exclude=[f"{SANDBOX_PREFIX}{run_id(request.config)}"],
+            older_than=request.config.getoption("--sweep-older-than"),
+        )
+
+    root = sandbox_root(request.config)
+    response = api_client.create_folder(root)
+    if response.status_code not in [201, 409]:
+        pytest.exit(f"Не удалось создать папку воркера {root}: {response.text}")
+
+    return resource_registry.register(root)
 
 
 @pytest.fixture
-def test_image_file_path(api_client):
+def random_path(sandbox, resource_registry):
     """
-    Фикстура создает тестовое изображение для проверки работы превью.
-    Возвращает путь к созданному JPG/PNG файлу.
+    Фикстура, возвращающая путь к уникальной тестовой папке.
+    Путь регистрируется для удаления, даже если тест упадет до своей очистки.
     """
-    import tempfile
+    return resource_registry.register(f"{sandbox}/test_folder_{uuid.uuid4().hex[:8]}")
+
+
+def _jpeg_bytes():
+    """Возвращает небольшое JPEG-изображение для проверки превью."""
     from PIL import Image
-    import os
 
-    file_name = f"test_image_{uuid.uuid4().hex[:8]}.jpg"
-    file_path = f"/{file_name}"
+    buffer = io.BytesIO()
+    Image.new("RGB", (100, 100), color="red").save(buffer, "JPEG")
+    return buffer.getvalue()
 
-    with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as tmp:
-        img = Image.new("RGB", (100, 100), color="red")
-        img.save(tmp.name, "JPEG")
-        temp_file_path = tmp.name
 
+@pytest.fixture(scope="session")
+def resource_pool(api_client, sandbox):
+    """
+    Фикстура загружает пул ресурсов только для чтения один раз за сессию:
+    текстовый файл, изображение и папку с файлами.
+    Тесты не должны изменять эти ресурсы.
+    """
+    pool = ResourcePool(api_client, f"{sandbox}/pool")
     try:
-        upload_response = api_client.get(
-            f"{api_client.base_url}/resources/upload",
-            params={"path": file_path, "overwrite": "true"},
+        pool.create()
+        pool.add_file("text", "test_file.txt", TEST_FILE_CONTENT.encode())
+        pool.add_file("image", "test_image.jpg", _jpeg_bytes())
+        pool.add_folder(
+            "folder",
+            "test_folder",
+            {f"test_file_{i}.txt": f"Content of file {i}" for i in range(3)},
         )
+    except PoolError as error:
+        pytest.skip(f"Не удалось подготовить пул ресурсов: {error}")
+    return pool
 
-        if upload_response.status_code != 200:
-            pytest.skip(f"Не удалось получить URL для загрузки изображения")
 
-        upload_url = upload_response.json()["href"]
+@pytest.fixture(scope="session")
+def large_folder_path(request, resource_pool):
+    """
+    Фикстура добавляет в пул большую папку (по умолчанию 200 файлов,
+    опция --large-folder-size) и возвращает путь к ней (только чтение).
+    Файлы загружаются параллельно; папка создается при первом запросе фикстуры.
+    """
+    size = request.config.getoption("--large-folder-size")
+    files = {f"file_{i:05d}.txt": f"Content of file {i}" for i in range(size)}
+    try:
+        return resource_pool.add_folder("large_folder", "large_folder", files)
+    except PoolError as error:
+        pytest.skip(f"Не удалось подготовить большую папку: {error}")
 
-        with open(temp_file_path, "rb") as file_content:
-            put_response = requests.put(upload_url, files={"file": file_content})
 
-        if put_response.status_code not in [201, 202]:
-            pytest.skip(f"Не удалось загрузить тестовое изображение")
+@pytest.fixture
+def shared_file_path(resource_pool):
+    """Фикстура возвращает путь к общему текстовому файлу (только чтение)."""
+    return resource_pool["text"]
+
 
-        yield file_path
+@pytest.fixture
+def shared_image_path(resource_pool):
+    """Фикстура возвращает путь к общему изображению (только чтение)."""
+    return resource_pool["image"]
 
-    finally:
-        if os.path.exists(temp_file_path):
-            os.unlink(temp_file_path)
 
-        try:
-            api_client.delete(
-                f"{api_client.base_url}/resources", params={"path": file_path}
-            )
-        except:
-            pass
+@pytest.fixture
+def shared_folder_path(resource_pool):
+    """Фикстура возвращает путь к общей папке с файлами (только чтение)."""
+    return resource_pool["folder"]
+
+
+@pytest.fixture(scope="session")
+def published_pool(api_client, sandbox):
+    """
+    Фикстура готовит пул опубликованных ресурсов один раз за сессию:
+    файл и папку с тремя файлами. Ресурсы загружаются и публикуются
+    параллельно, публикация ожидается один раз для всех.
+    Тесты не должны изменять эти ресурсы и отменять их публикацию;
+    тестам отмены публикации нужна приватная копия (published_file_path).
+    """
+    pool = ResourcePool(api_client, f"{sandbox}/published")
+    try:
+        pool.create()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            prepared = [
+                executor.submit(
+                    pool.add_file, "file", "public_file.txt", TEST_FILE_CONTENT.encode()
+                ),
+                executor.submit(
+                    pool.add_folder,
+                    "folder",
+                    "public_folder",
+                    {f"file_{i}.txt": f"Content {i}" for i in range(3)},
+                ),
+            ]
+            for future in prepared:
+                future.result()
+        pool.publish("file", "folder")
+    except PoolError as error:
+        pytest.skip(f"Не удалось подготовить опубликованные ресурсы: {error}")
+    return pool
+
+
+@pytest.fixture
+def public_file_path(published_pool):
+    """Фикстура возвращает путь к общему опубликованному файлу (только чтение)."""
+    return published_pool["file"]
 
 
 @pytest.fixture
-def folder_with_content(api_client, random_path):
+def public_file(published_pool):
     """
-    Фикстура создает папку с несколькими тестовыми файлами для проверки
-    пагинации и работы с _embedded.
+    Фикстура возвращает публичные данные общего опубликованного файла:
+    Resource с path, public_key и public_url, полученными при публикации.
     """
-    api_client.put(f"{api_client.base_url}/resources", params={"path": random_path})
+    return published_pool.public["file"]
 
-    for i in range(3):
-        file_path = f"{random_path}/test_file_{i}.txt"
-        upload_response = api_client.get(
-            f"{api_client.base_url}/resources/upload",
-            params={"path": file_path, "overwrite": "true"},
-        )
-        if upload_response.status_code == 200:
-            upload_url = upload_response.json()["href"]
-            requests.put(upload_url, data=f"Content of file {i}")
 
-    yield random_path
-    api_client.delete(f"{api_client.base_url}/resources", params={"path": random_path})
+@pytest.fixture
+def public_folder(published_pool):
+    """
+    Фикстура возвращает публичные данные общей опубликованной папки
+    с файлами file_0.txt...file_2.txt (path, public_key, public_url).
+    """
+    return published_pool.public["folder"]
 
 
 @pytest.fixture
-def folder_with_content(api_client, random_path):
+def test_file_path(sandbox, resource_pool, resource_registry):
     """
-    Фикстура создает папку с несколькими тестовыми файлами для проверки
-    рекурсивного копирования папок.
+    Фикстура создает приватную копию тестового файла для тестов,
+    которые его изменяют (публикация, удаление).
+    Возвращает путь к копии; копия удаляется реестром в конце сессии.
     """
-    api_client.put(f"{api_client.base_url}/resources", params={"path": random_path})
+    try:
+        file_path = resource_pool.private_copy("text", sandbox, prefix="test_file")
+    except PoolError as error:
+        pytest.skip(f"Не удалось создать тестовый файл: {error}")
+
+    return resource_registry.register(file_path)
 
-    for i in range(2):
-        file_path = f"{random_path}/test_file_{i}.txt"
-        upload_response = api_client.get(
-            f"{api_client.base_url}/resources/upload",
-            params={"path": file_path, "overwrite": "true"},
+
+@pytest.fixture
+def random_file_path(sandbox, resource_registry):
+    """
+    Фикстура возвращает случайный путь к файлу для тестирования.
+    Не создает файл физически, но регистрирует путь для удаления.
+    """
+    return resource_registry.register(f"{sandbox}/test_file_{uuid.uuid4().hex[:8]}.txt")
+
+
+@pytest.fixture
+def test_image_file_path(sandbox, resource_pool, resource_registry):
+    """
+    Фикстура создает приватную копию тестового изображения.
+    Возвращает путь к копии JPG-файла; копия удаляется реестром.
+    """
+    try:
+        file_path = resource_pool.private_copy("image", sandbox, prefix="test_image")
+    except PoolError as error:
+        pytest.skip(f"Не удалось создать тестовое изображение: {error}")
+
+    return resource_registry.register(file_path)
+
+
+@pytest.fixture
+def folder_with_content(sandbox, resource_pool, resource_registry):
+    """
+    Фикстура создает приватную копию папки с несколькими тестовыми файлами
+    для тестов, которые изменяют ее содержимое. Копия удаляется реестром.
+    """
+    try:
+        folder_path = resource_pool.private_copy(
+            "folder", sandbox, prefix="test_folder"
         )
-        if upload_response.status_code == 200:
-            upload_url = upload_response.json()["href"]
-            requests.put(upload_url, data=f"Content of file {i}")
+    except PoolError as error:
+        pytest.skip(f"Не удалось создать папку с файлами: {error}")
+
+    return resource_registry.register(folder_path)
 
-    yield random_path
 
-    api_client.delete(f"{api_client.base_url}/resources", params={"path": random_path})
+@pytest.fixture
+def wait_for_public_url(api_client):
+    """
+    Фикстура возвращает функцию ожидания публикации ресурса.
+    При published=True ждет появления public_url и возвращает его,
+    при published=False ждет его исчезновения.
+    """
+
+    def wait(path, published=True, timeout=10.0):
+        def check():
+            response = api_client.get_meta(path, fields="public_url", cache=False)
+            if response.status_code != 200:
+                return None
+            public_url = response.json().get("public_url")
+            if published:
+                return public_url
+            return public_url is None
+
+        return wait_until(
+            check,
+            timeout=timeout,
+            message=f"public_url для {path} не {'появился' if published else 'исчез'}",
+        )
+
+    return wait
 
 
 @pytest.fixture
@@ -195,60 +575,30 @@ def file_in_trash(api_client, test_file_path):
     Фикстура создает файл и перемещает его в корзину.
     Возвращает путь к файлу (исходный путь используется для доступа к ресурсу в корзине).
     """
-    delete_response = api_client.delete(
-        f"{api_client.base_url}/resources", params={"path": test_file_path}
-    )
+    delete_response = api_client.remove(test_file_path)
 
-    if delete_response.status_code == 202:
-        time.sleep(2)
+    api_client.wait_for_operation(delete_response)
 
     yield test_file_path
 
 
 @pytest.fixture
-def published_file_path(api_client, test_file_path):
+def published_file_path(api_client, test_file_path, wait_for_public_url):
     """
     Фикстура создает опубликованный файл для тестирования отмены публикации.
     Возвращает путь к опубликованному файлу.
     """
-    publish_response = api_client.put(
-        f"{api_client.base_url}/resources/publish",
-        params={"path": test_file_path},
-        json={"public_settings": {}},
-    )
+    publish_response = api_client.publish(test_file_path)
 
     if publish_response.status_code not in [200, 201, 202]:
         pytest.skip(
             f"Не удалось опубликовать файл для теста отмены публикации: {publish_response.status_code}"
         )
 
-    time.sleep(4)
-
-    check_response = api_client.get(
-        f"{api_client.base_url}/resources",
-        params={"path": test_file_path, "fields": "public_url"},
-    )
-
-    is_published = (
-        check_response.status_code == 200
-        and check_response.json().get("public_url") is not None
-    )
-
-    if not is_published:
-        pytest.skip(f"Файл не опубликовался после запроса: {check_response.text}")
-
-    yield test_file_path
-
     try:
-        final_check = api_client.get(
-            f"{api_client.base_url}/resources",
-            params={"path": test_file_path, "fields": "public_url"},
-        )
+        wait_for_public_url(test_file_path)
+    except OperationTimeoutError as error:
+        pytest.skip(f"Файл не опубликовался после запроса: {error}")
 
-        if final_check.status_code == 200 and final_check.json().get("public_url"):
-            api_client.delete(
-                f"{api_client.base_url}/resources/unpublish",
-                params={"path": test_file_path},
-            )
-    except:
-        pass
+    # Копию безвозвратно удаляет реестр в конце сессии
+    return test_file_path
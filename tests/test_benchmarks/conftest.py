@@ -0,0 +1,101 @@
+import uuid
+
+import pytest
+
+from yandexaqa.bench import load_baseline, regressions, run_benchmark, save_baseline
+
+
+def pytest_collection_modifyitems(config, items):
+    skip = pytest.mark.skip(reason="Замеры запускаются с опцией --benchmark")
+    for item in items:
+        if item.get_closest_marker("benchmark") and not config.getoption("--benchmark"):
+            item.add_marker(skip)
+
+
+def pytest_generate_tests(metafunc):
+    if "concurrency" in metafunc.fixturenames:
+        levels = metafunc.config.getoption("--benchmark-concurrency")
+        metafunc.parametrize(
+            "concurrency", [int(level) for level in levels.split(",") if level]
+        )
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(request):
+    """
+    Фикстура списка результатов замеров за сессию.
+    С --benchmark-save в конце сессии результаты сохраняются как baseline.
+    """
+    results = request.config._aqa_benchmarks = []
+    yield results
+    if results and request.config.getoption("--benchmark-save"):
+        save_baseline(request.config.getoption("--benchmark-baseline"), results)
+
+
+@pytest.fixture
+def benchmark(request, concurrency, benchmark_results):
+    """
+    Фикстура запуска замера с параметрами из опций --benchmark-*.
+    Проверяет отсутствие ошибок и регрессий относительно baseline;
+    замер без записи в baseline пропускается, а не считается успешным.
+    """
+    config = request.config
+
+    def run(name, operation):
+        result = run_benchmark(
+            name,
+            operation,
+            iterations=config.getoption("--benchmark-iterations"),
+            concurrency=concurrency,
+            warmup=config.getoption("--benchmark-warmup"),
+        )
+        benchmark_results.append(result)
+
+        assert result.errors == 0, f"{result.key}: {result.errors} ошибок"
+        if config.getoption("--benchmark-save"):
+            return result
+        path = config.getoption("--benchmark-baseline")
+        baseline = load_baseline(path)
+        if result.key not in baseline:
+            pytest.skip(
+                f"Нет baseline для {result.key} в {path}: "
+                "сравнивать не с чем, запишите его с --benchmark-save"
+            )
+        problems = regressions(
+            result, baseline, config.getoption("--benchmark-tolerance")
+        )
+        assert not problems, "Регрессия: " + "; ".join(problems)
+        return result
+
+    return run
+
+
+@pytest.fixture
+def bench_folder(api_client, sandbox):
+    """Фикстура папки для ресурсов, которые создают замеры."""
+    path = f"{sandbox}/bench_{uuid.uuid4().hex[:8]}"
+    api_client.create_folder(path)
+    return path
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = getattr(config, "_aqa_benchmarks", None)
+    if not results:
+        return
+
+    write = terminalreporter.write_line
+    terminalreporter.section("Замеры производительности")
+    write(
+        f"{'замер':<32} {'N':>5} {'ошиб.':>5} {'зап/с':>8} "
+        f"{'p50, мс':>8} {'p95, мс':>8} {'p99, мс':>8}"
+    )
+    for result in results:
+        summary = result.summary()
+        if not summary["count"]:
+            write(f"{result.key:<32} {0:>5} {result.errors:>5}")
+            continue
+        write(
+            f"{result.key:<32} {summary['count']:>5} {result.errors:>5} "
+            f"{summary['throughput']:>8.1f} {summary['p50'] * 1000:>8.1f} "
+            f"{summary['p95'] * 1000:>8.1f} {summary['p99'] * 1000:>8.1f}"
+        )
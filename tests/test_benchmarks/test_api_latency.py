@@ -0,0 +1,70 @@
+import threading
+
+import pytest
+
+
+@pytest.mark.benchmark
+class TestResourceBenchmarks:
+    """Замеры задержки и пропускной способности эндпоинтов /resources."""
+
+    def test_get_metadata(self, benchmark, api_client, shared_file_path):
+        """Замер GET /resources для файла."""
+        benchmark("get_meta", lambda i: api_client.get_meta(shared_file_path))
+
+    def test_get_download_link(self, benchmark, api_client, shared_file_path):
+        """Замер GET /resources/download."""
+        benchmark(
+            "get_download_link",
+            lambda i: api_client.get_download_link(shared_file_path),
+        )
+
+    def test_small_upload(self, benchmark, api_client, bench_folder):
+        """Замер загрузки файла 1 КиБ (получение ссылки и PUT)."""
+        payload = b"x" * 1024
+        benchmark(
+            "upload_1k",
+            lambda i: api_client.upload(f"{bench_folder}/file_{i}.bin", payload),
+        )
+
+    def test_copy_file(self, benchmark, api_client, shared_file_path, bench_folder):
+        """Замер POST /resources/copy для файла."""
+        benchmark(
+            "copy_file",
+            lambda i: api_client.copy(shared_file_path, f"{bench_folder}/copy_{i}.txt"),
+        )
+
+    def test_publish_cycle(
+        self, benchmark, api_client, bench_folder, resource_pool, concurrency
+    ):
+        """
+        Замер цикла публикации и отмены публикации файла.
+        Каждый поток работает со своей копией, подготовленной до замера.
+        """
+        copies = [
+            resource_pool.private_copy("text", bench_folder) for _ in range(concurrency)
+        ]
+        local = threading.local()
+
+        def cycle(i):
+            if not hasattr(local, "path"):
+                local.path = copies.pop()
+            response = api_client.publish(local.path)
+            if response.status_code not in [200, 202]:
+                return response
+            api_client.wait_for_operation(response)
+            response = api_client.unpublish(local.path)
+            if response.status_code == 202:
+                api_client.wait_for_operation(response)
+            return response
+
+        benchmark("publish_cycle", cycle)
+
+
+@pytest.mark.benchmark
+@pytest.mark.serial
+class TestTrashBenchmarks:
+    """Замеры чтения корзины."""
+
+    def test_trash_listing(self, benchmark, api_client):
+        """Замер GET /trash/resources с limit=20."""
+        benchmark("trash_listing", lambda i: api_client.get_trash(path="/", limit=20))
@@ -0,0 +1,83 @@
+import asyncio
+import time
+
+import pytest
+
+from yandexaqa import load
+from yandexaqa.load import Histogram, parse_mix, run_load, schedule
+
+
+class TestLoadGenerator:
+    """Тесты генератора нагрузки."""
+
+    def test_histogram_percentiles(self):
+        """Тест точности перцентилей логарифмической гистограммы."""
+        histogram = Histogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+
+        assert histogram.count == 1000
+        for q in [50, 90, 99]:
+            assert histogram.percentile(q) == pytest.approx(q / 100, rel=0.05)
+        assert histogram.percentile(100) == pytest.approx(1.0)
+
+    def test_schedule_open_loop(self):
+        """Тест расписания: число запусков не зависит от времени ответа."""
+        assert len(list(schedule(rate=50, duration=2))) == 100
+        poisson = list(schedule(rate=50, duration=20, arrival="poisson", seed=1))
+        assert len(poisson) == pytest.approx(1000, rel=0.1)
+
+    def test_parse_mix(self):
+        """Тест разбора смеси сценариев."""
+        assert parse_mix("publish_flow=1,read_meta=4") == {
+            "publish_flow": 1.0,
+            "read_meta": 4.0,
+        }
+        with pytest.raises(ValueError):
+            parse_mix("unknown=1")
+
+    def test_coordinated_omission(self, monkeypatch):
+        """
+        Тест учета координированного упущения: если сервис не успевает,
+        время ответа (от запланированного запуска) растет вместе с очередью,
+        а время обслуживания остается прежним.
+        """
+        monkeypatch.setitem(load.SCENARIOS, "slow", lambda ctx: time.sleep(0.05))
+
+        result = asyncio.run(
+            run_load(None, None, {"slow": 1}, rate=50, duration=0.5, max_workers=1)
+        )
+
+        response = result.stats.total["response:slow"]
+        service = result.stats.total["service:slow"]
+        assert result.started == 25
+        # Проверяются только границы, которые медленный стенд не нарушит:
+        # сон не короче 50 мс, а единственный поток выполняет 25 сценариев
+        # не быстрее чем за 1.25 с, поэтому последний, запланированный на
+        # 0.48 с, ждет в очереди не меньше 0.72 с
+        assert service.percentile(50) >= 0.05 * 0.95
+        assert response.percentile(50) > service.percentile(50)
+        assert response.percentile(99) >= (25 * 0.05 - 0.48 - 0.05) * 0.95
+
+    @pytest.mark.benchmark
+    def test_publish_flow_load(self, api_client, sandbox):
+        """Короткий прогон смеси сценариев с заданной частотой без ошибок."""
+        workspace = f"{sandbox}/load"
+        api_client.create_folder(workspace)
+
+        result = asyncio.run(
+            run_load(
+                api_client,
+                workspace,
+                parse_mix("publish_flow=1,read_meta=2,upload_flow=1"),
+                rate=20,
+                duration=2,
+                seed=1,
+                max_workers=8,
+            )
+        )
+
+        summary = result.summary()
+        assert summary["started"] == 40
+        assert summary["errors"] == {}
+        assert summary["histograms"]["response:publish_flow"]["count"] > 0
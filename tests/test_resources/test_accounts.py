@@ -0,0 +1,52 @@
+import pytest
+
+from yandexaqa.accounts import AccountPool, parse_tokens, tokens_from_env
+from yandexaqa.paging import iter_trash
+
+
+class TestAccountPool:
+    """Тесты распределения аккаунтов между воркерами."""
+
+    def test_parse_tokens(self):
+        """Тест разбора списка токенов: запятые, пробелы, повторы."""
+        assert parse_tokens(" a, b\nc,,a ") == ["a", "b", "c"]
+        assert parse_tokens(None) == []
+
+    def test_tokens_from_env(self):
+        """Тест: список токенов важнее единственного токена."""
+        assert tokens_from_env({"YANDEX_DISK_OAUTH_TOKEN": "a"}) == ["a"]
+        assert tokens_from_env(
+            {"YANDEX_DISK_OAUTH_TOKENS": "b,c", "YANDEX_DISK_OAUTH_TOKEN": "a"}
+        ) == ["b", "c"]
+
+    def test_workers_sharded_round_robin(self):
+        """Тест: воркеры делят аккаунты по кругу, последний — отдельный."""
+        pool = AccountPool(["a", "b", "c"])
+
+        assert [pool.for_worker(i) for i in range(5)] == ["a", "b", "a", "b", "a"]
+        assert pool.exclusive == "c"
+        assert pool.workers_per_token(5) == 3
+        assert len(pool) == 3
+
+    def test_single_token_shared(self):
+        """Тест: единственный токен используется и воркерами, и отдельно."""
+        pool = AccountPool(["a"])
+
+        assert pool.for_worker(3) == "a"
+        assert pool.exclusive == "a"
+        assert pool.workers_per_token(4) == 4
+
+    def test_exclusive_account_isolated(
+        self, account_pool, api_client, exclusive_client, file_in_trash
+    ):
+        """Тест: очистка корзины отдельного аккаунта не затрагивает корзину воркера."""
+        if len(account_pool) < 2:
+            pytest.skip("В пуле один аккаунт")
+
+        response = exclusive_client.clear_trash()
+        exclusive_client.wait_for_operation(response)
+
+        assert any(
+            item.origin_path.endswith(file_in_trash)
+            for item in iter_trash(api_client, fields="origin_path")
+        ), "Файл пропал из корзины аккаунта воркера"
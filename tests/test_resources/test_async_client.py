@@ -0,0 +1,155 @@
+import asyncio
+import uuid
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from yandexaqa.aio import AsyncDiskClient  # noqa: E402
+from yandexaqa.fake import FakeDiskServer  # noqa: E402
+
+
+@pytest.fixture
+def run_async(api_token, api_client, rate_limit, cassette_recorder):
+    """
+    Фикстура, выполняющая корутину scenario(client) с асинхронным клиентом
+    того же аккаунта, что и api_client, с тем же ограничением частоты.
+    """
+    if cassette_recorder is not None:
+        pytest.skip("Асинхронный клиент не записывается в кассеты")
+
+    def run(scenario):
+        async def main():
+            async with AsyncDiskClient(
+                api_token, api_client.base_url, rate_limit=rate_limit
+            ) as client:
+                return await scenario(client)
+
+        return asyncio.run(main())
+
+    return run
+
+
+class TestAsyncClient:
+    """Тесты асинхронного клиента API."""
+
+    def test_publish_while_polling(self, api_client, run_async, random_path):
+        """
+        Тест одновременной публикации файла и запросов метаинформации
+        нескольких ресурсов.
+        """
+        api_client.create_folder(random_path)
+        paths = [f"{random_path}/file_{i}.txt" for i in range(4)]
+
+        async def scenario(client):
+            await asyncio.gather(
+                *(client.upload(path, f"Файл {path}".encode()) for path in paths)
+            )
+            return await asyncio.gather(
+                client.publish(paths[0]),
+                *(client.get_meta(path, fields="path,size") for path in paths[1:]),
+            )
+
+        published, *metas = run_async(scenario)
+
+        assert published.status_code == 200, f"Ошибка: {published.text}"
+        for path, response in zip(paths[1:], metas):
+            assert response.status_code == 200, f"Ошибка: {response.text}"
+            assert response.json()["path"] == f"disk:{path}"
+        public_url = api_client.get_meta(paths[0], fields="public_url").json()
+        assert public_url.get("public_url"), "Файл не опубликован"
+
+    def test_copy_and_wait(self, api_client, run_async, folder_with_content):
+        """Тест ожидания асинхронной операции копирования без блокировки."""
+        target = f"{folder_with_content}_async_{uuid.uuid4().hex[:4]}"
+
+        async def scenario(client):
+            response = await client.copy(folder_with_content, target, force_async=True)
+            assert response.status_code in [201, 202], f"Ошибка: {response.text}"
+            status = await client.wait_for_operation(response)
+            meta = await client.get_meta(target)
+            await client.remove(target, permanently=True)
+            return status, meta
+
+        status, meta = run_async(scenario)
+
+        assert status == "success"
+        assert meta.status_code == 200, f"Ошибка: {meta.text}"
+
+    def test_upload_download_roundtrip(self, run_async, random_file_path):
+        """Тест загрузки и скачивания файла асинхронным клиентом."""
+        content = b"async payload " * 1024
+
+        async def scenario(client):
+            upload = await client.upload(random_file_path, content)
+            download = await client.download(random_file_path)
+            return upload, download
+
+        upload, download = run_async(scenario)
+
+        assert upload.status_code in [201, 202], f"Ошибка: {upload.text}"
+        assert download.status_code == 200
+        assert download.content == content
+
+    def test_no_auth(self, api_client, run_async):
+        """Тест запроса без токена: 401, как и у синхронного клиента."""
+
+        async def scenario(client):
+            async with AsyncDiskClient(base_url=client.base_url) as anonymous:
+                return await anonymous.get_meta("/")
+
+        response = run_async(scenario)
+
+        assert response.status_code == 401
+
+    def test_shares_bucket_with_sync_client(self, api_client, run_async):
+        """Тест: асинхронный и синхронный клиенты делят bucket токена."""
+
+        async def scenario(client):
+            return client.limiter.bucket
+
+        assert run_async(scenario) is api_client.session.limiter.bucket
+
+    def test_transfers_bypass_limiter(self, monkeypatch):
+        """
+        Тест: PUT и GET на хосты загрузки и скачивания не расходуют токены
+        ограничителя API и передают тело-итератор один раз.
+        """
+
+        async def chunks():
+            for i in range(3):
+                yield f"chunk {i}\n".encode()
+
+        with FakeDiskServer() as server:
+
+            async def main():
+                async with AsyncDiskClient("async-token", server.base_url) as client:
+                    reserved = []
+                    reserve = client.limiter.bucket.reserve
+                    monkeypatch.setattr(
+                        client.limiter.bucket,
+                        "reserve",
+                        lambda: reserved.append(1) or reserve(),
+                    )
+                    upload = await client.upload("/async.txt", chunks())
+                    download = await client.download("/async.txt")
+                    return upload, download, len(reserved)
+
+            upload, download, reserved = asyncio.run(main())
+
+        assert upload.status_code in [201, 202], f"Ошибка: {upload.text}"
+        assert download.content == b"chunk 0\nchunk 1\nchunk 2\n"
+        assert reserved == 2, "Токены API потрачены на передачу файла"
+
+    def test_retry_on_429(self):
+        """Тест повтора ответов 429 с паузой из Retry-After."""
+        with FakeDiskServer() as server:
+            server.disk.throttle("async-token", count=2, retry_after=0)
+
+            async def main():
+                async with AsyncDiskClient("async-token", server.base_url) as client:
+                    return await client.get_meta("/")
+
+            response = asyncio.run(main())
+
+        assert response.status_code == 200, f"Ошибка: {response.text}"
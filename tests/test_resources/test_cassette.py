@@ -0,0 +1,88 @@
+import pytest
+
+from yandexaqa.cassette import (
+    CassetteError,
+    Recorder,
+    cassette_name,
+    install,
+    normalize,
+)
+from yandexaqa.client import DiskClient
+
+# Адрес, на котором заведомо нет сервера: воспроизведение не должно идти в сеть
+UNREACHABLE_URL = "http://127.0.0.1:9/v1/disk"
+
+
+@pytest.fixture
+def live_client(request, api_client, api_token):
+    """Фикстура отдельного клиента без кассет текущего прогона."""
+    if request.config.getoption("--record-mode") == "replay":
+        pytest.skip("Для записи кассеты нужен доступ к API")
+    client = DiskClient(token=api_token, base_url=api_client.base_url)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def replay_client(api_token, tmp_path):
+    """
+    Фикстура клиента, воспроизводящего кассеты из tmp_path без сети.
+    Возвращает (клиент, Recorder).
+    """
+    replayer = Recorder("replay", tmp_path)
+    client = install(DiskClient(token=api_token, base_url=UNREACHABLE_URL), replayer)
+    yield client, replayer
+    client.close()
+
+
+class TestCassette:
+    """Тесты записи и воспроизведения ответов API."""
+
+    def test_normalize_dynamic_values(self):
+        """Тест: случайные идентификаторы заменяются заглушками."""
+        url = "/resources?path=/aqa_1a2b3c4d_gw1/test_folder_9f8e7d6c&limit=1000"
+
+        assert (
+            normalize(url)
+            == "/resources?path=/aqa_<id>_<id>/test_folder_<id>&limit=1000"
+        )
+        assert normalize("/operations/MqeRFMv2-abc") == "/operations/<id>"
+
+    def test_cassette_name(self):
+        """Тест имени кассеты по id теста."""
+        nodeid = (
+            "tests/test_trash/test_get_trash.py::TestGetTrash::test_get[/ - x]@serial"
+        )
+
+        assert (
+            cassette_name(nodeid)
+            == "test_trash/test_get_trash/TestGetTrash/test_get[_-_x]"
+        )
+
+    def test_record_and_replay(self, live_client, replay_client, random_path, tmp_path):
+        """
+        Тест: записанные ответы воспроизводятся без сети, а идентификаторы
+        в ответах заменяются идентификаторами текущего прогона.
+        """
+        recorder = Recorder("record", tmp_path)
+        install(live_client, recorder)
+        with recorder.use("roundtrip"):
+            created = live_client.create_folder(random_path)
+            meta = live_client.get_meta(random_path, fields="path,type")
+
+        replay_path = f"{random_path.rsplit('_', 1)[0]}_0123abcd"
+        client, replayer = replay_client
+        with replayer.use("roundtrip"):
+            replayed_created = client.create_folder(replay_path)
+            replayed_meta = client.get_meta(replay_path, fields="path,type")
+
+        assert replayed_created.status_code == created.status_code == 201
+        assert replayed_meta.status_code == meta.status_code == 200
+        assert replayed_meta.json() == {"path": f"disk:{replay_path}", "type": "dir"}
+
+    def test_replay_missing_interaction(self, replay_client):
+        """Тест: запрос, которого нет в кассете, приводит к CassetteError."""
+        client, replayer = replay_client
+
+        with replayer.use("empty"), pytest.raises(CassetteError):
+            client.get_meta("/missing.txt")
@@ -0,0 +1,99 @@
+import uuid
+
+import requests
+
+from yandexaqa.paging import iter_trash
+from yandexaqa.registry import ResourceRegistry, collapse, find_orphans, sweep
+
+
+class TestResourceRegistry:
+    """Тесты пакетного удаления тестовых ресурсов."""
+
+    def test_collapse_nested_paths(self):
+        """Тест: вложенные пути не удаляются отдельно от папки-предка."""
+        paths = ["/a/b/c.txt", "disk:/a/b", "/a/bc", "/d/", "/a/b/d"]
+
+        assert collapse(paths) == ["/a/b", "/a/bc", "/d"]
+
+    def test_collapse_sibling_sorted_between(self):
+        """
+        Тест: соседний путь, который сортируется между папкой и её
+        содержимым ('-' < '/'), не мешает свернуть вложенный путь.
+        """
+        assert collapse(["/a", "/a-b", "/a/b"]) == ["/a", "/a-b"]
+
+    def test_purge_reports_http_errors(self):
+        """
+        Тест: ошибка HTTP при ожидании операции попадает в отчёт purge
+        и не прерывает удаление остальных путей.
+        """
+
+        class FailingClient:
+            def remove(self, path, permanently=False):
+                response = requests.Response()
+                response.status_code = 202
+                response.url = path
+                return response
+
+            def wait_for_operation(self, response, timeout=None):
+                if response.url == "/broken":
+                    raise requests.HTTPError("500 Server Error")
+                return "success"
+
+        registry = ResourceRegistry(FailingClient())
+        for path in ["/broken", "/ok"]:
+            registry.register(path)
+
+        assert registry.purge() == {"/broken": "500 Server Error"}
+
+    def test_purge_removes_permanently(self, api_client, sandbox, file_in_trash):
+        """
+        Тест: purge удаляет зарегистрированные ресурсы безвозвратно,
+        не добавляя их в корзину, и пропускает уже удаленные пути.
+        """
+        registry = ResourceRegistry(api_client)
+        folder_path = registry.register(f"{sandbox}/test_folder_{uuid.uuid4().hex[:8]}")
+        api_client.create_folder(folder_path)
+        api_client.upload(f"{folder_path}/file.txt", b"content")
+        registry.register(f"{folder_path}/file.txt")
+        registry.register(file_in_trash)
+
+        errors = registry.purge()
+
+        assert errors == {}
+        assert not registry.paths
+        assert api_client.get_meta(folder_path).status_code == 404
+        assert not any(
+            item.origin_path.endswith(folder_path)
+            for item in iter_trash(api_client, fields="origin_path")
+        ), "Удаленная папка попала в корзину"
+
+
+class TestSweep:
+    """Тесты поиска и удаления ресурсов, оставшихся от прошлых прогонов."""
+
+    def test_sweep_orphans(self, api_client, resource_registry):
+        """Тест: sweep удаляет ресурсы с префиксом и не трогает исключенные."""
+        prefix = f"aqa_sweep_{uuid.uuid4().hex[:8]}_"
+        orphan = resource_registry.register(f"/{prefix}orphan")
+        current = resource_registry.register(f"/{prefix}current")
+        api_client.create_folder(orphan)
+        api_client.create_folder(current)
+
+        removed, errors = sweep(
+            api_client, prefixes=[prefix], exclude=[f"{prefix}current"]
+        )
+
+        assert removed == [orphan]
+        assert errors == {}
+        assert api_client.get_meta(orphan).status_code == 404
+        assert api_client.get_meta(current).status_code == 200
+
+    def test_sweep_skips_recent(self, api_client, resource_registry):
+        """Тест: при older_than не удаляются только что созданные ресурсы."""
+        prefix = f"aqa_sweep_{uuid.uuid4().hex[:8]}_"
+        recent = resource_registry.register(f"/{prefix}recent")
+        api_client.create_folder(recent)
+
+        assert find_orphans(api_client, prefixes=[prefix], older_than=3600) == []
+        assert find_orphans(api_client, prefixes=[prefix]) == [recent]
@@ -1,12 +1,13 @@
 import pytest
 import uuid
-import time
+
+from yandexaqa.tree import diff_trees
 
 
 class TestCopyResource:
     """Тесты для операции копирования ресурса."""
 
-    def test_copy_folder_success(self, api_client, folder_with_content):
+    def test_copy_folder_success(self, api_client, sandbox, shared_folder_path):
         """
         Тест успешного копирования папки с содержимым.
         API может выполнить операцию как синхронно (201), так и асинхронно (202).
@@ -14,13 +15,11 @@ class TestCopyResource:
         Ожидаемый результат:
             - Код ответа: 201 Created ИЛИ 202 Accepted (асинхронная операция).
             - В ответе есть ссылка (href) для отслеживания результата.
+            - Дерево копии совпадает с исходным (пути, размеры, md5, sha256).
         """
-        copy_path = f"/copy_of_folder_{uuid.uuid4().hex[:8]}"
+        copy_path = f"{sandbox}/copy_of_folder_{uuid.uuid4().hex[:8]}"
 
-        response = api_client.post(
-            f"{api_client.base_url}/resources/copy",
-            params={"from": folder_with_content, "path": copy_path},
-        )
+        response = api_client.copy(shared_folder_path, copy_path)
 
         assert response.status_code in [201, 202], (
             f"Ожидался код 201 или 202, получен {response.status_code}. "
@@ -32,21 +31,15 @@ class TestCopyResource:
 
         if response.status_code == 202:
             assert "operations" in data["href"]
-            import time
 
-            time.sleep(3)
+        api_client.wait_for_operation(response)
 
-        check_response = api_client.get(
-            f"{api_client.base_url}/resources", params={"path": copy_path}
-        )
-        assert check_response.status_code != 500
+        diff = diff_trees(api_client, shared_folder_path, copy_path)
+        assert not diff, f"Копия отличается от исходной папки: {diff}"
 
-        if check_response.status_code == 200:
-            api_client.delete(
-                f"{api_client.base_url}/resources", params={"path": copy_path}
-            )
+        api_client.remove(copy_path, permanently=True)
 
-    def test_copy_with_overwrite_true(self, api_client, test_file_path):
+    def test_copy_with_overwrite_true(self, api_client, sandbox, shared_file_path):
         """
         Тест копирования с перезаписью существующего ресурса (overwrite=true).
 
@@ -54,25 +47,19 @@ class TestCopyResource:
             - Код ответа: 201 Created.
             - Существующий файл по целевому пути перезаписан.
         """
-        copy_path = f"/overwrite_test_file_{uuid.uuid4().hex[:8]}.txt"
+        copy_path = f"{sandbox}/overwrite_test_file_{uuid.uuid4().hex[:8]}.txt"
 
-        api_client.post(
-            f"{api_client.base_url}/resources/copy",
-            params={"from": test_file_path, "path": copy_path},
-        )
+        api_client.copy(shared_file_path, copy_path)
 
-        response = api_client.post(
-            f"{api_client.base_url}/resources/copy",
-            params={"from": test_file_path, "path": copy_path, "overwrite": "true"},
-        )
+        response = api_client.copy(shared_file_path, copy_path, overwrite="true")
 
         assert response.status_code == 201, f"Ошибка: {response.text}"
 
-        api_client.delete(
-            f"{api_client.base_url}/resources", params={"path": copy_path}
-        )
+        api_client.remove(copy_path, permanently=True)
 
-    def test_copy_with_overwrite_false_conflict(self, api_client, test_file_path):
+    def test_copy_with_overwrite_false_conflict(
+        self, api_client, sandbox, shared_file_path
+    ):
         """
         Тест копирования без перезаписи (overwrite=false) при существующем ресурсе.
 
@@ -80,25 +67,17 @@ class TestCopyResource:
             - Код ответа: 409 Conflict.
             - Возвращается ошибка о том, что ресурс уже существует.
         """
-        copy_path = f"/conflict_test_file_{uuid.uuid4().hex[:8]}.txt"
+        copy_path = f"{sandbox}/conflict_test_file_{uuid.uuid4().hex[:8]}.txt"
 
-        api_client.post(
-            f"{api_client.base_url}/resources/copy",
-            params={"from": test_file_path, "path": copy_path},
-        )
+        api_client.copy(shared_file_path, copy_path)
 
-        response = api_client.post(
-            f"{api_client.base_url}/resources/copy",
-            params={"from": test_file_path, "path": copy_path, "overwrite": "false"},
-        )
+        response = api_client.copy(shared_file_path, copy_path, overwrite="false")
 
         assert (
             response.status_code == 409
         ), f"Ожидалась ошибка 409. Ответ: {response.text}"
 
-        api_client.delete(
-            f"{api_client.base_url}/resources", params={"path": copy_path}
-        )
+        api_client.remove(copy_path, permanently=True)
 
     @pytest.mark.parametrize(
         "force_async_param,expected_codes",
@@ -108,7 +87,7 @@ class TestCopyResource:
         ],
     )
     def test_copy_with_force_async(
-        self, api_client, test_file_path, force_async_param, expected_codes
+        self, api_client, sandbox, shared_file_path, force_async_param, expected_codes
     ):
         """
         Тест копирования с параметром force_async.
@@ -117,15 +96,12 @@ class TestCopyResource:
             - При force_async=true: код 202 (асинхронная операция).
             - При force_async=false: код 201 или 202 в зависимости от размера.
         """
-        copy_path = f"/async_test_file_{uuid.uuid4().hex[:8]}_{force_async_param}.txt"
-
-        response = api_client.post(
-            f"{api_client.base_url}/resources/copy",
-            params={
-                "from": test_file_path,
-                "path": copy_path,
-                "force_async": force_async_param,
-            },
+        copy_path = (
+            f"{sandbox}/async_test_file_{uuid.uuid4().hex[:8]}_{force_async_param}.txt"
+        )
+
+        response = api_client.copy(
+            shared_file_path, copy_path, force_async=force_async_param
         )
 
         assert (
@@ -139,20 +115,16 @@ class TestCopyResource:
             assert "operation" in data["href"] or data.get("templated") is True
 
         if response.status_code == 201:
-            api_client.delete(
-                f"{api_client.base_url}/resources", params={"path": copy_path}
-            )
+            api_client.remove(copy_path, permanently=True)
         elif response.status_code == 202:
-            time.sleep(2)
+            api_client.wait_for_operation(response)
 
             try:
-                api_client.delete(
-                    f"{api_client.base_url}/resources", params={"path": copy_path}
-                )
+                api_client.remove(copy_path, permanently=True)
             except:
                 pass
 
-    def test_copy_with_fields(self, api_client, test_file_path):
+    def test_copy_with_fields(self, api_client, sandbox, shared_file_path):
         """
         Тест копирования с ограничением возвращаемых полей (fields).
 
@@ -160,12 +132,9 @@ class TestCopyResource:
             - Код ответа: 201 Created.
             - Ответ содержит только указанные поля.
         """
-        copy_path = f"/fields_test_file_{uuid.uuid4().hex[:8]}.txt"
+        copy_path = f"{sandbox}/fields_test_file_{uuid.uuid4().hex[:8]}.txt"
 
-        response = api_client.post(
-            f"{api_client.base_url}/resources/copy",
-            params={"from": test_file_path, "path": copy_path, "fields": "href,method"},
-        )
+        response = api_client.copy(shared_file_path, copy_path, fields="href,method")
 
         if response.status_code == 201:
             data = response.json()
@@ -173,9 +142,7 @@ class TestCopyResource:
 
         if response.status_code in [201, 202]:
             try:
-                api_client.delete(
-                    f"{api_client.base_url}/resources", params={"path": copy_path}
-                )
+                api_client.remove(copy_path, permanently=True)
             except:
                 pass
 
@@ -189,7 +156,7 @@ class TestCopyResource:
         ],
     )
     def test_copy_invalid_paths(
-        self, api_client, test_file_path, from_path, to_path, expected_status
+        self, api_client, sandbox, shared_file_path, from_path, to_path, expected_status
     ):
         """
         Параметризованный тест для некорректных путей.
@@ -198,15 +165,12 @@ class TestCopyResource:
             - Сервер возвращает соответствующий код ошибки.
         """
         if from_path == "VALID_FILE_PLACEHOLDER":
-            from_path = test_file_path
+            from_path = shared_file_path
 
         if to_path == "/copy.txt":
-            to_path = f"/copy_{uuid.uuid4().hex[:4]}.txt"
+            to_path = f"{sandbox}/copy_{uuid.uuid4().hex[:4]}.txt"
 
-        response = api_client.post(
-            f"{api_client.base_url}/resources/copy",
-            params={"from": from_path, "path": to_path},
-        )
+        response = api_client.copy(from_path, to_path)
 
         assert response.status_code == expected_status, (
             f"Ожидался код {expected_status}, получен {response.status_code}. "
@@ -1,6 +1,5 @@
 import pytest
 import uuid
-from requests import Session
 
 class TestCreateFolderResource:
     """Тесты для проверки успешного создания и обработки основных ошибок валидации"""
@@ -9,13 +8,9 @@ class TestCreateFolderResource:
         """
         Тест успешного создания новой папки.
         """
-        response = api_client.put(
-            f"{api_client.base_url}/resources", params={"path": random_path}
-        )
+        response = api_client.create_folder(random_path)
         assert response.status_code == 201, f"Ошибка: {response.text}"
-        api_client.delete(
-            f"{api_client.base_url}/resources", params={"path": random_path}
-        )
+        api_client.remove(random_path, permanently=True)
 
     @pytest.mark.parametrize(
         "invalid_path, expected_status, description",
@@ -44,9 +39,7 @@ class TestCreateFolderResource:
             - Сервер возвращает предсказуемый код ошибки (400 или 409).
             - Ответ содержит поясняющее сообщение.
         """
-        response = api_client.put(
-            f"{api_client.base_url}/resources", params={"path": invalid_path}
-        )
+        response = api_client.create_folder(invalid_path)
         assert (
             response.status_code == expected_status
         ), f"{description}. Путь: '{invalid_path}'. Ответ: {response.text}"
@@ -57,9 +50,7 @@ class TestCreateFolderResource:
         """
         non_existent_parent = f"/non_existent_{uuid.uuid4().hex[:8]}"
         nested_path = f"{non_existent_parent}/new_folder"
-        response = api_client.put(
-            f"{api_client.base_url}/resources", params={"path": nested_path}
-        )
+        response = api_client.create_folder(nested_path)
         assert (
             response.status_code == 409
         ), f"Ожидалась ошибка 409. Получено: {response.status_code}. Ответ: {response.text}"
@@ -72,24 +63,16 @@ class TestCreateFolderResource:
         """
         Тест попытки создания папки, которая уже существует.
         """
-        api_client.put(f"{api_client.base_url}/resources", params={"path": random_path})
-        response = api_client.put(
-            f"{api_client.base_url}/resources", params={"path": random_path}
-        )
+        api_client.create_folder(random_path)
+        response = api_client.create_folder(random_path)
         assert response.status_code == 409
-        api_client.delete(
-            f"{api_client.base_url}/resources", params={"path": random_path}
-        )
+        api_client.remove(random_path, permanently=True)
 
-    def test_create_folder_no_token_401(self):
+    def test_create_folder_no_token_401(self, anonymous_client):
         """
         Тест попытки создания папки без предоставления OAuth-токена.
         """
-
-        client = Session()
-        client.base_url = "https://cloud-api.yandex.net/v1/disk"
-        response = client.put(
-            f"{client.base_url}/resources",
-            params={"path": f"/test_no_auth_{uuid.uuid4().hex[:8]}"},
+        response = anonymous_client.create_folder(
+            f"/test_no_auth_{uuid.uuid4().hex[:8]}"
         )
         assert response.status_code == 401
@@ -1,17 +1,18 @@
 import pytest
-import requests
+
+from yandexaqa.download import DownloadError, verify_download
+from yandexaqa.models import Resource
+from yandexaqa.streams import synthetic_digests, synthetic_payload
 
 
 class TestGetDownloadLink:
     """Тесты для получения ссылки на скачивание файла."""
 
-    def test_get_download_link_success(self, api_client, test_file_path):
+    def test_get_download_link_success(self, api_client, shared_file_path):
         """
         Тест успешного получения ссылки на скачивание существующего файла.
         """
-        response = api_client.get(
-            f"{api_client.base_url}/resources/download", params={"path": test_file_path}
-        )
+        response = api_client.get_download_link(shared_file_path)
 
         assert response.status_code == 200, f"Ошибка: {response.text}"
 
@@ -20,18 +21,15 @@ class TestGetDownloadLink:
         assert "method" in data, "Ответ должен содержать поле method"
         assert data.get("method") == "GET", "Метод скачивания должен быть GET"
 
-        download_response = requests.get(data["href"], stream=True)
+        download_response = api_client.transfer_session.get(data["href"], stream=True)
         assert download_response.status_code == 200, "Ссылка для скачивания не работает"
         download_response.close()
 
-    def test_get_download_link_with_fields(self, api_client, test_file_path):
+    def test_get_download_link_with_fields(self, api_client, shared_file_path):
         """
         Тест получения ссылки на скачивание с указанием необязательного параметра fields.
         """
-        response = api_client.get(
-            f"{api_client.base_url}/resources/download",
-            params={"path": test_file_path, "fields": "href,method"},
-        )
+        response = api_client.get_download_link(shared_file_path, fields="href,method")
 
         assert response.status_code == 200, f"Ошибка: {response.text}"
 
@@ -63,9 +61,7 @@ class TestGetDownloadLink:
             - Сервер возвращает соответствующий код ошибки.
             - Ответ содержит описание проблемы.
         """
-        response = api_client.get(
-            f"{api_client.base_url}/resources/download", params={"path": invalid_path}
-        )
+        response = api_client.get_download_link(invalid_path)
 
         assert response.status_code == expected_status, (
             f"Ожидался код {expected_status}, получен {response.status_code}. "
@@ -76,11 +72,9 @@ class TestGetDownloadLink:
         """
         Тест получения ссылки на скачивание папки.
         """
-        api_client.put(f"{api_client.base_url}/resources", params={"path": random_path})
+        api_client.create_folder(random_path)
 
-        response = api_client.get(
-            f"{api_client.base_url}/resources/download", params={"path": random_path}
-        )
+        response = api_client.get_download_link(random_path)
 
         assert response.status_code == 200, (
             f"Ожидался успешный код 200 для папки. Получено: {response.status_code}. "
@@ -90,32 +84,24 @@ class TestGetDownloadLink:
         data = response.json()
         assert "href" in data
         assert "download" in data["href"] or "zip" in data["href"]
-        api_client.delete(
-            f"{api_client.base_url}/resources", params={"path": random_path}
-        )
+        api_client.remove(random_path, permanently=True)
 
-    def test_get_download_link_no_auth(self):
+    def test_get_download_link_no_auth(self, anonymous_client):
         """
         Тест попытки получения ссылки без аутентификации.
         """
-        client = requests.Session()
-        client.base_url = "https://cloud-api.yandex.net/v1/disk"
-
-        response = client.get(
-            f"{client.base_url}/resources/download", params={"path": "/some_file.txt"}
-        )
+        response = anonymous_client.get_download_link("/some_file.txt")
 
         assert (
             response.status_code == 401
         ), f"Ожидался код 401, получен {response.status_code}. Ответ: {response.text}"
 
-    def test_get_download_link_malformed_fields(self, api_client, test_file_path):
+    def test_get_download_link_malformed_fields(self, api_client, shared_file_path):
         """
         Тест получения ссылки с некорректным форматом параметра fields.
         """
-        response = api_client.get(
-            f"{api_client.base_url}/resources/download",
-            params={"path": test_file_path, "fields": "invalid_field,another_invalid"},
+        response = api_client.get_download_link(
+            shared_file_path, fields="invalid_field,another_invalid"
         )
         if response.status_code == 400:
             assert (
@@ -132,9 +118,58 @@ class TestGetDownloadLink:
         """
         test_file = "/test_file_with_spaces and (special).txt"
 
-        response = api_client.get(
-            f"{api_client.base_url}/resources/download", params={"path": test_file}
-        )
+        response = api_client.get_download_link(test_file)
 
         assert response.status_code != 400
         assert response.status_code in [200, 404]
+
+
+class TestDownloadContent:
+    """Тесты скачивания файла с проверкой содержимого по md5/sha256."""
+
+    @pytest.mark.parametrize("fixture_name", ["shared_file_path", "shared_image_path"])
+    def test_download_matches_metadata(self, request, api_client, fixture_name):
+        """
+        Тест скачивания файла: размер, md5 и sha256 содержимого совпадают
+        с метаданными из GET /resources.
+        """
+        path = request.getfixturevalue(fixture_name)
+
+        result = verify_download(api_client, path)
+
+        assert result.size > 0, "Скачан пустой файл"
+
+    def test_download_large_file(self, request, api_client, random_file_path):
+        """
+        Тест скачивания большого синтетического файла (опция --upload-size)
+        с потоковой проверкой контрольных сумм.
+        """
+        size = request.config.getoption("--upload-size")
+        response = api_client.upload(random_file_path, synthetic_payload(size))
+        if response.status_code not in [201, 202]:
+            pytest.skip(f"Не удалось загрузить файл: {response.text}")
+
+        result = verify_download(api_client, random_file_path, chunk_size=64 * 1024)
+
+        assert result.size == size
+        assert (result.md5, result.sha256) == synthetic_digests(size)
+
+    def test_download_detects_mismatch(self, api_client, shared_file_path):
+        """Тест: расхождение с ожидаемыми метаданными приводит к DownloadError."""
+        expected = Resource.from_json({"md5": "0" * 32})
+
+        with pytest.raises(DownloadError, match="md5"):
+            verify_download(api_client, shared_file_path, expected=expected)
+
+    def test_download_requires_digest(self, api_client, shared_file_path):
+        """Тест: без md5 и sha256 в метаданных проверка по одному размеру не проходит."""
+        size = api_client.get_meta(shared_file_path, fields="size").json()["size"]
+        expected = Resource.from_json({"size": size})
+
+        with pytest.raises(DownloadError, match="контрольных сумм"):
+            verify_download(api_client, shared_file_path, expected=expected)
+
+    def test_download_nonexistent_file(self, api_client, random_file_path):
+        """Тест скачивания несуществующего файла."""
+        with pytest.raises(DownloadError, match="404"):
+            verify_download(api_client, random_file_path)
@@ -0,0 +1,146 @@
+import pytest
+
+from yandexaqa.cache import MetaCache
+from yandexaqa.client import DiskClient
+from yandexaqa.fields import FieldTracker, call_site, minimal_fields, track
+
+THIS_FILE = "tests/test_resources/test_fields.py"
+
+
+def _reader(meta):
+    return meta["name"], [item["path"] for item in meta["_embedded"]["items"]]
+
+
+def test_tracked_reads():
+    """Тест: учитываются прочитанные ключи, элементы списка — под путём списка."""
+    used = set()
+    data = track(
+        {"name": "a", "type": "dir", "_embedded": {"items": [{"path": "/a/1"}]}},
+        used,
+    )
+
+    assert _reader(data) == ("a", ["/a/1"])
+    assert data.get("size") is None
+    assert used == {
+        "name",
+        "size",
+        "_embedded",
+        "_embedded.items",
+        "_embedded.items.path",
+    }
+    assert minimal_fields(used) == "_embedded.items.path,name,size"
+
+
+@pytest.mark.parametrize(
+    "use",
+    [
+        lambda data: data == {"name": "a"},
+        lambda data: list(data),
+        lambda data: len(data),
+        lambda data: repr(data),
+    ],
+    ids=["eq", "iter", "len", "repr"],
+)
+def test_whole_object_usage(use):
+    """Тест: операции над ответом целиком отменяют проекцию."""
+    used = set()
+    use(track({"name": "a"}, used))
+    assert minimal_fields(used) is None
+
+
+def test_nested_whole_object_collapses():
+    """Тест: поле, использованное целиком, поглощает вложенные."""
+    used = {"_embedded", "_embedded.*", "_embedded.items", "_embedded.items.name"}
+    assert minimal_fields(used | {"name"}) == "_embedded,name"
+
+
+def test_tracked_view_built_once():
+    """Тест: вложенные объекты оборачиваются один раз и отдаются повторно."""
+    data = track({"_embedded": {"items": [{"path": "/a/1"}]}}, set())
+
+    assert data["_embedded"] is data.get("_embedded")
+    items = data["_embedded"]["items"]
+    assert items[0] is items[-1] is next(iter(items))
+
+
+def test_call_site_outside_package():
+    """Тест: место вызова — функция теста, а не клиента."""
+    assert call_site() == f"{THIS_FILE}::test_call_site_outside_package"
+
+
+@pytest.fixture
+def tracked_client(api_client):
+    """Фикстура клиента с учётом полей поверх сессии api_client."""
+    client = DiskClient(session=api_client.session)
+    yield FieldTracker().attach(client)
+    client.transfer_session.close()
+
+
+class TestFieldsProjection:
+    """Тесты учёта полей и применения выученной проекции."""
+
+    def test_learn_and_apply(self, tracked_client, folder_with_content):
+        """
+        Тест: учебный прогон находит проекцию места вызова, а с выученной
+        проекцией ответ меньше и содержит прочитанные поля.
+        """
+
+        def read_listing():
+            response = tracked_client.get_meta(folder_with_content)
+            assert response.status_code == 200, f"Ошибка: {response.text}"
+            return response, _reader(response.json())
+
+        full, expected = read_listing()
+        site = f"resources {THIS_FILE}::read_listing"
+        report = tracked_client.fields_tracker.report()
+        assert report[site]["fields"] == "_embedded.items.path,name"
+
+        FieldTracker(learned={site: report[site]["fields"]}).attach(tracked_client)
+        projected, actual = read_listing()
+
+        assert actual == expected
+        assert "fields=" in projected.request.url
+        assert len(projected.content) < len(full.content)
+
+    def test_explicit_fields_not_tracked(self, tracked_client, shared_file_path):
+        """Тест: запросы с явным fields не учитываются и не меняются."""
+        response = tracked_client.get_meta(shared_file_path, fields="name")
+        assert response.status_code == 200, f"Ошибка: {response.text}"
+        assert tracked_client.fields_tracker.report() == {}
+
+    def test_tracked_json_memoized(self, tracked_client, folder_with_content):
+        """Тест: повторный json() возвращает то же отслеживающее представление."""
+        response = tracked_client.get_meta(folder_with_content)
+        assert response.status_code == 200, f"Ошибка: {response.text}"
+        assert response.json() is response.json()
+
+    def test_cache_hits_observed(self, tracked_client, shared_file_path):
+        """
+        Тест: ответ из кэша учитывается для места вызова, которому он
+        отдан, и чтения записываются в его проекцию.
+        """
+        tracked_client.cache = MetaCache(ttl=60)
+
+        def read_name():
+            return tracked_client.get_meta(shared_file_path).json()["name"]
+
+        def read_size():
+            return tracked_client.get_meta(shared_file_path).json()["size"]
+
+        assert read_name() and read_size()
+        assert tracked_client.cache.hits == 1
+        report = tracked_client.fields_tracker.report()
+        assert report[f"resources {THIS_FILE}::read_name"]["fields"] == "name"
+        assert report[f"resources {THIS_FILE}::read_size"]["fields"] == "size"
+
+    def test_merge_worker_dump(self):
+        """Тест: учёт с воркеров xdist складывается на контроллере."""
+        worker = FieldTracker()
+        worker.load({"resources t.py::f": [2, 100, ["name"]]})
+        controller = FieldTracker()
+        controller.load(worker.dump())
+        controller.load({"resources t.py::f": [1, 50, ["type"]]})
+
+        stats = controller.report()["resources t.py::f"]
+        assert (stats["calls"], stats["mean_bytes"]) == (3, 50)
+        assert stats["fields"] == "name,type"
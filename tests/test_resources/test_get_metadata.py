@@ -1,63 +1,54 @@
 import pytest
-from requests import Session
+
+from yandexaqa.paging import iter_resources
 
 
 class TestGetResourceMetadata:
     """Тесты для получения метаинформации о ресурсе."""
 
-    def test_get_file_metadata_success(self, api_client, test_file_path):
+    def test_get_file_metadata_success(self, api_client, shared_file_path):
         """
         Тест успешного получения метаданных существующего файла.
         """
-        response = api_client.get(
-            f"{api_client.base_url}/resources", params={"path": test_file_path}
-        )
+        response = api_client.get_meta(shared_file_path)
 
         assert response.status_code == 200, f"Ошибка: {response.text}"
         data = response.json()
         assert data["type"] == "file"
-        assert data["path"] == f"disk:{test_file_path}"
+        assert data["path"] == f"disk:{shared_file_path}"
         assert "name" in data
 
     def test_get_folder_metadata_success(self, api_client, random_path):
         """
         Тест успешного получения метаданных существующей папки.
         """
-        api_client.put(f"{api_client.base_url}/resources", params={"path": random_path})
+        api_client.create_folder(random_path)
 
-        response = api_client.get(
-            f"{api_client.base_url}/resources", params={"path": random_path}
-        )
+        response = api_client.get_meta(random_path)
 
         assert response.status_code == 200, f"Ошибка: {response.text}"
         data = response.json()
         assert data["type"] == "dir"
 
-        api_client.delete(
-            f"{api_client.base_url}/resources", params={"path": random_path}
-        )
+        api_client.remove(random_path, permanently=True)
 
     def test_get_folder_metadata_with_embedded(
-        self, api_client, random_path, test_file_path
+        self, api_client, random_path, shared_file_path
     ):
         """
         Тест получения метаданных папки с проверкой содержимого (_embedded).
         """
         # Создаем папку
-        api_client.put(f"{api_client.base_url}/resources", params={"path": random_path})
+        api_client.create_folder(random_path)
 
-        response = api_client.get(
-            f"{api_client.base_url}/resources", params={"path": random_path}
-        )
+        response = api_client.get_meta(random_path)
 
         assert response.status_code == 200
         data = response.json()
         assert "_embedded" in data
         assert "items" in data["_embedded"]
 
-        api_client.delete(
-            f"{api_client.base_url}/resources", params={"path": random_path}
-        )
+        api_client.remove(random_path, permanently=True)
 
     @pytest.mark.parametrize(
         "fields, expected_field_count",
@@ -67,15 +58,12 @@ class TestGetResourceMetadata:
         ],
     )
     def test_get_metadata_with_fields(
-        self, api_client, test_file_path, fields, expected_field_count
+        self, api_client, shared_file_path, fields, expected_field_count
     ):
         """
         Параметризованный тест с параметром fields.
         """
-        response = api_client.get(
-            f"{api_client.base_url}/resources",
-            params={"path": test_file_path, "fields": fields},
-        )
+        response = api_client.get_meta(shared_file_path, fields=fields)
 
         assert response.status_code == 200
         data = response.json()
@@ -95,12 +83,9 @@ class TestGetResourceMetadata:
         """
         Тест работы пагинации через limit и offset для папки с содержимым.
         """
-        api_client.put(f"{api_client.base_url}/resources", params={"path": random_path})
+        api_client.create_folder(random_path)
 
-        response = api_client.get(
-            f"{api_client.base_url}/resources",
-            params={"path": random_path, "limit": limit, "offset": offset},
-        )
+        response = api_client.get_meta(random_path, limit=limit, offset=offset)
 
         assert response.status_code == 200
         data = response.json()
@@ -109,21 +94,41 @@ class TestGetResourceMetadata:
             assert data["_embedded"]["offset"] == offset
             assert len(data["_embedded"]["items"]) <= limit
 
-        api_client.delete(
-            f"{api_client.base_url}/resources", params={"path": random_path}
-        )
+        api_client.remove(random_path, permanently=True)
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_get_metadata_large_folder_pagination(
+        self, request, api_client, large_folder_path, prefetch
+    ):
+        """
+        Тест постраничного обхода большой папки ленивым итератором.
+
+        Ожидаемый результат:
+            - Число элементов совпадает с числом загруженных файлов.
+            - Страницы не пересекаются и вместе содержат все файлы.
+        """
+        size = request.config.getoption("--large-folder-size")
 
-    def test_get_metadata_with_preview_params(self, api_client, test_file_path):
+        names = [
+            item.name
+            for item in iter_resources(
+                api_client,
+                large_folder_path,
+                page_size=100,
+                fields="name",
+                prefetch=prefetch,
+            )
+        ]
+
+        assert len(names) == size
+        assert len(set(names)) == size, "Страницы пересекаются"
+
+    def test_get_metadata_with_preview_params(self, api_client, shared_file_path):
         """
         Тест работы параметров превью (preview_crop, preview_size).
         """
-        response = api_client.get(
-            f"{api_client.base_url}/resources",
-            params={
-                "path": test_file_path,
-                "preview_size": "150x150",
-                "preview_crop": "true",
-            },
+        response = api_client.get_meta(
+            shared_file_path, preview_size="150x150", preview_crop="true"
         )
 
         assert response.status_code == 200
@@ -153,22 +158,18 @@ class TestGetResourceMetadata:
         Ожидаемый результат:
             - Сервер возвращает соответствующий код ошибки.
         """
-        response = api_client.get(
-            f"{api_client.base_url}/resources", params={"path": invalid_path}
-        )
+        response = api_client.get_meta(invalid_path)
 
         assert response.status_code == expected_status, (
             f"Ожидался код {expected_status}, получен {response.status_code}. "
             f"Ответ: {response.text}"
         )
 
-    def test_get_metadata_no_auth(self):
+    def test_get_metadata_no_auth(self, anonymous_client):
         """
         Тест попытки получения метаданных без аутентификации.
         """
-        client = Session()
-        client.base_url = "https://cloud-api.yandex.net/v1/disk"
-        response = client.get(f"{client.base_url}/resources", params={"path": "/"})
+        response = anonymous_client.get_meta("/")
 
         assert response.status_code == 401
 
@@ -176,9 +177,7 @@ class TestGetResourceMetadata:
         """
         Тест получения метаданных корневой папки Диска.
         """
-        response = api_client.get(
-            f"{api_client.base_url}/resources", params={"path": "/"}
-        )
+        response = api_client.get_meta("/")
 
         assert response.status_code == 200
         data = response.json()
@@ -191,8 +190,6 @@ class TestGetResourceMetadata:
         Тест получения метаданных для файла со специальными символами.
         """
         special_path = "/test file with spaces & special?chars=1.txt"
-        response = api_client.get(
-            f"{api_client.base_url}/resources", params={"path": special_path}
-        )
+        response = api_client.get_meta(special_path)
 
         assert response.status_code in [200, 404]
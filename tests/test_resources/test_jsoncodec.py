@@ -0,0 +1,96 @@
+import pytest
+import requests
+
+from yandexaqa.jsoncodec import BACKENDS, copy_response, get_loads, install
+from yandexaqa.models import LazyList, ResourceList
+
+
+def _response(body, encoding="utf-8"):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.encoding = encoding
+    return response
+
+
+class TestJsonCodec:
+    """Тесты однократного разбора JSON-ответов."""
+
+    @pytest.mark.parametrize("backend", sorted(BACKENDS))
+    def test_parsed_once(self, backend):
+        """Тест: тело разбирается один раз, повторный json() — тот же объект."""
+        response = install(_response('{"name": "файл"}'.encode()), get_loads(backend))
+        first = response.json()
+        assert first == {"name": "файл"}
+        assert response.json() is first
+
+    @pytest.mark.parametrize("body", [b"", b"not json"], ids=["empty", "invalid"])
+    def test_fallback_errors(self, body):
+        """Тест: неразобранное тело даёт то же исключение, что и requests."""
+        response = install(_response(body), get_loads())
+        with pytest.raises(requests.exceptions.JSONDecodeError):
+            response.json()
+
+    def test_non_utf8_body_uses_requests(self):
+        """Тест: тело не в UTF-8 разбирается исходным json() с учётом кодировки."""
+        body = '{"name": "файл"}'.encode("cp1251")
+        response = install(_response(body, encoding="cp1251"), get_loads())
+        assert response.json() == {"name": "файл"}
+
+    def test_unknown_backend(self):
+        """Тест: неизвестный декодер — понятная ошибка."""
+        with pytest.raises(ValueError, match="simdjson"):
+            get_loads("simdjson")
+
+    def test_api_responses_parsed_once(self, api_client, folder_with_content):
+        """
+        Тест: ответы клиента разбираются декодером один раз, в том числе при
+        учёте полей (--fields-report).
+        """
+        response = api_client.get_meta(folder_with_content)
+        assert response.status_code == 200, f"Ошибка: {response.text}"
+        assert response.json() is response.json()
+
+    def test_cached_copy_parsed_separately(self):
+        """
+        Тест: copy_response разбирает тело заново, изменения результата
+        json() оригинала не видны в копии.
+        """
+        response = install(_response(b'{"name": "a"}'), get_loads())
+        response.json()["name"] = "b"
+
+        clone = copy_response(response)
+
+        assert clone.json() == {"name": "a"}
+        assert clone.json() is clone.json()
+
+
+class TestLazyList:
+    """Тесты ленивого списка моделей."""
+
+    def test_items_built_on_access(self):
+        """Тест: модели создаются при обращении и один раз."""
+        built = []
+
+        def factory(data):
+            built.append(data)
+            return {"model": data}
+
+        items = LazyList([1, 2, 3], factory)
+        assert len(items) == 3 and built == []
+
+        assert items[-1] == {"model": 3}
+        assert items[-1] is items[2]
+        assert items[:2] == [{"model": 1}, {"model": 2}]
+        assert built == [3, 1, 2]
+        with pytest.raises(IndexError):
+            items[3]
+
+    def test_resource_list_items(self):
+        """Тест: элементы ResourceList — модели Resource."""
+        page = ResourceList.from_json(
+            {"items": [{"name": "a", "type": "dir"}, {"name": "b"}], "total": 2}
+        )
+        assert [item.name for item in page.items] == ["a", "b"]
+        assert page.items[0].is_dir
+        assert page.total == 2
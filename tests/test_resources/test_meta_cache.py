@@ -0,0 +1,152 @@
+import time
+
+import pytest
+
+from yandexaqa.cache import MetaCache
+from yandexaqa.cassette import install
+from yandexaqa.client import DiskClient
+
+
+@pytest.fixture
+def cached_client(api_client, cassette_recorder):
+    """Фикстура клиента с кэшем метаинформации поверх сессии api_client."""
+    client = DiskClient(session=api_client.session, cache=MetaCache(ttl=60))
+    if cassette_recorder is not None:
+        install(client, cassette_recorder)
+    yield client
+    client.transfer_session.close()
+
+
+class TestMetaCache:
+    """Тесты кэша метаинформации ресурсов."""
+
+    def test_repeated_meta_served_from_cache(self, cached_client, shared_file_path):
+        """Тест: повторный запрос с теми же полями не уходит в сеть."""
+        first = cached_client.get_meta(shared_file_path, fields="name,size")
+        second = cached_client.get_meta(shared_file_path, fields="name,size")
+        other = cached_client.get_meta(shared_file_path, fields="name")
+
+        assert first.status_code == 200, f"Ошибка: {first.text}"
+        assert second.content is first.content
+        assert other.content is not first.content
+        assert (cached_client.cache.hits, cached_client.cache.misses) == (1, 2)
+
+    def test_cached_json_not_shared(self, cached_client, shared_file_path):
+        """
+        Тест: ответ из кэша отдаётся копией, и изменение его json() одним
+        вызывающим не видно в ответах, отданных другим.
+        """
+        first = cached_client.get_meta(shared_file_path, fields="name,size")
+        first.json()["name"] = "изменено"
+        second = cached_client.get_meta(shared_file_path, fields="name,size")
+
+        assert cached_client.cache.hits == 1
+        assert second.json()["name"] != "изменено"
+        assert second.json() is second.json()
+
+    def test_publish_invalidates(self, cached_client, test_file_path):
+        """Тест: публикация сбрасывает кэш пути, public_url виден сразу."""
+        before = cached_client.get_meta(test_file_path, fields="public_url")
+        assert "public_url" not in before.json()
+
+        response = cached_client.publish(test_file_path)
+        assert response.status_code == 200, f"Ошибка: {response.text}"
+
+        after = cached_client.get_meta(test_file_path, fields="public_url")
+        assert after.json().get("public_url"), "Кэш вернул устаревший ответ"
+
+    def test_upload_invalidates_ancestors(self, cached_client, random_path):
+        """Тест: загрузка файла сбрасывает кэш родительской папки."""
+        cached_client.create_folder(random_path)
+        empty = cached_client.get_meta(random_path, fields="_embedded.total")
+        assert empty.json()["_embedded"]["total"] == 0
+
+        cached_client.upload(f"{random_path}/file.txt", b"cache")
+
+        listing = cached_client.get_meta(random_path, fields="_embedded.total")
+        assert listing.json()["_embedded"]["total"] == 1
+
+    def test_async_move_invalidates_after_wait(
+        self, cached_client, folder_with_content, random_path
+    ):
+        """
+        Тест: после асинхронного перемещения папки кэш исходного пути и
+        вложенных ресурсов сбрасывается по завершении операции.
+        """
+        child = cached_client.get_meta(folder_with_content, fields="_embedded.items")
+        child_path = child.json()["_embedded"]["items"][0]["path"]
+        assert cached_client.get_meta(child_path).status_code == 200
+
+        response = cached_client.move(
+            folder_with_content, random_path, force_async=True
+        )
+        cached_client.get_meta(folder_with_content)
+        cached_client.wait_for_operation(response)
+
+        assert cached_client.get_meta(folder_with_content).status_code == 404
+        assert cached_client.get_meta(child_path).status_code == 404
+        cached_client.move(random_path, folder_with_content)
+
+    def test_poll_bypasses_cache(self, cached_client, api_client, test_file_path):
+        """
+        Тест: изменение, которое клиент не видел (публикация другим
+        клиентом или отложенная на сервере), обнаруживается опросом с
+        cache=False, и свежий ответ заменяет устаревшую запись.
+        """
+        before = cached_client.get_meta(test_file_path, fields="public_url")
+        assert "public_url" not in before.json()
+
+        response = api_client.publish(test_file_path)
+        assert response.status_code == 200, f"Ошибка: {response.text}"
+
+        stale = cached_client.get_meta(test_file_path, fields="public_url")
+        assert stale.content is before.content
+        fresh = cached_client.get_meta(test_file_path, fields="public_url", cache=False)
+        assert fresh.json().get("public_url"), "Опрос вернул ответ из кэша"
+        cached = cached_client.get_meta(test_file_path, fields="public_url")
+        assert cached.content is fresh.content
+
+    def test_resolve_public_refresh_bypasses_cache(
+        self, cached_client, api_client, test_file_path
+    ):
+        """
+        Тест: resolve_public(refresh=True) не читает устаревший ответ из
+        кэша и обновляет и кэш метаинформации, и публичные данные.
+        """
+        assert cached_client.resolve_public(test_file_path) is None
+
+        response = api_client.publish(test_file_path)
+        assert response.status_code == 200, f"Ошибка: {response.text}"
+
+        public = cached_client.resolve_public(test_file_path, refresh=True)
+        assert public is not None and public.public_key
+        assert cached_client.resolve_public(test_file_path) is public
+        cached = cached_client.get_meta(
+            test_file_path, fields="path,public_key,public_url"
+        )
+        assert cached.json()["public_key"] == public.public_key
+
+    def test_ttl_and_lru(self):
+        """Тест истечения времени жизни и вытеснения давних записей."""
+        cache = MetaCache(maxsize=2, ttl=0.1)
+        cache.put("/a", {}, "a")
+        cache.put("disk:/b/", {}, "b")
+        assert cache.get("/a", {}) == "a"
+
+        cache.put("/c", {}, "c")
+        assert cache.get("/b", {}) is None, "Вытеснена не самая давняя запись"
+        assert cache.get("/a", {}) == "a"
+
+        time.sleep(0.15)
+        assert cache.get("/a", {}) is None
+
+    def test_invalidate_related_paths(self):
+        """Тест: сбрасываются путь, его папки и вложенные ресурсы, но не соседи."""
+        paths = ["/", "/a", "/a/b", "/a/b/c", "/a/bc", "/d"]
+        cache = MetaCache()
+        for path in paths:
+            cache.put(path, {}, path)
+
+        cache.invalidate("disk:/a/b")
+
+        assert [path for path in paths if cache.get(path, {})] == ["/a/bc", "/d"]
@@ -0,0 +1,52 @@
+import pytest
+
+from yandexaqa.metrics import LatencyRecorder, percentile, summarize
+
+
+@pytest.fixture
+def recorder(api_client):
+    """Фикстура отдельного сборщика замеров, подключенного к api_client."""
+    recorder = LatencyRecorder()
+    recorder.attach(api_client)
+    yield recorder
+    recorder.detach(api_client)
+    recorder.close()
+
+
+class TestLatencyMetrics:
+    """Тесты замеров задержек запросов."""
+
+    def test_percentiles(self):
+        """Тест перцентилей с линейной интерполяцией."""
+        values = [float(i) for i in range(1, 101)]
+
+        assert percentile(values, 50) == pytest.approx(50.5)
+        assert percentile(values, 99) == pytest.approx(99.01)
+        assert summarize(values)["p95"] == pytest.approx(95.05)
+        assert summarize([]) == {"count": 0}
+
+    def test_records_endpoint_templates(self, recorder, api_client, shared_file_path):
+        """
+        Тест: запросы клиента записываются с шаблоном эндпоинта,
+        методом и статусом, а не с конкретным URL.
+        """
+        recorder.current_test = "test"
+        if api_client.cache is not None:
+            api_client.cache.clear()
+
+        api_client.get_meta(shared_file_path)
+        api_client.get_download_link(shared_file_path)
+        api_client.get_operation("0123456789abcdef")
+
+        records = [(r.method, r.endpoint, r.status) for r in recorder.records]
+        assert records == [
+            ("GET", "/resources", 200),
+            ("GET", "/resources/download", 200),
+            ("GET", "/operations/{operation_id}", 404),
+        ]
+        assert all(r.test == "test" and r.latency >= 0 for r in recorder.records)
+        assert set(recorder.by_endpoint()) == {
+            "GET /resources",
+            "GET /resources/download",
+            "GET /operations/{operation_id}",
+        }
@@ -1,21 +1,17 @@
 import pytest
-from requests import Session
+
+from yandexaqa.operations import wait_until
+from yandexaqa.pool import PoolError, ResourcePool
 
 
 class TestPublishResource:
     """Тесты для публикации ресурса"""
 
-    MINIMAL_BODY = {"public_settings": {}}
-
     def test_publish_file_success(self, api_client, test_file_path):
         """
         Тест успешной публикации файла.
         """
-        response = api_client.put(
-            f"{api_client.base_url}/resources/publish",
-            params={"path": test_file_path},
-            json=self.MINIMAL_BODY,
-        )
+        response = api_client.publish(test_file_path)
 
         if response.status_code not in [200, 201, 202]:
             pytest.skip(f"Ошибка: {response.text}")
@@ -27,13 +23,9 @@ class TestPublishResource:
         """
         Тест успешной публикации папки.
         """
-        api_client.put(f"{api_client.base_url}/resources", params={"path": random_path})
+        api_client.create_folder(random_path)
 
-        response = api_client.put(
-            f"{api_client.base_url}/resources/publish",
-            params={"path": random_path},
-            json=self.MINIMAL_BODY,
-        )
+        response = api_client.publish(random_path)
 
         assert response.status_code in [200, 201, 202], f"Ошибка: {response.text}"
 
@@ -41,9 +33,7 @@ class TestPublishResource:
         assert "href" in data
 
         try:
-            api_client.delete(
-                f"{api_client.base_url}/resources", params={"path": random_path}
-            )
+            api_client.remove(random_path, permanently=True)
         except:
             pass
 
@@ -51,17 +41,9 @@ class TestPublishResource:
         """
         Тест попытки опубликовать уже опубликованный ресурс.
         """
-        api_client.put(
-            f"{api_client.base_url}/resources/publish",
-            params={"path": test_file_path},
-            json=self.MINIMAL_BODY,
-        )
+        api_client.publish(test_file_path)
 
-        response = api_client.put(
-            f"{api_client.base_url}/resources/publish",
-            params={"path": test_file_path},
-            json=self.MINIMAL_BODY,
-        )
+        response = api_client.publish(test_file_path)
 
         assert response.status_code in [
             200,
@@ -81,11 +63,7 @@ class TestPublishResource:
         """
         Параметризованный тест для некорректных путей.
         """
-        response = api_client.put(
-            f"{api_client.base_url}/resources/publish",
-            params={"path": invalid_path},
-            json=self.MINIMAL_BODY,
-        )
+        response = api_client.publish(invalid_path)
 
         assert response.status_code == expected_status, (
             f"Ожидался код {expected_status}, получен {response.status_code}. "
@@ -96,11 +74,7 @@ class TestPublishResource:
         """
         Тест публикации с ограничением возвращаемых полей.
         """
-        response = api_client.put(
-            f"{api_client.base_url}/resources/publish",
-            params={"path": test_file_path, "fields": "href,method"},
-            json=self.MINIMAL_BODY,
-        )
+        response = api_client.publish(test_file_path, fields="href,method")
 
         if response.status_code in [200, 201, 202]:
             data = response.json()
@@ -112,18 +86,11 @@ class TestPublishResource:
             assert "href" in data
             assert "method" in data
 
-    def test_publish_no_auth(self):
+    def test_publish_no_auth(self, anonymous_client):
         """
         Тест попытки публикации без аутентификации.
         """
-        client = Session()
-        client.base_url = "https://cloud-api.yandex.net/v1/disk"
-
-        response = client.put(
-            f"{client.base_url}/resources/publish",
-            params={"path": "/some_file.txt"},
-            json=self.MINIMAL_BODY,
-        )
+        response = anonymous_client.publish("/some_file.txt")
 
         assert response.status_code == 401
 
@@ -133,11 +100,7 @@ class TestPublishResource:
         """
         Тест с необязательным параметром allow_address_access.
         """
-        response = api_client.put(
-            f"{api_client.base_url}/resources/publish",
-            params={"path": test_file_path, "allow_address_access": "true"},
-            json=self.MINIMAL_BODY,
-        )
+        response = api_client.publish(test_file_path, allow_address_access="true")
 
         if response.status_code not in [200, 201, 202]:
             assert response.status_code != 405
@@ -146,19 +109,13 @@ class TestPublishResource:
         """
         Тест публикации с расширенными настройками в public_settings.
         """
-        full_body = {
-            "public_settings": {
-                "read_only": True,
-                "password": "my_secret_password",
-                "available_until": 1893456000,
-            }
+        public_settings = {
+            "read_only": True,
+            "password": "my_secret_password",
+            "available_until": 1893456000,
         }
 
-        response = api_client.put(
-            f"{api_client.base_url}/resources/publish",
-            params={"path": test_file_path},
-            json=full_body,
-        )
+        response = api_client.publish(test_file_path, public_settings=public_settings)
 
         if response.status_code >= 400:
             print(f"Ответ: {response.text}")
@@ -167,3 +124,52 @@ class TestPublishResource:
             print(f"Успех. Ответ содержит: {list(data.keys())}")
 
         assert response.status_code != 405
+
+    def test_pool_publish(self, api_client, random_path):
+        """
+        Тест публикации ресурсов пула: после publish у каждого ресурса
+        есть public_url, а неизвестный путь дает PoolError.
+        """
+        pool = ResourcePool(api_client, random_path).create()
+        pool.add_file("file", "file.txt", b"pool")
+        pool.add_folder("folder", "folder", {"a.txt": b"a"})
+
+        links = pool.publish("file", "folder")
+
+        assert pool.public == links
+        assert links["file"].path.endswith(pool["file"])
+        meta = api_client.get_meta(pool["folder"], fields="public_key,public_url")
+        assert meta.json()["public_key"] == links["folder"].public_key
+        assert meta.json()["public_url"] == links["folder"].public_url
+
+        pool.paths["missing"] = f"{random_path}/missing.txt"
+        with pytest.raises(PoolError):
+            pool.publish("missing")
+
+    def test_resolve_public_memoized(self, api_client, test_file_path, monkeypatch):
+        """
+        Тест: публичные данные запрашиваются один раз и забываются
+        после отмены публикации.
+        """
+        assert api_client.resolve_public(test_file_path) is None
+
+        response = api_client.publish(test_file_path)
+        assert response.status_code == 200, f"Ошибка: {response.text}"
+        public = wait_until(
+            lambda: api_client.resolve_public(test_file_path, refresh=True)
+        )
+        assert public.public_key and public.public_url
+
+        calls = []
+        get_meta = api_client.get_meta
+        monkeypatch.setattr(
+            api_client,
+            "get_meta",
+            lambda *args, **kwargs: calls.append(args) or get_meta(*args, **kwargs),
+        )
+        assert api_client.resolve_public(test_file_path) is public
+        assert calls == []
+
+        api_client.unpublish(test_file_path)
+        api_client.resolve_public(test_file_path)
+        assert len(calls) == 1
@@ -0,0 +1,153 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+from yandexaqa import ratelimit
+from yandexaqa.client import DiskClient
+from yandexaqa.fake import FakeDiskServer
+from yandexaqa.ratelimit import RateLimiter, TokenBucket, retry_after
+from yandexaqa.session import DiskSession
+
+TOKEN = "rate-limit-token"
+
+
+class FakeClock:
+    """Часы для TokenBucket: sleep сдвигает время, не останавливая тест."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture(scope="module")
+def fake_server():
+    """Фикстура отдельного фейкового сервера, которому можно задать ответы 429."""
+    with FakeDiskServer() as server:
+        yield server
+
+
+def _response(headers):
+    response = requests.Response()
+    response.headers.update(headers)
+    return response
+
+
+class TestRateLimit:
+    """Тесты ограничения частоты запросов и повторов при 429/423."""
+
+    def test_token_bucket_rate(self):
+        """Тест: после burst запросы выдаются с заданной частотой."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=20, burst=5, clock=clock, sleep=clock.sleep)
+
+        waits = [bucket.acquire() for _ in range(15)]
+
+        assert waits[:5] == [0.0] * 5
+        assert waits[5:] == pytest.approx([0.05] * 10)
+        assert clock.now == pytest.approx(10 / 20)
+
+    def test_token_bucket_refill(self):
+        """Тест: за время простоя копятся токены, но не больше burst."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, burst=2, clock=clock, sleep=clock.sleep)
+        assert [bucket.acquire() for _ in range(3)] == pytest.approx([0, 0, 0.1])
+
+        clock.now += 10
+        assert [bucket.reserve() for _ in range(3)] == pytest.approx([0, 0, 0.1])
+
+    def test_token_bucket_pause(self):
+        """Тест: пауза после 429 задерживает и запросы без ограничения частоты."""
+        clock = FakeClock()
+        bucket = TokenBucket(clock=clock, sleep=clock.sleep)
+        bucket.pause(0.3)
+
+        assert bucket.acquire() == pytest.approx(0.3)
+        assert bucket.acquire() <= 0
+
+    def test_token_bucket_wait_observed(self, monkeypatch):
+        """Тест: ожидание токена передаётся наблюдателям пауз."""
+        waits = []
+        monkeypatch.setattr(ratelimit, "WAIT_OBSERVERS", [waits.append])
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, burst=1, clock=clock, sleep=clock.sleep)
+
+        bucket.acquire()
+        bucket.acquire()
+
+        assert waits == pytest.approx([0.1])
+
+    @pytest.mark.parametrize(
+        "method, status, retried",
+        [
+            ("GET", 503, True),
+            ("DELETE", 503, True),
+            ("POST", 503, False),
+            ("POST", 429, True),
+        ],
+    )
+    def test_retry_only_idempotent_on_503(self, method, status, retried):
+        """
+        Тест: 503 повторяется только для идемпотентных методов — POST
+        copy/move сервер мог уже начать выполнять; 429 повторяется всегда.
+        """
+        response = _response({"Retry-After": "0"})
+        response.status_code = status
+        response.request = requests.Request(method, "http://disk/resources").prepare()
+        limiter = RateLimiter("idempotency-token")
+
+        delay = limiter.retry_delay(response, 0, float("inf"), iter([]))
+
+        assert (delay is not None) == retried
+
+    @pytest.mark.parametrize(
+        "headers, expected",
+        [
+            ({}, None),
+            ({"Retry-After": "2"}, 2.0),
+            ({"Retry-After": "garbage"}, None),
+        ],
+    )
+    def test_retry_after(self, headers, expected):
+        """Тест разбора заголовка Retry-After в секундах."""
+        delay = retry_after(_response(headers))
+
+        assert delay == expected
+
+    def test_retry_after_http_date(self):
+        """Тест разбора заголовка Retry-After в виде HTTP-даты."""
+        moment = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        delay = retry_after(_response({"Retry-After": format_datetime(moment, True)}))
+
+        assert delay == pytest.approx(30, abs=1.5)
+
+    def test_retry_on_429(self, fake_server):
+        """Тест: ответы 429 повторяются с паузой из Retry-After."""
+        client = DiskClient(token=TOKEN, base_url=fake_server.base_url)
+        fake_server.disk.throttle(TOKEN, count=3, retry_after=0)
+
+        response = client.get_meta("/")
+
+        assert response.status_code == 200, f"Ошибка: {response.text}"
+        assert fake_server.disk.throttled[TOKEN][0] == 0
+        client.close()
+
+    def test_retries_exhausted(self, fake_server):
+        """Тест: после исчерпания повторов возвращается последний ответ 429."""
+        session = DiskSession(TOKEN, fake_server.base_url, retries=1)
+        fake_server.disk.throttle(TOKEN, count=5, retry_after=0)
+
+        response = session.get("/resources", params={"path": "/"})
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "0"
+        assert fake_server.disk.throttled[TOKEN][0] == 3
+        fake_server.disk.throttle(TOKEN, count=0)
+        session.close()
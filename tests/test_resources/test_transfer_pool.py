@@ -0,0 +1,97 @@
+import shutil
+import ssl
+import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from yandexaqa.session import PooledAdapter
+from yandexaqa.tls import create_context
+
+
+class _CloseHandler(BaseHTTPRequestHandler):
+    """Отвечает и закрывает соединение: каждый запрос — новое рукопожатие."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+
+@pytest.fixture(scope="module")
+def tls_server(tmp_path_factory):
+    """Фикстура локального HTTPS-сервера с самоподписанным сертификатом."""
+    if shutil.which("openssl") is None:
+        pytest.skip("Для сертификата нужен openssl")
+    directory = tmp_path_factory.mktemp("tls")
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1"]
+        + ["-subj", "/CN=localhost", "-addext", "subjectAltName=DNS:localhost"]
+        + ["-keyout", str(key), "-out", str(cert)],
+        check=True,
+        capture_output=True,
+    )
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CloseHandler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"https://localhost:{server.server_address[1]}/", cert
+    server.shutdown()
+    server.server_close()
+
+
+class TestTransferPool:
+    """Тесты пулов соединений с хостами загрузки и скачивания."""
+
+    def test_uploads_reuse_connection(self, api_client, cassette, sandbox):
+        """Тест: загрузки нескольких файлов идут через одно соединение с хостом."""
+        if cassette is not None:
+            pytest.skip("В режиме кассет соединения не открываются")
+        paths = [f"{sandbox}/test_file_pool_{i}.txt" for i in range(5)]
+        hosts = set()
+
+        for path in paths:
+            response = api_client.upload(path, b"pool")
+            assert response.status_code in [201, 202], f"Ошибка: {response.text}"
+            hosts.add(response.url)
+            api_client.remove(path, permanently=True)
+
+        adapter = api_client.transfer_session.get_adapter(response.url)
+        pools = [
+            adapter.poolmanager.connection_from_url(href)
+            for href in hosts
+            if href.startswith("http")
+        ]
+        assert sum(pool.num_connections for pool in pools) <= len(
+            {pool.host for pool in pools}
+        ), "Загрузки открыли больше одного соединения на хост"
+
+    def test_tls_session_resumed(self, tls_server):
+        """Тест: новые соединения с тем же хостом возобновляют TLS-сессию."""
+        url, cert = tls_server
+        context = create_context(cafile=cert)
+        session = requests.Session()
+        session.trust_env = False
+        session.verify = str(cert)
+        session.mount("https://", PooledAdapter(ssl_context=context))
+
+        for _ in range(3):
+            response = session.get(url)
+            assert response.text == "ok"
+        session.close()
+
+        assert context.handshakes == 3
+        assert context.resumed == 2
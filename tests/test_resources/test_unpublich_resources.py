@@ -1,20 +1,19 @@
 import pytest
 import uuid
-import time
-from requests import Session
+
+from yandexaqa.operations import OperationTimeoutError
 
 
 class TestUnpublishResource:
     """Тесты для отмены публикации ресурса."""
 
-    def test_unpublish_file_success(self, api_client, published_file_path):
+    def test_unpublish_file_success(
+        self, api_client, published_file_path, wait_for_public_url
+    ):
         """
         Тест успешной отмены публикации файла.
         """
-        check_response = api_client.get(
-            f"{api_client.base_url}/resources",
-            params={"path": published_file_path, "fields": "public_url"},
-        )
+        check_response = api_client.get_meta(published_file_path, fields="public_url")
 
         if (
             check_response.status_code != 200
@@ -22,69 +21,51 @@ class TestUnpublishResource:
         ):
             pytest.skip("Тестовый файл не опубликован, пропускаем тест")
 
-        response = api_client.put(
-            f"{api_client.base_url}/resources/unpublish",
-            params={"path": published_file_path},
-        )
+        response = api_client.unpublish(published_file_path)
 
         assert response.status_code == 200, f"Ошибка: {response.text}"
 
         data = response.json()
         assert "href" in data, "Ответ должен содержать поле href"
 
-        time.sleep(2)
-
-        final_check = api_client.get(
-            f"{api_client.base_url}/resources",
-            params={"path": published_file_path, "fields": "public_url"},
-        )
-
-        if final_check.status_code == 200:
-            final_data = final_check.json()
-            assert final_data.get("public_url") is None, "Файл всё ещё опубликован!"
+        try:
+            wait_for_public_url(published_file_path, published=False)
+        except OperationTimeoutError:
+            pytest.fail("Файл всё ещё опубликован!")
 
-    def test_unpublish_folder_success(self, api_client):
+    def test_unpublish_folder_success(self, api_client, sandbox, wait_for_public_url):
         """
         Тест успешной отмены публикации папки.
         """
-        folder_path = f"/test_folder_{uuid.uuid4().hex[:8]}"
+        folder_path = f"{sandbox}/test_folder_{uuid.uuid4().hex[:8]}"
 
-        api_client.put(f"{api_client.base_url}/resources", params={"path": folder_path})
+        api_client.create_folder(folder_path)
 
-        publish_response = api_client.put(
-            f"{api_client.base_url}/resources/publish",
-            params={"path": folder_path},
-            json={"public_settings": {}},
-        )
+        publish_response = api_client.publish(folder_path)
 
         if publish_response.status_code not in [200, 201, 202]:
-            api_client.delete(
-                f"{api_client.base_url}/resources", params={"path": folder_path}
-            )
+            api_client.remove(folder_path, permanently=True)
             pytest.skip(
                 f"Не удалось опубликовать папку: {publish_response.status_code}"
             )
 
-        time.sleep(2)
+        try:
+            wait_for_public_url(folder_path)
+        except OperationTimeoutError:
+            api_client.remove(folder_path, permanently=True)
+            pytest.skip("Папка не опубликовалась после запроса публикации")
 
-        response = api_client.put(
-            f"{api_client.base_url}/resources/unpublish", params={"path": folder_path}
-        )
+        response = api_client.unpublish(folder_path)
 
         assert response.status_code == 200, f"Ошибка: {response.text}"
 
-        api_client.delete(
-            f"{api_client.base_url}/resources", params={"path": folder_path}
-        )
+        api_client.remove(folder_path, permanently=True)
 
     def test_unpublish_already_unpublished(self, api_client, test_file_path):
         """
         Тест попытки отменить публикацию уже неопубликованного ресурса.
         """
-        response = api_client.put(
-            f"{api_client.base_url}/resources/unpublish",
-            params={"path": test_file_path},
-        )
+        response = api_client.unpublish(test_file_path)
 
         assert response.status_code in [
             200,
@@ -97,10 +78,7 @@ class TestUnpublishResource:
         """
         nonexistent_path = f"/nonexistent_{uuid.uuid4().hex[:8]}.txt"
 
-        response = api_client.put(
-            f"{api_client.base_url}/resources/unpublish",
-            params={"path": nonexistent_path},
-        )
+        response = api_client.unpublish(nonexistent_path)
 
         assert (
             response.status_code == 404
@@ -117,9 +95,7 @@ class TestUnpublishResource:
         """
         Параметризованный тест для некорректных путей.
         """
-        response = api_client.put(
-            f"{api_client.base_url}/resources/unpublish", params={"path": invalid_path}
-        )
+        response = api_client.unpublish(invalid_path)
 
         if response.status_code != 200:
             assert response.status_code in [400, 404], (
@@ -127,17 +103,11 @@ class TestUnpublishResource:
                 f"Ответ: {response.text}"
             )
 
-    def test_unpublish_no_auth(self):
+    def test_unpublish_no_auth(self, anonymous_client):
         """
         Тест попытки отменить публикацию без аутентификации.
         """
-
-        client = Session()
-        client.base_url = "https://cloud-api.yandex.net/v1/disk"
-
-        response = client.put(
-            f"{client.base_url}/resources/unpublish", params={"path": "/some_file.txt"}
-        )
+        response = anonymous_client.unpublish("/some_file.txt")
 
         assert (
             response.status_code == 401
@@ -147,10 +117,7 @@ class TestUnpublishResource:
         """
         Тест отмены публикации с ограничением возвращаемых полей.
         """
-        check_response = api_client.get(
-            f"{api_client.base_url}/resources",
-            params={"path": published_file_path, "fields": "public_url"},
-        )
+        check_response = api_client.get_meta(published_file_path, fields="public_url")
 
         if (
             check_response.status_code != 200
@@ -158,10 +125,7 @@ class TestUnpublishResource:
         ):
             pytest.skip("Тестовый файл не опубликован")
 
-        response = api_client.put(
-            f"{api_client.base_url}/resources/unpublish",
-            params={"path": published_file_path, "fields": "href,method"},
-        )
+        response = api_client.unpublish(published_file_path, fields="href,method")
 
         if response.status_code == 200:
             data = response.json()
@@ -171,52 +135,30 @@ class TestUnpublishResource:
                 allowed_fields
             ), f"Лишние поля: {actual_fields - allowed_fields}"
 
-    def test_publish_unpublish_cycle(self, api_client, test_file_path):
+    def test_publish_unpublish_cycle(
+        self, api_client, test_file_path, wait_for_public_url
+    ):
         """
         Тест полного цикла публикации и отмены публикации.
         """
-        publish_response = api_client.put(
-            f"{api_client.base_url}/resources/publish",
-            params={"path": test_file_path},
-            json={"public_settings": {}},
-        )
+        publish_response = api_client.publish(test_file_path)
 
         if publish_response.status_code not in [200, 201, 202]:
             pytest.skip(f"Не удалось опубликовать файл: {publish_response.status_code}")
 
-        time.sleep(3)
-
-        check_published = api_client.get(
-            f"{api_client.base_url}/resources",
-            params={"path": test_file_path, "fields": "public_url"},
-        )
-
-        is_published = (
-            check_published.status_code == 200
-            and check_published.json().get("public_url") is not None
-        )
-
-        if not is_published:
+        try:
+            wait_for_public_url(test_file_path)
+        except OperationTimeoutError:
             print("Файл не опубликовался, пропускаем тест отмены")
             pytest.skip("Файл не опубликовался после запроса публикации")
 
-        unpublish_response = api_client.put(
-            f"{api_client.base_url}/resources/unpublish",
-            params={"path": test_file_path},
-        )
+        unpublish_response = api_client.unpublish(test_file_path)
 
         assert (
             unpublish_response.status_code == 200
         ), f"Ошибка отмены публикации: {unpublish_response.text}"
 
-        time.sleep(2)
-
-        check_unpublished = api_client.get(
-            f"{api_client.base_url}/resources",
-            params={"path": test_file_path, "fields": "public_url"},
-        )
-
-        if check_unpublished.status_code == 200:
-            assert (
-                check_unpublished.json().get("public_url") is None
-            ), "Публикация не была отменена"
+        try:
+            wait_for_public_url(test_file_path, published=False)
+        except OperationTimeoutError:
+            pytest.fail("Публикация не была отменена")
@@ -0,0 +1,66 @@
+import mmap
+
+import pytest
+
+from yandexaqa.streams import synthetic_digests, synthetic_payload
+
+
+class TestStreamingUpload:
+    """Тесты потоковой загрузки файла «сырым» телом PUT."""
+
+    def check_uploaded(self, api_client, path, size, md5=None, sha256=None):
+        response = api_client.get_meta(path, fields="size,md5,sha256")
+        assert response.status_code == 200, f"Ошибка: {response.text}"
+
+        data = response.json()
+        assert data["size"] == size, "Размер файла не совпадает с загруженным"
+        if md5:
+            assert data["md5"] == md5, "md5 файла не совпадает с загруженным"
+        if sha256:
+            assert data["sha256"] == sha256, "sha256 файла не совпадает с загруженным"
+
+    def test_upload_synthetic_payload(self, request, api_client, random_file_path):
+        """
+        Тест загрузки синтетического файла, сгенерированного на лету
+        (размер задается опцией --upload-size).
+        """
+        size = request.config.getoption("--upload-size")
+
+        response = api_client.upload(random_file_path, synthetic_payload(size))
+
+        assert response.status_code in [201, 202], f"Ошибка: {response.text}"
+        md5, sha256 = synthetic_digests(size)
+        self.check_uploaded(api_client, random_file_path, size, md5, sha256)
+
+    def test_upload_from_generator(self, api_client, random_file_path):
+        """Тест загрузки из генератора фрагментов (chunked-кодирование)."""
+        chunks = [f"Строка {i}\n".encode() for i in range(100)]
+
+        response = api_client.upload(random_file_path, (chunk for chunk in chunks))
+
+        assert response.status_code in [201, 202], f"Ошибка: {response.text}"
+        self.check_uploaded(api_client, random_file_path, len(b"".join(chunks)))
+
+    @pytest.mark.parametrize("chunk_size", [1024, 64 * 1024])
+    def test_upload_from_file(self, api_client, random_file_path, tmp_path, chunk_size):
+        """Тест загрузки из файлового объекта фрагментами по chunk_size байт."""
+        local_file = tmp_path / "payload.bin"
+        local_file.write_bytes(bytes(range(256)) * 1000)
+
+        with open(local_file, "rb") as f:
+            response = api_client.upload(random_file_path, f, chunk_size=chunk_size)
+
+        assert response.status_code in [201, 202], f"Ошибка: {response.text}"
+        self.check_uploaded(api_client, random_file_path, 256000)
+
+    def test_upload_from_mmap(self, api_client, random_file_path, tmp_path):
+        """Тест загрузки области файла, отображенной в память (mmap)."""
+        local_file = tmp_path / "payload.bin"
+        local_file.write_bytes(b"0123456789" * 10000)
+
+        with open(local_file, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as region:
+                response = api_client.upload(random_file_path, region)
+
+        assert response.status_code in [201, 202], f"Ошибка: {response.text}"
+        self.check_uploaded(api_client, random_file_path, 100000)
@@ -0,0 +1,151 @@
+import pytest
+
+from yandexaqa.paging import PageError
+from yandexaqa.tree import compare, diff_trees, index_tree, walk
+from yandexaqa.upload import upload_many
+
+
+@pytest.fixture
+def nested_folder(api_client, random_path):
+    """
+    Фикстура создает дерево папок глубиной 3: в каждой папке по два файла
+    и по две подпапки (кроме нижнего уровня). Возвращает (корень, пути).
+    """
+    dirs = [random_path]
+    for level in range(3):
+        dirs += [
+            f"{parent}/dir_{i}"
+            for parent in dirs
+            if parent.count("/") == random_path.count("/") + level
+            for i in range(2)
+        ]
+    for dir_path in dirs:
+        response = api_client.create_folder(dir_path)
+        if response.status_code != 201:
+            pytest.skip(f"Не удалось создать папку {dir_path}: {response.text}")
+
+    files = {
+        f"{dir_path}/file_{i}.txt": f"{dir_path} {i}"
+        for dir_path in dirs
+        for i in range(2)
+    }
+    upload_many(api_client, files)
+
+    yield random_path, set(dirs[1:]) | set(files)
+
+    api_client.remove(random_path, permanently=True)
+
+
+def relative(root, items):
+    return {item.path.split(root, 1)[1] for item in items}
+
+
+class TestWalk:
+    """Тесты рекурсивного обхода поддерева."""
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_walk_full_tree(self, api_client, nested_folder, max_workers):
+        """Тест обхода всего дерева: найдены все папки и файлы ровно один раз."""
+        root, expected = nested_folder
+
+        items = list(walk(api_client, root, max_workers=max_workers))
+
+        assert len(items) == len(expected), "Элементы дерева повторяются"
+        assert relative(root, items) == {path[len(root) :] for path in expected}
+
+    def test_walk_paged(self, api_client, nested_folder):
+        """
+        Тест обхода папок, занимающих несколько страниц: страницы читаются
+        по одной и каждый элемент возвращается ровно один раз.
+        """
+        root, expected = nested_folder
+
+        items = list(walk(api_client, root, max_workers=2, page_size=1))
+
+        assert len(items) == len(expected), "Элементы дерева повторяются"
+        assert relative(root, items) == {path[len(root) :] for path in expected}
+
+    @pytest.mark.parametrize("max_depth", [1, 2])
+    def test_walk_max_depth(self, api_client, nested_folder, max_depth):
+        """Тест ограничения глубины обхода."""
+        root, expected = nested_folder
+
+        paths = relative(root, walk(api_client, root, max_depth=max_depth))
+
+        assert paths == {
+            path[len(root) :]
+            for path in expected
+            if path[len(root) :].count("/") <= max_depth
+        }
+
+    def test_walk_with_fields(self, api_client, nested_folder):
+        """Тест проекции fields: возвращаются только запрошенные поля и path/type."""
+        root, expected = nested_folder
+
+        items = list(walk(api_client, root, fields="name"))
+
+        assert len(items) == len(expected)
+        assert all(item.name and item.path and item.type for item in items)
+        assert all(item.created is None for item in items)
+
+    def test_walk_nonexistent_path(self, api_client, random_path):
+        """Тест обхода несуществующей папки."""
+        with pytest.raises(PageError) as error:
+            list(walk(api_client, random_path))
+
+        assert error.value.response.status_code == 404
+
+
+class TestTreeDiff:
+    """Тесты сравнения поддеревьев после копирования и перемещения."""
+
+    def copy_tree(self, api_client, source, target):
+        response = api_client.copy(source, target)
+        assert response.status_code in [201, 202], f"Ошибка: {response.text}"
+        api_client.wait_for_operation(response)
+
+    def test_diff_recursive_copy(self, api_client, nested_folder, sandbox):
+        """Тест: рекурсивная копия дерева совпадает с исходным."""
+        root, _ = nested_folder
+        copy_path = f"{root}_copy"
+        self.copy_tree(api_client, root, copy_path)
+
+        diff = diff_trees(api_client, root, copy_path)
+
+        assert not diff, f"Копия отличается от исходного дерева: {diff}"
+        api_client.remove(copy_path, permanently=True)
+
+    def test_diff_detects_changes(self, api_client, nested_folder):
+        """Тест: измененный, удаленный и добавленный файлы попадают в diff."""
+        root, _ = nested_folder
+        copy_path = f"{root}_copy"
+        self.copy_tree(api_client, root, copy_path)
+
+        api_client.upload(f"{copy_path}/dir_0/file_0.txt", b"changed")
+        api_client.wait_for_operation(
+            api_client.remove(f"{copy_path}/dir_1/dir_0", permanently=True)
+        )
+        api_client.upload(f"{copy_path}/new_file.txt", b"new")
+
+        diff = diff_trees(api_client, root, copy_path)
+
+        assert diff.changed == {"/dir_0/file_0.txt": ["size", "md5", "sha256"]}
+        assert "/dir_1/dir_0" in diff.missing
+        assert "/dir_1/dir_0/file_0.txt" in diff.missing
+        assert diff.extra == {"/new_file.txt"}
+        api_client.remove(copy_path, permanently=True)
+
+    def test_diff_move(self, api_client, nested_folder):
+        """Тест: после перемещения дерево по новому пути совпадает со снимком исходного."""
+        root, _ = nested_folder
+        before = index_tree(api_client, root)
+        moved_path = f"{root}_moved"
+
+        response = api_client.move(root, moved_path)
+        assert response.status_code in [201, 202], f"Ошибка: {response.text}"
+        api_client.wait_for_operation(response)
+
+        diff = compare(before, index_tree(api_client, moved_path))
+
+        assert not diff, f"Перемещенное дерево отличается от исходного: {diff}"
+        api_client.wait_for_operation(api_client.move(moved_path, root))
@@ -1,17 +1,21 @@
 import pytest
 import uuid
-import time
-from requests import Session
 
 
+@pytest.mark.serial
 class TestEmptyTrash:
     """Тесты для очистки корзины."""
 
+    @pytest.fixture
+    def api_client(self, exclusive_client):
+        """Очистка корзины выполняется на отдельном аккаунте из пула."""
+        return exclusive_client
+
     def test_empty_trash_completely_success(self, api_client):
         """
         Тест успешной полной очистки корзины (без указания path).
         """
-        response = api_client.delete(f"{api_client.base_url}/trash/resources")
+        response = api_client.clear_trash()
 
         assert response.status_code in [204, 202]
 
@@ -20,26 +24,19 @@ class TestEmptyTrash:
             assert "href" in data
             assert "operation" in data["href"] or data.get("templated") is True
 
-        time.sleep(2)
+        api_client.wait_for_operation(response)
 
     def test_empty_trash_completely_force_async(self, api_client):
         """
         Тест принудительной асинхронной полной очистки корзины.
         """
-        # Ждем, чтобы избежать ошибки 423
-        time.sleep(2)
-
-        response = api_client.delete(
-            f"{api_client.base_url}/trash/resources", params={"force_async": "true"}
-        )
-
-        if response.status_code == 423:
-            pytest.skip("Корзина заблокирована, пропускаем тест")
+        response = api_client.clear_trash(force_async="true")
 
         if response.status_code == 202:
             data = response.json()
             assert "href" in data
             assert "operation" in data["href"] or data.get("templated") is True
+            api_client.wait_for_operation(response)
 
         elif response.status_code == 204:
             print("API проигнорировал force_async и выполнил операцию синхронно")
@@ -52,15 +49,7 @@ class TestEmptyTrash:
         """
         Тест полной очистки корзины с ограничением возвращаемых полей.
         """
-        # Ждем, чтобы избежать ошибки 423
-        time.sleep(2)
-
-        response = api_client.delete(
-            f"{api_client.base_url}/trash/resources", params={"fields": "href,method"}
-        )
-
-        if response.status_code == 423:
-            pytest.skip("Корзина заблокирована, пропускаем тест")
+        response = api_client.clear_trash(fields="href,method")
 
         assert response.status_code in [204, 202], f"Ошибка: {response.text}"
 
@@ -71,31 +60,24 @@ class TestEmptyTrash:
             assert actual_fields.issubset(
                 allowed_fields
             ), f"Лишние поля: {actual_fields - allowed_fields}"
+            api_client.wait_for_operation(data["href"])
 
     def test_delete_nonexistent_item_from_trash(self, api_client):
         """
         Тест удаления несуществующего ресурса из корзины.
         """
-        time.sleep(2)
-
         nonexistent_path = f"/nonexistent_in_trash_{uuid.uuid4().hex[:8]}.txt"
-        response = api_client.delete(
-            f"{api_client.base_url}/trash/resources", params={"path": nonexistent_path}
-        )
+        response = api_client.clear_trash(path=nonexistent_path)
 
         assert (
             response.status_code == 404
         ), f"Ожидался код 404, получен {response.status_code}. Ответ: {response.text}"
 
-    def test_empty_trash_no_auth(self):
+    def test_empty_trash_no_auth(self, anonymous_client):
         """
         Тест попытки очистки корзины без аутентификации.
         """
-
-        client = Session()
-        client.base_url = "https://cloud-api.yandex.net/v1/disk"
-
-        response = client.delete(f"{client.base_url}/trash/resources")
+        response = anonymous_client.clear_trash()
 
         assert (
             response.status_code == 401
@@ -105,15 +87,12 @@ class TestEmptyTrash:
         """
         Тест очистки корзины с указанием корневого пути (path=/).
         """
-        # Ждем, чтобы избежать ошибки 423
-        time.sleep(2)
-
-        response = api_client.delete(
-            f"{api_client.base_url}/trash/resources", params={"path": "/"}
-        )
+        response = api_client.clear_trash(path="/")
 
         assert response.status_code in [204, 202], f"Ошибка: {response.text}"
 
+        api_client.wait_for_operation(response)
+
     @pytest.mark.parametrize(
         "invalid_async_param",
         [
@@ -126,60 +105,77 @@ class TestEmptyTrash:
         """
         Тест с некорректным значением параметра force_async.
         """
-        time.sleep(5)
-
-        response = api_client.delete(
-            f"{api_client.base_url}/trash/resources",
-            params={"force_async": invalid_async_param},
-        )
-
-        if response.status_code == 423:
-            pytest.skip("Корзина заблокирована, пропускаем тест")
+        response = api_client.clear_trash(force_async=invalid_async_param)
 
         if response.status_code not in [204, 202]:
             assert response.status_code == 400
 
+        api_client.wait_for_operation(response)
+
     def test_empty_trash_async_operation_status(self, api_client):
         """
         Тест проверки статуса асинхронной операции очистки корзины.
         """
-        time.sleep(2)
-
-        response = api_client.delete(
-            f"{api_client.base_url}/trash/resources", params={"force_async": "true"}
-        )
+        response = api_client.clear_trash(force_async="true")
 
         if response.status_code == 202:
             data = response.json()
             operation_url = data["href"]
 
-            if operation_url.startswith("http"):
-                op_response = api_client.get(operation_url)
-                assert op_response.status_code in [
-                    200,
-                    201,
-                ]
-            else:
-                op_response = api_client.get(f"{api_client.base_url}{operation_url}")
-                assert op_response.status_code in [
-                    200,
-                    201,
-                ]
+            op_response = api_client.get_operation(operation_url)
+            assert op_response.status_code in [
+                200,
+                201,
+            ]
+
+            api_client.wait_for_operation(response)
+
+    def test_empty_trash_while_locked(self, api_client):
+        """
+        Тест очистки корзины сразу после асинхронной очистки: ответ 423
+        (корзина заблокирована) повторяется клиентом до снятия блокировки.
+        """
+        first = api_client.clear_trash(force_async="true")
+        second = api_client.clear_trash()
+
+        assert second.status_code in [204, 202], f"Ошибка: {second.text}"
+
+        api_client.wait_for_operation(first)
+        api_client.wait_for_operation(second)
 
     def test_consecutive_empty_trash_requests(self, api_client):
         """
         Тест последовательных запросов на очистку уже пустой корзины.
         """
-        time.sleep(2)
-
-        response1 = api_client.delete(f"{api_client.base_url}/trash/resources")
+        response1 = api_client.clear_trash()
         assert response1.status_code in [204, 202]
 
-        if response1.status_code == 202:
-            time.sleep(3)
+        api_client.wait_for_operation(response1)
 
-        response2 = api_client.delete(f"{api_client.base_url}/trash/resources")
+        response2 = api_client.clear_trash()
         assert response2.status_code in [
             204,
             202,
         ]
+
+        api_client.wait_for_operation(response2)
+
+    def test_get_trash_empty_corner_cases(self, api_client):
+        """
+        Тест граничных случаев для пустой корзины.
+        """
+        clear_response = api_client.clear_trash()
+        api_client.wait_for_operation(clear_response)
+
+        response = api_client.get_trash(path="/")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["type"] == "dir"
+        assert len(data["_embedded"]["items"]) == 0
+
+        response = api_client.get_trash(path="/", limit=0)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["_embedded"]["items"]) == 0
@@ -1,9 +1,10 @@
 import pytest
 import uuid
-import time
-from requests import Session
 
+from yandexaqa.paging import iter_trash
 
+
+@pytest.mark.serial
 class TestGetTrashResources:
     """Тесты для получения содержимого корзины."""
 
@@ -12,9 +13,7 @@ class TestGetTrashResources:
         Тест успешного получения корня корзины.
 
         """
-        response = api_client.get(
-            f"{api_client.base_url}/trash/resources", params={"path": "/"}
-        )
+        response = api_client.get_trash(path="/")
 
         assert response.status_code == 200, f"Ошибка: {response.text}"
 
@@ -48,10 +47,7 @@ class TestGetTrashResources:
         limit = 5
         offset = 0
 
-        response = api_client.get(
-            f"{api_client.base_url}/trash/resources",
-            params={"path": "/", "limit": limit, "offset": offset},
-        )
+        response = api_client.get_trash(path="/", limit=limit, offset=offset)
 
         assert response.status_code == 200, f"Ошибка: {response.text}"
 
@@ -74,6 +70,39 @@ class TestGetTrashResources:
             len(embedded["items"]) <= limit
         ), f"Количество элементов ({len(embedded['items'])}) превышает limit ({limit})"
 
+    def test_get_trash_iterate_pages(self, api_client, file_in_trash, random_path):
+        """
+        Тест постраничного обхода корзины ленивым итератором.
+
+        Корзина общая для воркеров, поэтому точное число элементов не
+        проверяется: параллельные тесты могут менять её во время обхода.
+
+        Ожидаемый результат:
+            - Итератор возвращает все удаленные тестом файлы.
+            - Элементы не повторяются.
+        """
+        api_client.create_folder(random_path)
+        seeded = [file_in_trash]
+        for i in range(3):
+            path = f"{random_path}/trash_{i}.txt"
+            api_client.upload(path, f"Content {i}".encode())
+            api_client.wait_for_operation(api_client.remove(path))
+            seeded.append(path)
+
+        items = list(
+            iter_trash(api_client, page_size=2, fields="path,name,origin_path")
+        )
+
+        paths = [item.path for item in items]
+        assert len(set(paths)) == len(paths), "Страницы пересекаются"
+        origins = {item.origin_path for item in items}
+        missing = [
+            path
+            for path in seeded
+            if not any(origin.endswith(path) for origin in origins if origin)
+        ]
+        assert not missing, f"Удаленные файлы не найдены в корзине: {missing}"
+
     def test_get_trash_with_fields(self, api_client):
         """
         Тест получения содержимого корзины с ограничением возвращаемых полей.
@@ -85,10 +114,7 @@ class TestGetTrashResources:
         """
         fields = "name,type,origin_path,deleted,size"
 
-        response = api_client.get(
-            f"{api_client.base_url}/trash/resources",
-            params={"path": "/", "fields": fields},
-        )
+        response = api_client.get_trash(path="/", fields=fields)
 
         assert response.status_code == 200, f"Ошибка: {response.text}"
 
@@ -117,9 +143,7 @@ class TestGetTrashResources:
         """
         nonexistent_path = f"/nonexistent_in_trash_{uuid.uuid4().hex[:8]}"
 
-        response = api_client.get(
-            f"{api_client.base_url}/trash/resources", params={"path": nonexistent_path}
-        )
+        response = api_client.get_trash(path=nonexistent_path)
 
         assert (
             response.status_code == 404
@@ -130,17 +154,11 @@ class TestGetTrashResources:
             assert "error" in error_data
             assert "message" in error_data
 
-    def test_get_trash_no_auth(self):
+    def test_get_trash_no_auth(self, anonymous_client):
         """
         Тест попытки получения содержимого корзины без аутентификации.
         """
-
-        client = Session()
-        client.base_url = "https://cloud-api.yandex.net/v1/disk"
-
-        response = client.get(
-            f"{client.base_url}/trash/resources", params={"path": "/"}
-        )
+        response = anonymous_client.get_trash(path="/")
 
         assert (
             response.status_code == 401
@@ -165,9 +183,7 @@ class TestGetTrashResources:
             expected_status (int): Ожидаемый HTTP-код ответа.
             description (str): Пояснение к тестовому случаю.
         """
-        response = api_client.get(
-            f"{api_client.base_url}/trash/resources", params={"path": invalid_path}
-        )
+        response = api_client.get_trash(path=invalid_path)
 
         assert response.status_code == expected_status, (
             f"{description}. Ожидался код {expected_status}, получен {response.status_code}. "
@@ -179,9 +195,7 @@ class TestGetTrashResources:
         Тест получения детальной информации об элементе корзины.
         Если корзина не пуста, запрашиваем первый элемент.
         """
-        root_response = api_client.get(
-            f"{api_client.base_url}/trash/resources", params={"path": "/", "limit": 1}
-        )
+        root_response = api_client.get_trash(path="/", limit=1)
 
         if root_response.status_code != 200:
             pytest.skip(f"Не удалось получить корзину: {root_response.status_code}")
@@ -198,12 +212,8 @@ class TestGetTrashResources:
         if not item_path:
             pytest.skip("Элемент корзины не содержит path")
 
-        response = api_client.get(
-            f"{api_client.base_url}/trash/resources",
-            params={
-                "path": item_path,
-                "fields": "name,type,size,origin_path,deleted,created,modified",
-            },
+        response = api_client.get_trash(
+            path=item_path, fields="name,type,size,origin_path,deleted,created,modified"
         )
 
         assert response.status_code == 200, f"Ошибка: {response.text}"
@@ -223,9 +233,7 @@ class TestGetTrashResources:
         """
         Тест проверки сортировки элементов в корзине.
         """
-        response = api_client.get(
-            f"{api_client.base_url}/trash/resources", params={"path": "/", "limit": 10}
-        )
+        response = api_client.get_trash(path="/", limit=10)
 
         if response.status_code != 200:
             pytest.skip(f"Не удалось получить корзину: {response.status_code}")
@@ -249,10 +257,7 @@ class TestGetTrashResources:
         """
         large_limit = 1000
 
-        response = api_client.get(
-            f"{api_client.base_url}/trash/resources",
-            params={"path": "/", "limit": large_limit},
-        )
+        response = api_client.get_trash(path="/", limit=large_limit)
 
         assert response.status_code == 200, f"Ошибка: {response.text}"
 
@@ -263,27 +268,3 @@ class TestGetTrashResources:
 
         if "limit" in embedded:
             assert embedded["limit"] <= large_limit
-
-    def test_get_trash_empty_corner_cases(self, api_client):
-        """
-        Тест граничных случаев для пустой корзины.
-        """
-        api_client.delete(f"{api_client.base_url}/trash/resources")
-        time.sleep(2)
-
-        response = api_client.get(
-            f"{api_client.base_url}/trash/resources", params={"path": "/"}
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["type"] == "dir"
-        assert len(data["_embedded"]["items"]) == 0
-
-        response = api_client.get(
-            f"{api_client.base_url}/trash/resources", params={"path": "/", "limit": 0}
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data["_embedded"]["items"]) == 0